@@ -98,6 +98,7 @@ export default function CaseList({
               <TableHead>Type</TableHead>
               <TableHead>Status</TableHead>
               <TableHead>Assigned To</TableHead>
+              <TableHead className="w-[90px]">Events</TableHead>
               <TableHead className="w-[80px]">Complete</TableHead>
               <TableHead className="w-[100px]">Updated</TableHead>
             </TableRow>
@@ -126,6 +127,12 @@ export default function CaseList({
                     <span className="text-muted-foreground">Unassigned</span>
                   )}
                 </TableCell>
+                <TableCell>
+                  {c.event_count}
+                  <span className="ml-1 text-xs text-muted-foreground">
+                    / {c.file_total} files
+                  </span>
+                </TableCell>
                 <TableCell>
                   {(() => {
                     const score = getCompletenessScore(getCaseCompleteness(c));
@@ -8,7 +8,7 @@ import {
   SelectTrigger,
   SelectValue,
 } from "@/components/ui/select";
-import { useValidateMapping } from "@/hooks/useImport";
+import { useImportStatus, useValidateMapping } from "@/hooks/useImport";
 import type { ImportUploadResponse, ImportValidationResponse } from "@/types/import";
 
 interface ColumnMapperProps {
@@ -34,6 +34,17 @@ export default function ColumnMapper({
   onMappingComplete,
 }: ColumnMapperProps) {
   const validateMapping = useValidateMapping(caseId);
+  // Longer files are still being parsed in the background
+  const parseStatus = useImportStatus(
+    caseId,
+    uploadResponse.session_id,
+    uploadResponse.status === "parsing",
+  );
+  const parsePhase = parseStatus.data?.status ?? uploadResponse.status;
+  const rowCount =
+    parsePhase === "parsing"
+      ? null
+      : (parseStatus.data?.row_count ?? uploadResponse.row_count);
 
   // Initialize mappings: each header -> "__skip__"
   const [mappings, setMappings] = useState<Record<string, string>>(() => {
@@ -80,11 +91,21 @@ export default function ColumnMapper({
         <p className="text-sm">
           <span className="font-medium">{uploadResponse.filename}</span>
           {" -- "}
-          {uploadResponse.row_count} row
-          {uploadResponse.row_count !== 1 ? "s" : ""} detected
+          {rowCount === null
+            ? `reading rows... ${parseStatus.data?.row_count ?? 0} so far`
+            : `${rowCount} row${rowCount !== 1 ? "s" : ""} detected`}
         </p>
       </div>
 
+      {/* Error from the background parse */}
+      {parsePhase === "failed" && (
+        <div className="rounded-md border border-destructive/50 bg-destructive/5 px-4 py-3">
+          <p className="text-sm text-destructive">
+            {parseStatus.data?.error ?? "Failed to parse file"}
+          </p>
+        </div>
+      )}
+
       {/* Column mapping */}
       <div className="space-y-3">
         <h3 className="text-sm font-medium">Map Columns to Event Fields</h3>
@@ -197,7 +218,11 @@ export default function ColumnMapper({
       <div className="flex justify-end">
         <Button
           onClick={handleValidate}
-          disabled={!hasDateMapping || validateMapping.isPending}
+          disabled={
+            !hasDateMapping ||
+            validateMapping.isPending ||
+            parsePhase === "failed"
+          }
         >
           {validateMapping.isPending
             ? "Validating..."
@@ -24,7 +24,7 @@ export default function FileUpload({
         uploadFile.reset();
         return;
       }
-      uploadFile.mutate(file, {
+      uploadFile.mutate({ file }, {
         onSuccess: onUploadComplete,
       });
     },
@@ -73,7 +73,7 @@ export default function FileUpload({
             Drag and drop your file here, or click to browse
           </p>
           <p className="text-xs text-muted-foreground mt-1">
-            Supports .csv, .xlsx, and .xls files (max 10MB)
+            Supports .csv, .xlsx, and .xls files (max 1GB)
           </p>
         </div>
         <Button
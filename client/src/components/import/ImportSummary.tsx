@@ -1,21 +1,53 @@
+import { useState } from "react";
 import { CheckCircle2, XCircle, AlertTriangle } from "lucide-react";
 import { Button } from "@/components/ui/button";
+import { useImportRows } from "@/hooks/useImport";
 import type { ImportValidationResponse } from "@/types/import";
 
+const PAGE_SIZE = 100;
+
 interface ImportSummaryProps {
+  caseId: string;
   validationResponse: ImportValidationResponse;
   onConfirm: () => void;
   onBack: () => void;
   isConfirming: boolean;
+  insertedCount: number;
 }
 
 export default function ImportSummary({
+  caseId,
   validationResponse,
   onConfirm,
   onBack,
   isConfirming,
+  insertedCount,
 }: ImportSummaryProps) {
-  const { total_rows, valid_count, error_count, rows } = validationResponse;
+  const {
+    session_id,
+    total_rows,
+    valid_count,
+    error_count,
+    errors,
+    ambiguous_date_columns,
+  } = validationResponse;
+  const [errorsOnly, setErrorsOnly] = useState(error_count > 0);
+  const [offset, setOffset] = useState(0);
+  const { data: page } = useImportRows(
+    caseId,
+    session_id,
+    errorsOnly,
+    offset,
+    PAGE_SIZE,
+  );
+  // The validate response already holds the first errors
+  const rows = page?.items ?? (errorsOnly && offset === 0 ? errors : []);
+  const total = page?.total ?? (errorsOnly ? error_count : total_rows);
+
+  const showErrorsOnly = (value: boolean) => {
+    setErrorsOnly(value);
+    setOffset(0);
+  };
 
   return (
     <div className="space-y-6">
@@ -67,9 +99,31 @@ export default function ImportSummary({
         </div>
       )}
 
+      {/* Warning if date columns could be day-first or month-first */}
+      {ambiguous_date_columns.length > 0 && (
+        <div className="flex items-center gap-2 rounded-md border border-amber-500/50 bg-amber-500/5 px-4 py-3">
+          <AlertTriangle className="size-4 shrink-0 text-amber-600" />
+          <p className="text-sm text-amber-700">
+            Dates in {ambiguous_date_columns.join(", ")} read as both
+            month/day and day/month; they were read as month/day. Check the
+            dates below before importing.
+          </p>
+        </div>
+      )}
+
       {/* Row details */}
       <div className="space-y-2">
-        <h3 className="text-sm font-medium">Row Details</h3>
+        <div className="flex items-center justify-between">
+          <h3 className="text-sm font-medium">Row Details</h3>
+          <label className="flex items-center gap-2 text-xs text-muted-foreground">
+            <input
+              type="checkbox"
+              checked={errorsOnly}
+              onChange={(e) => showErrorsOnly(e.target.checked)}
+            />
+            Errors only
+          </label>
+        </div>
         <div className="max-h-[300px] overflow-y-auto rounded-md border">
           <table className="w-full text-sm">
             <thead className="sticky top-0">
@@ -122,6 +176,32 @@ export default function ImportSummary({
             </tbody>
           </table>
         </div>
+        {total > PAGE_SIZE && (
+          <div className="flex items-center justify-between">
+            <p className="text-xs text-muted-foreground">
+              Showing {offset + 1}-{Math.min(offset + PAGE_SIZE, total)} of{" "}
+              {total} rows
+            </p>
+            <div className="flex gap-2">
+              <Button
+                variant="outline"
+                size="sm"
+                disabled={offset === 0}
+                onClick={() => setOffset(Math.max(0, offset - PAGE_SIZE))}
+              >
+                Previous
+              </Button>
+              <Button
+                variant="outline"
+                size="sm"
+                disabled={offset + PAGE_SIZE >= total}
+                onClick={() => setOffset(offset + PAGE_SIZE)}
+              >
+                Next
+              </Button>
+            </div>
+          </div>
+        )}
       </div>
 
       {/* Actions */}
@@ -134,7 +214,7 @@ export default function ImportSummary({
           disabled={valid_count === 0 || isConfirming}
         >
           {isConfirming
-            ? "Importing..."
+            ? `Importing... ${insertedCount} of ${valid_count}`
             : `Import ${valid_count} Event${valid_count !== 1 ? "s" : ""}`}
         </Button>
       </div>
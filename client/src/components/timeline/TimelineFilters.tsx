@@ -0,0 +1,87 @@
+import { useState } from "react";
+import { Search, X } from "lucide-react";
+import { Button } from "@/components/ui/button";
+import { Input } from "@/components/ui/input";
+import EventTypeIcon from "./EventTypeIcon";
+import { hasEventFilters } from "@/hooks/useEvents";
+import type { EventFilters, TimelineEvent } from "@/types/event";
+
+const EVENT_TYPES = ["finding", "action", "note"] as const;
+
+interface TimelineFiltersProps {
+  filters: EventFilters;
+  onChange: (filters: EventFilters) => void;
+}
+
+export default function TimelineFilters({
+  filters,
+  onChange,
+}: TimelineFiltersProps) {
+  // The text query is applied on submit, not on every keystroke
+  const [query, setQuery] = useState(filters.q ?? "");
+
+  function handleSubmit(e: React.FormEvent) {
+    e.preventDefault();
+    onChange({ ...filters, q: query.trim() || undefined });
+  }
+
+  function toggleType(type: TimelineEvent["event_type"]) {
+    const current = filters.event_type ?? [];
+    const next = current.includes(type)
+      ? current.filter((t) => t !== type)
+      : [...current, type];
+    onChange({ ...filters, event_type: next.length ? next : undefined });
+  }
+
+  function handleClear() {
+    setQuery("");
+    onChange({});
+  }
+
+  return (
+    <form onSubmit={handleSubmit} className="flex flex-wrap items-center gap-2">
+      <div className="relative">
+        <Search className="absolute left-2 top-1/2 size-3.5 -translate-y-1/2 text-muted-foreground" />
+        <Input
+          value={query}
+          onChange={(e) => setQuery(e.target.value)}
+          placeholder="Search file names and descriptions..."
+          className="h-8 w-64 pl-7"
+        />
+      </div>
+      {EVENT_TYPES.map((type) => (
+        <button
+          key={type}
+          type="button"
+          onClick={() => toggleType(type)}
+          className={`rounded-full ring-offset-1 ${
+            filters.event_type?.includes(type) ? "ring-2 ring-ring" : "opacity-60"
+          }`}
+          title={`Only ${type}s`}
+        >
+          <EventTypeIcon type={type} />
+        </button>
+      ))}
+      <Input
+        type="date"
+        value={filters.from ?? ""}
+        onChange={(e) => onChange({ ...filters, from: e.target.value || undefined })}
+        className="h-8 w-36"
+        aria-label="From date"
+      />
+      <Input
+        type="date"
+        value={filters.to ?? ""}
+        onChange={(e) => onChange({ ...filters, to: e.target.value || undefined })}
+        className="h-8 w-36"
+        aria-label="To date"
+      />
+      {hasEventFilters(filters) && (
+        <Button type="button" size="sm" variant="ghost" onClick={handleClear}>
+          <X className="size-3.5 mr-1" />
+          Clear
+        </Button>
+      )}
+    </form>
+  );
+}
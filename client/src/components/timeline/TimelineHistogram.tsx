@@ -0,0 +1,92 @@
+import { useState } from "react";
+import { useEventHistogram } from "@/hooks/useEvents";
+import type {
+  EventFilters,
+  HistogramBucket,
+  TimelineEvent,
+} from "@/types/event";
+
+const BUCKETS: HistogramBucket[] = ["day", "week", "month"];
+
+// Stacked bottom to top, colored like EventTypeIcon
+const TYPE_COLORS: Record<TimelineEvent["event_type"], string> = {
+  finding: "bg-amber-400",
+  action: "bg-blue-400",
+  note: "bg-gray-300",
+};
+
+const CHART_HEIGHT_PX = 64;
+
+interface TimelineHistogramProps {
+  caseId: string;
+  filters?: EventFilters;
+}
+
+/** Event counts per day, week or month, split by type and counted in SQL. */
+export default function TimelineHistogram({
+  caseId,
+  filters = {},
+}: TimelineHistogramProps) {
+  const [bucket, setBucket] = useState<HistogramBucket>("week");
+  const { data } = useEventHistogram(caseId, bucket, filters, true);
+
+  // Rows come per (bucket, type); group them into one bar per bucket
+  const bars = new Map<string, Partial<Record<TimelineEvent["event_type"], number>>>();
+  for (const item of data?.items ?? []) {
+    const bar = bars.get(item.start) ?? {};
+    if (item.event_type) bar[item.event_type] = item.count;
+    bars.set(item.start, bar);
+  }
+  const totals = [...bars.values()].map((bar) =>
+    Object.values(bar).reduce((sum, n) => sum + (n ?? 0), 0)
+  );
+  const max = Math.max(1, ...totals);
+
+  if (bars.size === 0) return null;
+
+  return (
+    <div className="space-y-1">
+      <div className="flex items-center justify-end gap-1">
+        {BUCKETS.map((b) => (
+          <button
+            key={b}
+            type="button"
+            onClick={() => setBucket(b)}
+            className={`rounded px-2 py-0.5 text-xs ${
+              b === bucket
+                ? "bg-muted font-medium"
+                : "text-muted-foreground hover:bg-muted/50"
+            }`}
+          >
+            {b.charAt(0).toUpperCase() + b.slice(1)}
+          </button>
+        ))}
+      </div>
+      <div
+        className="flex items-end gap-px overflow-x-auto"
+        style={{ height: CHART_HEIGHT_PX }}
+      >
+        {[...bars.entries()].map(([start, bar], i) => (
+          <div
+            key={start}
+            className="flex min-w-1 flex-1 flex-col-reverse"
+            title={`${start}: ${totals[i]} event${totals[i] !== 1 ? "s" : ""}`}
+          >
+            {(Object.keys(TYPE_COLORS) as TimelineEvent["event_type"][]).map(
+              (type) => {
+                const count = bar[type];
+                return count ? (
+                  <div
+                    key={type}
+                    className={TYPE_COLORS[type]}
+                    style={{ height: (count / max) * CHART_HEIGHT_PX }}
+                  />
+                ) : null;
+              }
+            )}
+          </div>
+        ))}
+      </div>
+    </div>
+  );
+}
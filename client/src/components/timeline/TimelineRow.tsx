@@ -1,5 +1,5 @@
 import { useState, useEffect, useRef } from "react";
-import { Trash2 } from "lucide-react";
+import { ChevronDown, ChevronUp, Trash2 } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import EventTypeIcon from "./EventTypeIcon";
 import InlineField from "./InlineField";
@@ -15,6 +15,11 @@ interface TimelineRowProps {
   ) => void;
   onDelete: (eventId: string) => void;
   onCreateNew?: () => void;
+  selected?: boolean;
+  onSelect?: (eventId: string, selected: boolean) => void;
+  /** Set when a neighbour shares this event's date and time. */
+  onMoveUp?: () => void;
+  onMoveDown?: () => void;
   isUpdating?: boolean;
   isDeleting?: boolean;
   isLastRow?: boolean;
@@ -27,6 +32,10 @@ export default function TimelineRow({
   onFieldUpdate,
   onDelete,
   onCreateNew,
+  selected,
+  onSelect,
+  onMoveUp,
+  onMoveDown,
   isUpdating,
   isDeleting,
   isLastRow,
@@ -77,6 +86,19 @@ export default function TimelineRow({
         isUpdating ? "opacity-70" : ""
       }`}
     >
+      {/* Selection for bulk actions */}
+      {onSelect && (
+        <td className="px-3 py-2">
+          <input
+            type="checkbox"
+            checked={!!selected}
+            onChange={(e) => onSelect(event.id, e.target.checked)}
+            aria-label="Select event"
+            className="size-3.5 cursor-pointer"
+          />
+        </td>
+      )}
+
       {/* Event type - click to select */}
       <td className="px-3 py-2">
         {typeSelectOpen ? (
@@ -156,8 +178,33 @@ export default function TimelineRow({
         />
       </td>
 
-      {/* Delete with two-click confirmation */}
-      <td className="px-3 py-2">
+      {/* Reorder within the same date and time, then delete */}
+      <td className="px-3 py-2 whitespace-nowrap">
+        {(onMoveUp || onMoveDown) && (
+          <>
+            <Button
+              variant="ghost"
+              size="sm"
+              className="size-7 p-0 text-muted-foreground"
+              onClick={onMoveUp}
+              disabled={!onMoveUp}
+              title="Move up"
+            >
+              <ChevronUp className="size-3.5" />
+            </Button>
+            <Button
+              variant="ghost"
+              size="sm"
+              className="size-7 p-0 text-muted-foreground"
+              onClick={onMoveDown}
+              disabled={!onMoveDown}
+              title="Move down"
+            >
+              <ChevronDown className="size-3.5" />
+            </Button>
+          </>
+        )}
+        {/* Delete with two-click confirmation */}
         {confirmDelete ? (
           <Button
             variant="destructive"
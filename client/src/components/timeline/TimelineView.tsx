@@ -1,16 +1,31 @@
-import { useState, useRef, useCallback, useEffect } from "react";
+import { useState, useRef, useCallback, useEffect, useMemo } from "react";
 import { Link } from "react-router";
 import { Plus, Undo2, Upload } from "lucide-react";
 import { useQueryClient } from "@tanstack/react-query";
 import { Button } from "@/components/ui/button";
 import TimelineRow from "./TimelineRow";
+import TimelineFilters from "./TimelineFilters";
+import TimelineHistogram from "./TimelineHistogram";
 import {
   useEvents,
   useCreateEvent,
   useUpdateEvent,
   useDeleteEvent,
+  useBatchEvents,
+  useMoveEvent,
+  useEventSearch,
+  hasEventFilters,
+  adjustEventTotal,
+  applyEventChanges,
+  mapEventPages,
+  type EventPages,
 } from "@/hooks/useEvents";
-import type { TimelineEvent, EventListResponse } from "@/types/event";
+import { useTimelineStream } from "@/hooks/useTimelineStream";
+import type {
+  EventBatchOperation,
+  EventFilters,
+  TimelineEvent,
+} from "@/types/event";
 
 interface TimelineViewProps {
   caseId: string;
@@ -18,10 +33,42 @@ interface TimelineViewProps {
 
 export default function TimelineView({ caseId }: TimelineViewProps) {
   const queryClient = useQueryClient();
-  const { data, isLoading, error } = useEvents(caseId);
+  const {
+    data,
+    isLoading,
+    error,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useEvents(caseId);
+  const timelineEvents = useMemo(
+    () => data?.pages.flatMap((page) => page.items) ?? [],
+    [data]
+  );
+
+  // Filters switch the view to server-side search results, a page at a
+  // time; searchCursors holds the cursors of the pages before this one
+  const [filters, setFilters] = useState<EventFilters>({});
+  const [searchCursors, setSearchCursors] = useState<string[]>([]);
+  const searching = hasEventFilters(filters);
+  const search = useEventSearch(caseId, filters, searchCursors[searchCursors.length - 1]);
+
+  const events = searching ? search.data?.items ?? [] : timelineEvents;
+  const total = searching
+    ? search.data?.total
+    : data?.pages[0]?.total ?? timelineEvents.length;
   const createEvent = useCreateEvent(caseId);
   const updateEvent = useUpdateEvent(caseId);
   const deleteEvent = useDeleteEvent(caseId);
+  const batchEvents = useBatchEvents(caseId);
+  const moveEvent = useMoveEvent(caseId);
+  useTimelineStream(caseId);
+
+  // Events selected for bulk actions
+  const [selectedIds, setSelectedIds] = useState<Set<string>>(new Set());
+  const [bulkError, setBulkError] = useState<string | null>(null);
+  // Ignore selected events that have since been deleted
+  const selectedEvents = events.filter((e) => selectedIds.has(e.id));
 
   // Undo state
   const [deletedEvent, setDeletedEvent] = useState<TimelineEvent | null>(null);
@@ -36,6 +83,11 @@ export default function TimelineView({ caseId }: TimelineViewProps) {
     };
   }, []);
 
+  function handleFiltersChange(next: EventFilters) {
+    setFilters(next);
+    setSearchCursors([]);
+  }
+
   function handleAddEvent() {
     const today = new Date().toISOString().split("T")[0];
     createEvent.mutate({
@@ -55,10 +107,68 @@ export default function TimelineView({ caseId }: TimelineViewProps) {
     });
   }
 
+  /** Move handlers for an event; the server only reorders within a slot. */
+  function moveHandlers(index: number) {
+    const event = events[index];
+    const sameSlot = (other: TimelineEvent | undefined) =>
+      other !== undefined &&
+      other.event_date === event.event_date &&
+      other.event_time === event.event_time;
+    const prev = events[index - 1];
+    const next = events[index + 1];
+    return {
+      onMoveUp: sameSlot(prev)
+        ? () => moveEvent.mutate({ eventId: event.id, before_id: prev.id })
+        : undefined,
+      onMoveDown: sameSlot(next)
+        ? () => moveEvent.mutate({ eventId: event.id, after_id: next.id })
+        : undefined,
+    };
+  }
+
+  function handleSelect(eventId: string, selected: boolean) {
+    setSelectedIds((prev) => {
+      const next = new Set(prev);
+      if (selected) next.add(eventId);
+      else next.delete(eventId);
+      return next;
+    });
+  }
+
+  function handleSelectAll(selected: boolean) {
+    setSelectedIds(selected ? new Set(events.map((e) => e.id)) : new Set());
+  }
+
+  function runBulk(operations: EventBatchOperation[]) {
+    setBulkError(null);
+    batchEvents.mutate(
+      { operations },
+      {
+        onSuccess: () => setSelectedIds(new Set()),
+        onError: (err) => setBulkError(err.message),
+      }
+    );
+  }
+
+  function handleBulkType(eventType: TimelineEvent["event_type"]) {
+    runBulk(
+      selectedEvents.map((e): EventBatchOperation => ({
+        op: "update",
+        id: e.id,
+        data: { event_type: eventType },
+      }))
+    );
+  }
+
+  function handleBulkDelete() {
+    runBulk(
+      selectedEvents.map((e): EventBatchOperation => ({ op: "delete", id: e.id }))
+    );
+  }
+
   const handleDelete = useCallback(
     (eventId: string) => {
       // Find the event to store for undo
-      const events = data?.items ?? [];
       const eventToDelete = events.find((e) => e.id === eventId);
       if (!eventToDelete) return;
 
@@ -66,15 +176,14 @@ export default function TimelineView({ caseId }: TimelineViewProps) {
       setDeletedEvent(eventToDelete);
 
       // Optimistically remove from cache
-      queryClient.setQueryData<EventListResponse>(
+      queryClient.setQueryData<EventPages>(
         ["events", caseId],
         (old) => {
           if (!old) return old;
-          return {
-            ...old,
-            items: old.items.filter((e) => e.id !== eventId),
-            total: old.total - 1,
-          };
+          return adjustEventTotal(
+            mapEventPages(old, (items) => items.filter((e) => e.id !== eventId)),
+            -1
+          );
         }
       );
 
@@ -94,7 +203,7 @@ export default function TimelineView({ caseId }: TimelineViewProps) {
         undoTimerRef.current = null;
       }, 5000);
     },
-    [caseId, data, deleteEvent, queryClient]
+    [caseId, events, deleteEvent, queryClient]
   );
 
   const handleUndo = useCallback(() => {
@@ -107,24 +216,16 @@ export default function TimelineView({ caseId }: TimelineViewProps) {
     }
 
     // Restore event to cache
-    queryClient.setQueryData<EventListResponse>(
+    queryClient.setQueryData<EventPages>(
       ["events", caseId],
       (old) => {
-        if (!old) return old;
-        const restored = [...old.items, deletedEvent].sort((a, b) => {
-          const dateCompare = a.event_date.localeCompare(b.event_date);
-          if (dateCompare !== 0) return dateCompare;
-          const timeA = a.event_time ?? "";
-          const timeB = b.event_time ?? "";
-          const timeCompare = timeA.localeCompare(timeB);
-          if (timeCompare !== 0) return timeCompare;
-          return a.sort_order - b.sort_order;
+        if (!old?.pages.length) return old;
+        const restored = applyEventChanges(old, {
+          version: old.pages[0].version,
+          events: [deletedEvent],
+          deleted_ids: [],
         });
-        return {
-          ...old,
-          items: restored,
-          total: old.total + 1,
-        };
+        return adjustEventTotal(restored, 1);
       }
     );
 
@@ -147,14 +248,16 @@ export default function TimelineView({ caseId }: TimelineViewProps) {
     );
   }
 
-  const events = data?.items ?? [];
-
   return (
     <div className="space-y-4">
       {/* Header with add button */}
       <div className="flex items-center justify-between">
         <h3 className="text-sm font-medium text-muted-foreground">
-          {events.length} event{events.length !== 1 ? "s" : ""}
+          {searching
+            ? total != null
+              ? `${total} matching event${total !== 1 ? "s" : ""}`
+              : `Matching events, page ${searchCursors.length + 1}`
+            : `${total} event${total !== 1 ? "s" : ""}`}
         </h3>
         <div className="flex items-center gap-2">
           <Link to={`/cases/${caseId}/import`}>
@@ -174,11 +277,65 @@ export default function TimelineView({ caseId }: TimelineViewProps) {
         </div>
       </div>
 
+      <TimelineHistogram caseId={caseId} filters={filters} />
+      <TimelineFilters filters={filters} onChange={handleFiltersChange} />
+
+      {searching && search.isLoading && (
+        <div className="text-sm text-muted-foreground">Searching...</div>
+      )}
+      {searching && search.error && (
+        <p className="text-sm text-destructive">{search.error.message}</p>
+      )}
+
+      {/* Bulk actions for the selected events, applied in one request */}
+      {selectedEvents.length > 0 && (
+        <div className="flex items-center gap-2 rounded-md border bg-muted px-4 py-2">
+          <span className="text-sm text-muted-foreground">
+            {selectedEvents.length} selected
+          </span>
+          <select
+            value=""
+            onChange={(e) =>
+              handleBulkType(e.target.value as TimelineEvent["event_type"])
+            }
+            disabled={batchEvents.isPending}
+            className="h-7 rounded border border-input bg-background px-1 text-xs outline-none ring-ring focus:ring-1"
+          >
+            <option value="" disabled>
+              Set type...
+            </option>
+            <option value="finding">Finding</option>
+            <option value="action">Action</option>
+            <option value="note">Note</option>
+          </select>
+          <Button
+            size="sm"
+            variant="destructive"
+            onClick={handleBulkDelete}
+            disabled={batchEvents.isPending}
+          >
+            Delete selected
+          </Button>
+          <Button
+            size="sm"
+            variant="ghost"
+            onClick={() => setSelectedIds(new Set())}
+          >
+            Clear
+          </Button>
+          {bulkError && (
+            <span className="text-sm text-destructive">{bulkError}</span>
+          )}
+        </div>
+      )}
+
       {/* Empty state */}
-      {events.length === 0 && !deletedEvent && (
+      {events.length === 0 && !deletedEvent && !(searching && search.isLoading) && (
         <div className="flex flex-col items-center justify-center rounded-lg border border-dashed py-12">
           <p className="text-muted-foreground">
-            No events yet. Add the first event to start building the timeline.
+            {searching
+              ? "No events match these filters."
+              : "No events yet. Add the first event to start building the timeline."}
           </p>
         </div>
       )}
@@ -189,6 +346,18 @@ export default function TimelineView({ caseId }: TimelineViewProps) {
           <table className="w-full">
             <thead>
               <tr className="border-b bg-muted/50">
+                <th className="px-3 py-2 text-left w-8">
+                  <input
+                    type="checkbox"
+                    checked={
+                      events.length > 0 &&
+                      events.every((e) => selectedIds.has(e.id))
+                    }
+                    onChange={(e) => handleSelectAll(e.target.checked)}
+                    aria-label="Select all loaded events"
+                    className="size-3.5 cursor-pointer"
+                  />
+                </th>
                 <th className="px-3 py-2 text-left text-xs font-medium text-muted-foreground w-10">
                   Type
                 </th>
@@ -219,6 +388,9 @@ export default function TimelineView({ caseId }: TimelineViewProps) {
                   onFieldUpdate={handleFieldUpdate}
                   onDelete={handleDelete}
                   onCreateNew={handleAddEvent}
+                  selected={selectedIds.has(event.id)}
+                  onSelect={handleSelect}
+                  {...moveHandlers(index)}
                   isUpdating={updateEvent.isPending}
                   isDeleting={deleteEvent.isPending}
                   isLastRow={index === events.length - 1}
@@ -229,6 +401,48 @@ export default function TimelineView({ caseId }: TimelineViewProps) {
         </div>
       )}
 
+      {/* Later pages load on demand */}
+      {!searching && hasNextPage && (
+        <div className="flex items-center justify-center gap-3">
+          <span className="text-xs text-muted-foreground">
+            Showing {events.length} of {total}
+          </span>
+          <Button
+            size="sm"
+            variant="outline"
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+          >
+            {isFetchingNextPage ? "Loading..." : "Load more"}
+          </Button>
+        </div>
+      )}
+
+      {/* Search results page with cursors */}
+      {searching && (searchCursors.length > 0 || search.data?.next_cursor) && (
+        <div className="flex items-center justify-end gap-2">
+          <Button
+            variant="outline"
+            size="sm"
+            disabled={searchCursors.length === 0}
+            onClick={() => setSearchCursors(searchCursors.slice(0, -1))}
+          >
+            Previous
+          </Button>
+          <Button
+            variant="outline"
+            size="sm"
+            disabled={!search.data?.next_cursor}
+            onClick={() => {
+              const next = search.data?.next_cursor;
+              if (next) setSearchCursors([...searchCursors, next]);
+            }}
+          >
+            Next
+          </Button>
+        </div>
+      )}
+
       {/* Undo banner */}
       {deletedEvent && (
         <div className="flex items-center justify-between rounded-md border bg-muted px-4 py-2">
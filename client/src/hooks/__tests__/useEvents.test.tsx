@@ -5,7 +5,14 @@ import type { ReactNode } from "react";
 import { http, HttpResponse } from "msw";
 import { server } from "@/test/mocks/server";
 import { mockEvent, mockEventListResponse } from "@/test/mocks/data";
-import { useEvents, useUpdateEvent, useDeleteEvent } from "../useEvents";
+import {
+  applyEventChanges,
+  useEvents,
+  useEventsWithBatches,
+  useUpdateEvent,
+  useDeleteEvent,
+  type EventPages,
+} from "../useEvents";
 
 function createWrapper() {
   const queryClient = new QueryClient({
@@ -31,10 +38,86 @@ describe("useEvents", () => {
 
     await waitFor(() => expect(result.current.isSuccess).toBe(true));
 
-    expect(result.current.data?.items).toHaveLength(2);
-    expect(result.current.data?.items[0].event_type).toBe("finding");
+    expect(result.current.data?.pages[0].items).toHaveLength(2);
+    expect(result.current.data?.pages[0].items[0].event_type).toBe("finding");
+    expect(result.current.hasNextPage).toBe(false);
   });
 
+  it("fetches later pages with the previous page's cursor", async () => {
+    server.use(
+      http.get("/api/cases/:caseId/events", ({ request }) => {
+        const cursor = new URL(request.url).searchParams.get("cursor");
+        return HttpResponse.json(
+          cursor === "page-2"
+            ? mockEventListResponse([mockEvent({ id: "event-2" })], {
+                total: null,
+                counts_by_type: null,
+              })
+            : mockEventListResponse([mockEvent()], {
+                total: 2,
+                next_cursor: "page-2",
+              })
+        );
+      })
+    );
+
+    const { result } = renderHook(() => useEvents("case-1"), {
+      wrapper: createWrapper(),
+    });
+
+    await waitFor(() => expect(result.current.isSuccess).toBe(true));
+    expect(result.current.data?.pages).toHaveLength(1);
+    expect(result.current.hasNextPage).toBe(true);
+
+    await result.current.fetchNextPage();
+    await waitFor(() => expect(result.current.data?.pages).toHaveLength(2));
+    expect(
+      result.current.data?.pages.flatMap((page) => page.items.map((e) => e.id))
+    ).toEqual(["event-1", "event-2"]);
+    expect(result.current.data?.pages[0].total).toBe(2);
+  });
+});
+
+describe("applyEventChanges", () => {
+  const pages = (nextCursor: string | null): EventPages => ({
+    pages: [
+      mockEventListResponse(
+        [
+          mockEvent({ id: "a", event_date: "2025-01-10" }),
+          mockEvent({ id: "b", event_date: "2025-01-20" }),
+        ],
+        { next_cursor: nextCursor, version: 3 }
+      ),
+    ],
+    pageParams: [null],
+  });
+
+  it("places changes within the loaded pages", () => {
+    const result = applyEventChanges(pages("more"), {
+      version: 4,
+      events: [
+        mockEvent({ id: "c", event_date: "2025-01-15" }),
+        mockEvent({ id: "d", event_date: "2025-02-01" }),
+      ],
+      deleted_ids: ["a"],
+    });
+
+    // "d" sorts after the loaded pages; fetchNextPage will bring it
+    expect(result.pages[0].items.map((e) => e.id)).toEqual(["c", "b"]);
+    expect(result.pages[0].version).toBe(4);
+  });
+
+  it("appends to the last page at the end of the timeline", () => {
+    const result = applyEventChanges(pages(null), {
+      version: 4,
+      events: [mockEvent({ id: "d", event_date: "2025-02-01" })],
+      deleted_ids: [],
+    });
+
+    expect(result.pages[0].items.map((e) => e.id)).toEqual(["a", "b", "d"]);
+  });
+});
+
   it("is disabled when caseId is empty", () => {
     const { result } = renderHook(() => useEvents(""), {
       wrapper: createWrapper(),
@@ -44,6 +127,39 @@ describe("useEvents", () => {
   });
 });
 
+describe("useEventsWithBatches", () => {
+  it("keeps the first page's version when concatenating pages", async () => {
+    server.use(
+      http.get("/api/cases/:caseId/events", ({ request }) => {
+        const cursor = new URL(request.url).searchParams.get("cursor");
+        return HttpResponse.json(
+          cursor
+            ? mockEventListResponse([mockEvent({ id: "event-2" })], {
+                version: 7,
+              })
+            : mockEventListResponse([mockEvent()], {
+                next_cursor: "page-2",
+                version: 5,
+              })
+        );
+      })
+    );
+
+    const { result } = renderHook(() => useEventsWithBatches("case-1"), {
+      wrapper: createWrapper(),
+    });
+
+    await waitFor(() => expect(result.current.isSuccess).toBe(true));
+
+    expect(result.current.data?.items.map((e) => e.id)).toEqual([
+      "event-1",
+      "event-2",
+    ]);
+    expect(result.current.data?.version).toBe(5);
+    expect(result.current.data?.next_cursor).toBeNull();
+  });
+});
+
 describe("useUpdateEvent", () => {
   it("updates an event with optimistic update", async () => {
     const wrapper = createWrapper();
@@ -54,7 +170,10 @@ describe("useUpdateEvent", () => {
         mutations: { retry: false },
       },
     });
-    qc.setQueryData(["events", "case-1"], mockEventListResponse());
+    qc.setQueryData<EventPages>(["events", "case-1"], {
+      pages: [mockEventListResponse()],
+      pageParams: [null],
+    });
 
     function Wrapper({ children }: { children: ReactNode }) {
       return (
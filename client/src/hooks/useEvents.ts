@@ -1,29 +1,270 @@
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import {
+  useQuery,
+  useInfiniteQuery,
+  useMutation,
+  useQueryClient,
+  type InfiniteData,
+  type QueryClient,
+} from "@tanstack/react-query";
 import { api } from "@/lib/api";
 import type {
   TimelineEvent,
   EventListResponse,
   CreateEventRequest,
   UpdateEventRequest,
+  EventBatchRequest,
+  EventBatchResponse,
+  EventChangesResponse,
+  EventFilters,
+  EventHistogramResponse,
+  HistogramBucket,
+  MoveEventRequest,
 } from "@/types/event";
 
+const EVENTS_PAGE_SIZE = 500;
+
+/** Events per page of the timeline view. */
+const TIMELINE_PAGE_SIZE = 200;
+
+/** The cached timeline: the pages loaded so far, keyed by their cursor. */
+export type EventPages = InfiniteData<EventListResponse, string | null>;
+
+async function fetchAllEvents(
+  caseId: string,
+  include?: "batches"
+): Promise<EventListResponse> {
+  let url = `/api/cases/${caseId}/events?limit=${EVENTS_PAGE_SIZE}`;
+  if (include) url += `&include=${include}`;
+  const first = await api.get<EventListResponse>(url);
+  const items = [...first.items];
+  let page = first;
+  while (page.next_cursor) {
+    page = await api.get<EventListResponse>(
+      `${url}&cursor=${encodeURIComponent(page.next_cursor)}`
+    );
+    items.push(...page.items);
+  }
+  // The first page's version predates every page, so /changes replays
+  // anything written while the later pages were being fetched
+  return { ...first, items, next_cursor: null };
+}
+
+/** Same ordering as the server's timeline_order(). */
+function compareTimeline(a: TimelineEvent, b: TimelineEvent): number {
+  if (a.event_date !== b.event_date) return a.event_date < b.event_date ? -1 : 1;
+  if (a.event_time !== b.event_time) {
+    if (a.event_time === null) return 1;
+    if (b.event_time === null) return -1;
+    return a.event_time < b.event_time ? -1 : 1;
+  }
+  if (a.sort_order !== b.sort_order) return a.sort_order - b.sort_order;
+  return a.id < b.id ? -1 : a.id > b.id ? 1 : 0;
+}
+
+/**
+ * Merge changes into the loaded pages. A changed event goes into the
+ * first page ending after it; one sorting after every loaded page is
+ * left for fetchNextPage unless the last page is the end of the
+ * timeline. Counts are left alone; see refreshTimelineCounts.
+ */
+export function applyEventChanges(
+  data: EventPages,
+  changes: EventChangesResponse
+): EventPages {
+  const changedIds = new Set(changes.events.map((e) => e.id));
+  const deletedIds = new Set(changes.deleted_ids);
+  const pages = data.pages.map((page) => ({
+    ...page,
+    items: page.items.filter(
+      (e) => !changedIds.has(e.id) && !deletedIds.has(e.id)
+    ),
+  }));
+  const complete = data.pages[data.pages.length - 1]?.next_cursor == null;
+  for (const event of changes.events) {
+    let index = pages.findIndex((page) => {
+      const last = page.items[page.items.length - 1];
+      return last !== undefined && compareTimeline(event, last) <= 0;
+    });
+    if (index === -1 && complete) index = pages.length - 1;
+    if (index !== -1) pages[index].items.push(event);
+  }
+  for (const page of pages) page.items.sort(compareTimeline);
+  if (pages.length) pages[0] = { ...pages[0], version: changes.version };
+  return { ...data, pages };
+}
+
+/** Apply a function to every loaded event, e.g. for optimistic updates. */
+export function mapEventPages(
+  data: EventPages,
+  fn: (items: TimelineEvent[]) => TimelineEvent[]
+): EventPages {
+  return {
+    ...data,
+    pages: data.pages.map((page) => ({ ...page, items: fn(page.items) })),
+  };
+}
+
+/** Adjust the first page's total, e.g. for an optimistic delete. */
+export function adjustEventTotal(data: EventPages, delta: number): EventPages {
+  const [first, ...rest] = data.pages;
+  if (!first || first.total === null) return data;
+  return {
+    ...data,
+    pages: [{ ...first, total: first.total + delta }, ...rest],
+  };
+}
+
+/**
+ * Re-read the timeline's total and per-type counts. Changes may touch
+ * events that aren't loaded, so they can't be counted client-side; the
+ * first page of one event carries the counts at the cost of one query.
+ */
+async function refreshTimelineCounts(
+  queryClient: QueryClient,
+  caseId: string
+): Promise<void> {
+  const { total, counts_by_type } = await api.get<EventListResponse>(
+    `/api/cases/${caseId}/events?limit=1`
+  );
+  queryClient.setQueryData<EventPages>(["events", caseId], (old) => {
+    if (!old?.pages.length) return old;
+    const [first, ...rest] = old.pages;
+    return { ...old, pages: [{ ...first, total, counts_by_type }, ...rest] };
+  });
+}
+
+/**
+ * Patch the loaded timeline pages with changes since the first page's
+ * version instead of refetching them; falls back to a full refetch if
+ * the delta fails.
+ */
+export async function syncEventChanges(
+  queryClient: QueryClient,
+  caseId: string
+): Promise<void> {
+  const cached = queryClient.getQueryData<EventPages>(["events", caseId]);
+  if (!cached?.pages.length) return;
+  try {
+    const changes = await api.get<EventChangesResponse>(
+      `/api/cases/${caseId}/events/changes?since=${cached.pages[0].version}`
+    );
+    queryClient.setQueryData<EventPages>(["events", caseId], (old) =>
+      old ? applyEventChanges(old, changes) : old
+    );
+    if (changes.events.length || changes.deleted_ids.length) {
+      queryClient.invalidateQueries({ queryKey: ["events", caseId, "search"] });
+      queryClient.invalidateQueries({
+        queryKey: ["events", caseId, "histogram"],
+      });
+      queryClient.invalidateQueries({
+        queryKey: ["events", caseId, "with-batches"],
+      });
+      await refreshTimelineCounts(queryClient, caseId);
+    }
+  } catch {
+    await queryClient.invalidateQueries({ queryKey: ["events", caseId] });
+  }
+}
+
+/**
+ * The case timeline, a page at a time; call fetchNextPage for more.
+ * The first page carries the total and per-type counts.
+ */
 export function useEvents(caseId: string) {
-  return useQuery({
+  return useInfiniteQuery({
     queryKey: ["events", caseId],
-    queryFn: () =>
-      api.get<EventListResponse>(`/api/cases/${caseId}/events`),
+    queryFn: ({ pageParam }) => {
+      let url = `/api/cases/${caseId}/events?limit=${TIMELINE_PAGE_SIZE}`;
+      if (pageParam) url += `&cursor=${encodeURIComponent(pageParam)}`;
+      return api.get<EventListResponse>(url);
+    },
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
+    enabled: !!caseId,
+    staleTime: 30000,
+  });
+}
+
+/** The full timeline with every event's file batches embedded. */
+export function useEventsWithBatches(caseId: string) {
+  return useQuery({
+    queryKey: ["events", caseId, "with-batches"],
+    queryFn: () => fetchAllEvents(caseId, "batches"),
     enabled: !!caseId,
     staleTime: 30000,
   });
 }
 
+function filterParams(filters: EventFilters): URLSearchParams {
+  const params = new URLSearchParams();
+  for (const [key, value] of Object.entries(filters)) {
+    if (Array.isArray(value)) {
+      for (const v of value) params.append(key, v);
+    } else if (value) {
+      params.set(key, value);
+    }
+  }
+  return params;
+}
+
+/** Whether any filter is set, i.e. a view needs a server-side search. */
+export function hasEventFilters(filters: EventFilters): boolean {
+  return Object.values(filters).some((value) =>
+    Array.isArray(value) ? value.length > 0 : !!value
+  );
+}
+
+/**
+ * One page of a server-side filtered timeline; pass next_cursor for
+ * more. Disabled without filters, where the plain timeline applies.
+ */
+export function useEventSearch(
+  caseId: string,
+  filters: EventFilters,
+  cursor?: string
+) {
+  return useQuery({
+    queryKey: ["events", caseId, "search", filters, cursor ?? null],
+    queryFn: () => {
+      const params = filterParams(filters);
+      params.set("limit", String(EVENTS_PAGE_SIZE));
+      if (cursor) params.set("cursor", cursor);
+      return api.get<EventListResponse>(
+        `/api/cases/${caseId}/events?${params.toString()}`
+      );
+    },
+    enabled: !!caseId && hasEventFilters(filters),
+  });
+}
+
+/** Event counts per day, week or month, counted server-side. */
+export function useEventHistogram(
+  caseId: string,
+  bucket: HistogramBucket,
+  filters: EventFilters = {},
+  byType = false
+) {
+  return useQuery({
+    queryKey: ["events", caseId, "histogram", bucket, byType, filters],
+    queryFn: () => {
+      const params = filterParams(filters);
+      params.set("bucket", bucket);
+      if (byType) params.set("by", "type");
+      return api.get<EventHistogramResponse>(
+        `/api/cases/${caseId}/events/histogram?${params.toString()}`
+      );
+    },
+    enabled: !!caseId,
+  });
+}
+
 export function useCreateEvent(caseId: string) {
   const queryClient = useQueryClient();
   return useMutation({
     mutationFn: (body: CreateEventRequest) =>
       api.post<TimelineEvent>(`/api/cases/${caseId}/events`, body),
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ["events", caseId] });
+      return syncEventChanges(queryClient, caseId);
     },
   });
 }
@@ -38,22 +279,21 @@ export function useUpdateEvent(caseId: string) {
       await queryClient.cancelQueries({ queryKey: ["events", caseId] });
 
       // Snapshot previous value for rollback
-      const previous = queryClient.getQueryData<EventListResponse>([
+      const previous = queryClient.getQueryData<EventPages>([
         "events",
         caseId,
       ]);
 
       // Optimistically update the cache
-      queryClient.setQueryData<EventListResponse>(
+      queryClient.setQueryData<EventPages>(
         ["events", caseId],
         (old) => {
           if (!old) return old;
-          return {
-            ...old,
-            items: old.items.map((e) =>
-              e.id === newData.id ? { ...e, ...newData } : e
-            ),
-          };
+          return mapEventPages(old, (items) =>
+            items.map((e) =>
+              e.id === newData.id ? { ...e, ...newData } as TimelineEvent : e
+            )
+          );
         }
       );
 
@@ -66,8 +306,8 @@ export function useUpdateEvent(caseId: string) {
       }
     },
     onSettled: () => {
-      // Refetch to ensure cache is in sync with server
-      queryClient.invalidateQueries({ queryKey: ["events", caseId] });
+      // Pull the server's version of the change into the cache
+      return syncEventChanges(queryClient, caseId);
     },
   });
 }
@@ -78,7 +318,32 @@ export function useDeleteEvent(caseId: string) {
     mutationFn: (id: string) =>
       api.delete<void>(`/api/cases/${caseId}/events/${id}`),
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ["events", caseId] });
+      return syncEventChanges(queryClient, caseId);
+    },
+  });
+}
+
+export function useBatchEvents(caseId: string) {
+  const queryClient = useQueryClient();
+  return useMutation({
+    mutationFn: (body: EventBatchRequest) =>
+      api.post<EventBatchResponse>(`/api/cases/${caseId}/events:batch`, body),
+    onSuccess: () => {
+      return syncEventChanges(queryClient, caseId);
+    },
+  });
+}
+
+export function useMoveEvent(caseId: string) {
+  const queryClient = useQueryClient();
+  return useMutation({
+    mutationFn: ({ eventId, ...body }: { eventId: string } & MoveEventRequest) =>
+      api.post<TimelineEvent>(
+        `/api/cases/${caseId}/events/${eventId}/move`,
+        body,
+      ),
+    onSuccess: () => {
+      return syncEventChanges(queryClient, caseId);
     },
   });
 }
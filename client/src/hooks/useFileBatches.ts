@@ -4,7 +4,9 @@ import type {
   FileBatch,
   CreateFileBatchRequest,
   UpdateFileBatchRequest,
+  ReplaceFileBatchItem,
 } from "@/types/file-batch";
+import { syncEventChanges } from "@/hooks/useEvents";
 
 export function useFileBatches(caseId: string, eventId: string) {
   return useQuery({
@@ -29,7 +31,7 @@ export function useCreateFileBatch(caseId: string, eventId: string) {
       queryClient.invalidateQueries({
         queryKey: ["file-batches", caseId, eventId],
       });
-      queryClient.invalidateQueries({ queryKey: ["events", caseId] });
+      return syncEventChanges(queryClient, caseId);
     },
   });
 }
@@ -46,7 +48,23 @@ export function useUpdateFileBatch(caseId: string, eventId: string) {
       queryClient.invalidateQueries({
         queryKey: ["file-batches", caseId, eventId],
       });
-      queryClient.invalidateQueries({ queryKey: ["events", caseId] });
+      return syncEventChanges(queryClient, caseId);
+    },
+  });
+}
+
+/** Replace the event's whole batch list; order sets sort_order. */
+export function useReplaceFileBatches(caseId: string, eventId: string) {
+  const queryClient = useQueryClient();
+  return useMutation({
+    mutationFn: (batches: ReplaceFileBatchItem[]) =>
+      api.put<FileBatch[]>(
+        `/api/cases/${caseId}/events/${eventId}/batches`,
+        { batches }
+      ),
+    onSuccess: (batches) => {
+      queryClient.setQueryData(["file-batches", caseId, eventId], batches);
+      return syncEventChanges(queryClient, caseId);
     },
   });
 }
@@ -62,7 +80,7 @@ export function useDeleteFileBatch(caseId: string, eventId: string) {
       queryClient.invalidateQueries({
         queryKey: ["file-batches", caseId, eventId],
       });
-      queryClient.invalidateQueries({ queryKey: ["events", caseId] });
+      return syncEventChanges(queryClient, caseId);
     },
   });
 }
@@ -1,20 +1,90 @@
-import { useMutation, useQueryClient } from "@tanstack/react-query";
+import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 import { api } from "@/lib/api";
 import type {
+  ChunkedUploadResponse,
   ImportUploadResponse,
   ColumnMappingRequest,
   ImportValidationResponse,
   ImportConfirmRequest,
   ImportConfirmResponse,
+  ImportRowsPage,
+  ImportStatusResponse,
 } from "@/types/import";
 
+// Files above this size are sent as resumable chunks
+const CHUNKED_UPLOAD_THRESHOLD = 16 * 1024 * 1024;
+const CHUNK_ATTEMPTS = 3;
+
+async function sha256Hex(data: ArrayBuffer): Promise<string> {
+  const digest = await crypto.subtle.digest("SHA-256", data);
+  return Array.from(new Uint8Array(digest))
+    .map((b) => b.toString(16).padStart(2, "0"))
+    .join("");
+}
+
+async function uploadInChunks(
+  caseId: string,
+  file: File,
+  sheet?: string,
+): Promise<ImportUploadResponse> {
+  const base = `/api/cases/${caseId}/imports/uploads`;
+  // Retrying the same file resumes its upload where it stopped
+  const resumeKey = `import-upload:${caseId}:${file.name}:${file.size}:${file.lastModified}`;
+  const previousId = sessionStorage.getItem(resumeKey);
+  let upload: ChunkedUploadResponse | null = null;
+  if (previousId) {
+    upload = await api
+      .get<ChunkedUploadResponse>(`${base}/${previousId}`)
+      .catch(() => null);
+  }
+  if (!upload) {
+    upload = await api.post<ChunkedUploadResponse>(base, {
+      filename: file.name,
+      size: file.size,
+    });
+    sessionStorage.setItem(resumeKey, upload.upload_id);
+  }
+
+  const received = new Set(upload.received_chunks);
+  for (let index = 0; index < upload.chunk_count; index++) {
+    if (received.has(index)) continue;
+    const start = index * upload.chunk_size;
+    const chunk = await file.slice(start, start + upload.chunk_size).arrayBuffer();
+    const checksum = await sha256Hex(chunk);
+    for (let attempt = 1; ; attempt++) {
+      try {
+        await api.putBytes(`${base}/${upload.upload_id}/chunks/${index}`, chunk, {
+          "X-Chunk-SHA256": checksum,
+        });
+        break;
+      } catch (error) {
+        if (attempt === CHUNK_ATTEMPTS) throw error;
+      }
+    }
+  }
+
+  const response = await api.post<ImportUploadResponse>(
+    `${base}/${upload.upload_id}/complete${
+      sheet ? `?sheet=${encodeURIComponent(sheet)}` : ""
+    }`,
+    {},
+  );
+  sessionStorage.removeItem(resumeKey);
+  return response;
+}
+
 export function useUploadFile(caseId: string) {
   return useMutation({
-    mutationFn: (file: File) =>
-      api.upload<ImportUploadResponse>(
-        `/api/cases/${caseId}/imports/upload`,
-        file,
-      ),
+    mutationFn: ({ file, sheet }: { file: File; sheet?: string }) =>
+      // crypto.subtle only exists in secure contexts (HTTPS or localhost)
+      file.size > CHUNKED_UPLOAD_THRESHOLD && crypto.subtle
+        ? uploadInChunks(caseId, file, sheet)
+        : api.upload<ImportUploadResponse>(
+            `/api/cases/${caseId}/imports/upload${
+              sheet ? `?sheet=${encodeURIComponent(sheet)}` : ""
+            }`,
+            file,
+          ),
   });
 }
 
@@ -41,3 +111,47 @@ export function useConfirmImport(caseId: string) {
     },
   });
 }
+
+export function useImportStatus(
+  caseId: string,
+  sessionId: string | undefined,
+  enabled: boolean,
+) {
+  return useQuery({
+    queryKey: ["imports", caseId, sessionId, "status"],
+    queryFn: () =>
+      api.get<ImportStatusResponse>(
+        `/api/cases/${caseId}/imports/${sessionId}`,
+      ),
+    enabled: enabled && !!sessionId,
+    // Poll while the upload is parsed or a long confirm runs; the session
+    // is gone once confirm finishes
+    refetchInterval: (query) => {
+      const phase = query.state.data?.status;
+      return phase === "uploaded" || phase === "failed" ? false : 1000;
+    },
+    retry: false,
+  });
+}
+
+export function useImportRows(
+  caseId: string,
+  sessionId: string,
+  errorsOnly: boolean,
+  offset: number,
+  limit: number,
+) {
+  return useQuery({
+    queryKey: ["imports", caseId, sessionId, "rows", { errorsOnly, offset, limit }],
+    queryFn: () => {
+      const params = new URLSearchParams({
+        errors_only: String(errorsOnly),
+        offset: String(offset),
+        limit: String(limit),
+      });
+      return api.get<ImportRowsPage>(
+        `/api/cases/${caseId}/imports/${sessionId}/rows?${params}`,
+      );
+    },
+  });
+}
@@ -0,0 +1,71 @@
+import { useEffect } from "react";
+import { useQueryClient } from "@tanstack/react-query";
+import { syncEventChanges } from "@/hooks/useEvents";
+
+const RECONNECT_DELAY_MS = 5000;
+
+/**
+ * Subscribe to a case's server-sent change stream and apply each change
+ * to the cached timeline. Uses fetch rather than EventSource because the
+ * API authenticates with a bearer header.
+ */
+export function useTimelineStream(caseId: string) {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    if (!caseId) return;
+    const controller = new AbortController();
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+
+    function handleMessage(event: string) {
+      if (event === "change" || event === "version") {
+        void syncEventChanges(queryClient, caseId);
+        queryClient.invalidateQueries({ queryKey: ["cases", caseId] });
+      } else if (event === "deleted") {
+        // The case is gone; stop instead of reconnecting
+        controller.abort();
+        queryClient.invalidateQueries({ queryKey: ["cases"] });
+      }
+    }
+
+    async function connect() {
+      try {
+        const token = localStorage.getItem("token");
+        const response = await fetch(`/api/cases/${caseId}/events/stream`, {
+          headers: token ? { Authorization: `Bearer ${token}` } : {},
+          signal: controller.signal,
+        });
+        if (!response.ok || !response.body) throw new Error("stream failed");
+
+        const reader = response.body
+          .pipeThrough(new TextDecoderStream())
+          .getReader();
+        let buffer = "";
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+          buffer += value;
+          let end: number;
+          while ((end = buffer.indexOf("\n\n")) !== -1) {
+            const block = buffer.slice(0, end);
+            buffer = buffer.slice(end + 2);
+            const match = /^event: (.+)$/m.exec(block);
+            if (match) handleMessage(match[1]);
+          }
+        }
+      } catch {
+        if (controller.signal.aborted) return;
+      }
+      // Stream ended or failed: reconnect, then catch up via the version message
+      if (!controller.signal.aborted) {
+        retryTimer = setTimeout(connect, RECONNECT_DELAY_MS);
+      }
+    }
+
+    void connect();
+    return () => {
+      controller.abort();
+      clearTimeout(retryTimer);
+    };
+  }, [caseId, queryClient]);
+}
@@ -87,6 +87,18 @@ export const api = {
     });
   },
 
+  putBytes<T>(
+    url: string,
+    body: ArrayBuffer,
+    headers: Record<string, string> = {},
+  ): Promise<T> {
+    return request<T>(url, {
+      method: "PUT",
+      headers: { "Content-Type": "application/octet-stream", ...headers },
+      body,
+    });
+  },
+
   upload<T>(url: string, file: File, fieldName: string = "file"): Promise<T> {
     const formData = new FormData();
     formData.append(fieldName, file);
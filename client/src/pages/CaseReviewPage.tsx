@@ -11,7 +11,7 @@ import {
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
 import { useCase } from "@/hooks/useCases";
-import { useEvents } from "@/hooks/useEvents";
+import { useEventsWithBatches } from "@/hooks/useEvents";
 import {
   getCaseCompleteness,
   getEventCompleteness,
@@ -98,7 +98,7 @@ function CollapsibleSection({
 export default function CaseReviewPage() {
   const { id } = useParams<{ id: string }>();
   const { data: case_, isLoading: caseLoading, error: caseError } = useCase(id ?? "");
-  const { data: eventsData, isLoading: eventsLoading } = useEvents(id ?? "");
+  const { data: eventsData, isLoading: eventsLoading } = useEventsWithBatches(id ?? "");
 
   if (caseLoading || eventsLoading) {
     return (
@@ -140,7 +140,7 @@ export default function CaseReviewPage() {
 
     // Check file batch completeness
     const batchFields: FieldStatus[] = [];
-    for (const batch of event.file_batches) {
+    for (const batch of event.file_batches ?? []) {
       batchFields.push(...getFileBatchCompleteness(batch));
     }
     const batchScore = batchFields.length > 0
@@ -154,7 +154,7 @@ export default function CaseReviewPage() {
       score,
       batchFields,
       batchScore,
-      hasBatches: event.file_batches.length > 0,
+      hasBatches: event.batch_count > 0,
     };
   });
 
@@ -281,7 +281,7 @@ export default function CaseReviewPage() {
                       </div>
                     ) : (
                       <div className="space-y-1">
-                        {result.event.file_batches.map((batch) => {
+                        {(result.event.file_batches ?? []).map((batch) => {
                           const batchFields = getFileBatchCompleteness(batch);
                           const batchMissing = batchFields.filter((f) => !f.filled);
                           return (
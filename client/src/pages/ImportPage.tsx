@@ -5,7 +5,7 @@ import { Button } from "@/components/ui/button";
 import FileUpload from "@/components/import/FileUpload";
 import ColumnMapper from "@/components/import/ColumnMapper";
 import ImportSummary from "@/components/import/ImportSummary";
-import { useConfirmImport } from "@/hooks/useImport";
+import { useConfirmImport, useImportStatus } from "@/hooks/useImport";
 import type {
   ImportUploadResponse,
   ImportValidationResponse,
@@ -26,6 +26,11 @@ export default function ImportPage() {
     useState<ImportValidationResponse | null>(null);
   const [confirmResult, setConfirmResult] =
     useState<ImportConfirmResponse | null>(null);
+  const importStatus = useImportStatus(
+    caseId ?? "",
+    validationResponse?.session_id,
+    confirmImport.isPending,
+  );
 
   function handleUploadComplete(response: ImportUploadResponse) {
     setUploadResponse(response);
@@ -142,10 +147,12 @@ export default function ImportPage() {
 
       {step === "review" && validationResponse && (
         <ImportSummary
+          caseId={caseId}
           validationResponse={validationResponse}
           onConfirm={handleConfirm}
           onBack={handleBackToMapping}
           isConfirming={confirmImport.isPending}
+          insertedCount={importStatus.data?.inserted_count ?? 0}
         />
       )}
 
@@ -162,6 +169,16 @@ export default function ImportPage() {
                 {confirmResult.created_count}
               </span>{" "}
               event{confirmResult.created_count !== 1 ? "s" : ""}.
+              {(confirmResult.updated_count > 0 ||
+                confirmResult.unchanged_count > 0) && (
+                <>
+                  {" "}
+                  {confirmResult.updated_count} previously imported event
+                  {confirmResult.updated_count !== 1 ? "s" : ""} updated,{" "}
+                  {confirmResult.unchanged_count} unchanged row
+                  {confirmResult.unchanged_count !== 1 ? "s" : ""} skipped.
+                </>
+              )}
               {confirmResult.error_count > 0 && (
                 <>
                   {" "}
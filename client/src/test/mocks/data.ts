@@ -63,6 +63,14 @@ export function mockCase(overrides?: Partial<Case>): Case {
     assigned_to: mockUser(),
     created_by_id: "user-1",
     created_by: mockUser(),
+    event_count: 0,
+    finding_count: 0,
+    action_count: 0,
+    note_count: 0,
+    batch_count: 0,
+    file_total: 0,
+    first_event_date: null,
+    last_event_date: null,
     created_at: "2025-01-01T00:00:00Z",
     updated_at: "2025-01-02T00:00:00Z",
     ...overrides,
@@ -84,7 +92,9 @@ export function mockEvent(overrides?: Partial<TimelineEvent>): TimelineEvent {
     sort_order: 0,
     created_by_id: "user-1",
     created_by: mockUser(),
-    file_batches: [],
+    file_batches: null,
+    batch_count: 0,
+    batch_file_total: 0,
     created_at: "2025-01-15T10:30:00Z",
     updated_at: "2025-01-15T10:30:00Z",
     ...overrides,
@@ -125,9 +135,16 @@ export function mockEventListResponse(
   overrides?: Partial<EventListResponse>
 ): EventListResponse {
   const items = events ?? [mockEvent(), mockEvent({ id: "event-2", event_date: "2025-01-16", sort_order: 1 })];
+  const counts_by_type: Record<string, number> = {};
+  for (const e of items) {
+    counts_by_type[e.event_type] = (counts_by_type[e.event_type] ?? 0) + 1;
+  }
   return {
     items,
     total: items.length,
+    counts_by_type,
+    next_cursor: null,
+    version: 0,
     ...overrides,
   };
 }
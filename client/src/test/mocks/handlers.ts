@@ -64,6 +64,10 @@ export const handlers = [
     return HttpResponse.json(mockEventListResponse());
   }),
 
+  http.get("/api/cases/:caseId/events/changes", () => {
+    return HttpResponse.json({ version: 0, events: [], deleted_ids: [] });
+  }),
+
   http.post("/api/cases/:caseId/events", async ({ params, request }) => {
     const body = (await request.json()) as Record<string, unknown>;
     return HttpResponse.json(
@@ -41,6 +41,15 @@ export interface Case {
   assigned_to: UserInfo | null;
   created_by_id: string;
   created_by: UserInfo | null;
+  /** Timeline rollups maintained by the server. */
+  event_count: number;
+  finding_count: number;
+  action_count: number;
+  note_count: number;
+  batch_count: number;
+  file_total: number;
+  first_event_date: string | null;
+  last_event_date: string | null;
   created_at: string;
   updated_at: string;
 }
@@ -15,7 +15,10 @@ export interface TimelineEvent {
   sort_order: number;
   created_by_id: string;
   created_by: UserInfo | null;
-  file_batches: FileBatch[];
+  /** Only present when fetched with include=batches. */
+  file_batches: FileBatch[] | null;
+  batch_count: number;
+  batch_file_total: number;
   created_at: string;
   updated_at: string;
 }
@@ -44,5 +47,55 @@ export interface UpdateEventRequest {
 
 export interface EventListResponse {
   items: TimelineEvent[];
-  total: number;
+  /** Only on the first page; null on pages fetched with a cursor. */
+  total: number | null;
+  counts_by_type: Record<string, number> | null;
+  next_cursor: string | null;
+  version: number;
+}
+
+export interface EventFilters {
+  from?: string;
+  to?: string;
+  event_type?: TimelineEvent["event_type"][];
+  file_type?: string;
+  q?: string;
+}
+
+export type HistogramBucket = "day" | "week" | "month";
+
+export interface EventHistogramBucket {
+  start: string;
+  event_type: TimelineEvent["event_type"] | null;
+  count: number;
+}
+
+export interface EventHistogramResponse {
+  bucket: HistogramBucket;
+  items: EventHistogramBucket[];
+}
+
+export interface EventChangesResponse {
+  version: number;
+  events: TimelineEvent[];
+  deleted_ids: string[];
+}
+
+export type MoveEventRequest =
+  | { after_id: string; before_id?: never }
+  | { before_id: string; after_id?: never };
+
+export type EventBatchOperation =
+  | { op: "create"; data: CreateEventRequest }
+  | { op: "update"; id: string; data: UpdateEventRequest }
+  | { op: "delete"; id: string };
+
+export interface EventBatchRequest {
+  operations: EventBatchOperation[];
+}
+
+export interface EventBatchResponse {
+  created: TimelineEvent[];
+  updated: TimelineEvent[];
+  deleted: string[];
 }
@@ -18,6 +18,15 @@ export interface CreateFileBatchRequest {
   sort_order?: number;
 }
 
+export interface ReplaceFileBatchItem {
+  /** Omit to create a new batch. */
+  id?: string;
+  label: string;
+  file_count: number;
+  description?: string | null;
+  file_types?: string | null;
+}
+
 export interface UpdateFileBatchRequest {
   label?: string;
   file_count?: number;
@@ -1,9 +1,20 @@
 export interface ImportUploadResponse {
   session_id: string;
   filename: string;
+  status: "parsing" | "uploaded";
   headers: string[];
-  row_count: number;
+  row_count: number | null;
   preview_rows: (string | number | null)[][];
+  sheet_names: string[];
+}
+
+export interface ChunkedUploadResponse {
+  upload_id: string;
+  filename: string;
+  size: number;
+  chunk_size: number;
+  chunk_count: number;
+  received_chunks: number[];
 }
 
 export interface ColumnMappingRequest {
@@ -23,7 +34,16 @@ export interface ImportValidationResponse {
   total_rows: number;
   valid_count: number;
   error_count: number;
-  rows: ImportValidationRow[];
+  errors: ImportValidationRow[];
+  date_formats: Record<string, string>;
+  ambiguous_date_columns: string[];
+}
+
+export interface ImportRowsPage {
+  items: ImportValidationRow[];
+  total: number;
+  offset: number;
+  limit: number;
 }
 
 export interface ImportConfirmRequest {
@@ -32,6 +52,24 @@ export interface ImportConfirmRequest {
 
 export interface ImportConfirmResponse {
   created_count: number;
+  updated_count: number;
+  unchanged_count: number;
   error_count: number;
   errors: string[];
 }
+
+export interface ImportStatusResponse {
+  session_id: string;
+  filename: string;
+  status:
+    | "receiving"
+    | "parsing"
+    | "failed"
+    | "uploaded"
+    | "validated"
+    | "confirming";
+  row_count: number;
+  error: string | null;
+  valid_count: number | null;
+  inserted_count: number;
+}
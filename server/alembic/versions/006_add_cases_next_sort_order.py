@@ -0,0 +1,42 @@
+"""add per-case event sort_order counter
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, Sequence[str], None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add cases.next_sort_order and seed it from existing events."""
+    op.add_column(
+        "cases",
+        sa.Column(
+            "next_sort_order", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+    op.execute(
+        """
+        UPDATE cases
+        SET next_sort_order = COALESCE(
+            (SELECT MAX(sort_order) + 1 FROM events WHERE events.case_id = cases.id),
+            0
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop cases.next_sort_order."""
+    op.drop_column("cases", "next_sort_order")
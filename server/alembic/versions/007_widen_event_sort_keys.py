@@ -0,0 +1,66 @@
+"""widen event sort keys and space them out
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, Sequence[str], None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match src.services.event_ordering.SORT_KEY_GAP
+SORT_KEY_GAP = 1024
+
+
+def upgrade() -> None:
+    """Make sort keys BIGINT and respace existing keys SORT_KEY_GAP apart."""
+    op.alter_column(
+        "events", "sort_order", type_=sa.BigInteger(), existing_nullable=False
+    )
+    op.alter_column(
+        "cases", "next_sort_order", type_=sa.BigInteger(), existing_nullable=False
+    )
+    op.execute(f"UPDATE events SET sort_order = sort_order * {SORT_KEY_GAP}")
+    op.execute(
+        f"UPDATE cases SET next_sort_order = next_sort_order * {SORT_KEY_GAP}"
+    )
+
+
+def downgrade() -> None:
+    """Renumber keys densely per case and narrow them back to INTEGER."""
+    op.execute(
+        """
+        UPDATE events SET sort_order = ranked.position
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY case_id ORDER BY sort_order, id
+            ) - 1 AS position
+            FROM events
+        ) AS ranked
+        WHERE events.id = ranked.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE cases
+        SET next_sort_order = COALESCE(
+            (SELECT MAX(sort_order) + 1 FROM events WHERE events.case_id = cases.id),
+            0
+        )
+        """
+    )
+    op.alter_column(
+        "cases", "next_sort_order", type_=sa.Integer(), existing_nullable=False
+    )
+    op.alter_column(
+        "events", "sort_order", type_=sa.Integer(), existing_nullable=False
+    )
@@ -0,0 +1,52 @@
+"""add covering case timeline index on events
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, Sequence[str], None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace ix_events_case_id with an index in timeline order.
+
+    The new index has case_id as its leading column, so it also serves
+    every lookup the old single-column index did. It is built
+    concurrently so event writes aren't blocked on large tables.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_case_timeline",
+            "events",
+            ["case_id", "event_date", "event_time", "sort_order", "id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_events_case_id", table_name="events", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Restore ix_events_case_id and drop the timeline index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_case_id",
+            "events",
+            ["case_id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_events_case_timeline",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
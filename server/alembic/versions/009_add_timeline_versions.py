@@ -0,0 +1,67 @@
+"""add timeline versions and event tombstones
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, Sequence[str], None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add version counters and the event_tombstones table."""
+    op.add_column(
+        "cases",
+        sa.Column(
+            "timeline_version", sa.BigInteger(), nullable=False, server_default="0"
+        ),
+    )
+    op.add_column(
+        "events",
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_events_case_version", "events", ["case_id", "version"])
+    op.create_table(
+        "event_tombstones",
+        sa.Column("event_id", sa.Uuid(), nullable=False),
+        sa.Column("case_id", sa.Uuid(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("event_id"),
+        sa.ForeignKeyConstraint(
+            ["case_id"],
+            ["cases.id"],
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index(
+        "ix_event_tombstones_case_version",
+        "event_tombstones",
+        ["case_id", "version"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the event_tombstones table and version counters."""
+    op.drop_index(
+        "ix_event_tombstones_case_version", table_name="event_tombstones"
+    )
+    op.drop_table("event_tombstones")
+    op.drop_index("ix_events_case_version", table_name="events")
+    op.drop_column("events", "version")
+    op.drop_column("cases", "timeline_version")
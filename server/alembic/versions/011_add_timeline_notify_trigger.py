@@ -0,0 +1,62 @@
+"""notify listeners of case and timeline changes
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, Sequence[str], None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Send pg_notify on 'timeline_changes' when a case or its timeline changes.
+
+    Every event and file batch write bumps cases.timeline_version, so a
+    trigger on cases alone covers the whole timeline. Notifications are
+    delivered on commit.
+    """
+    op.execute(
+        """
+        CREATE FUNCTION notify_timeline_change() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify(
+                    'timeline_changes',
+                    json_build_object('case_id', OLD.id, 'deleted', true)::text
+                );
+            ELSIF NEW.timeline_version IS DISTINCT FROM OLD.timeline_version
+                OR NEW.updated_at IS DISTINCT FROM OLD.updated_at THEN
+                PERFORM pg_notify(
+                    'timeline_changes',
+                    json_build_object(
+                        'case_id', NEW.id, 'version', NEW.timeline_version
+                    )::text
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cases_notify_timeline_change
+        AFTER UPDATE OR DELETE ON cases
+        FOR EACH ROW EXECUTE FUNCTION notify_timeline_change()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the notify trigger and its function."""
+    op.execute("DROP TRIGGER cases_notify_timeline_change ON cases")
+    op.execute("DROP FUNCTION notify_timeline_change()")
@@ -0,0 +1,42 @@
+"""add substring search index on events
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, Sequence[str], None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create a trigram GIN index over the lowercased searchable text.
+
+    Searches match words as substrings (``LIKE '%word%'``), which only a
+    trigram index can serve. The expression must match
+    src.models.event.TimelineSearch exactly for the planner to use it.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY ix_events_search ON events
+            USING gin (lower(
+                coalesce(file_name, '') || ' ' || coalesce(file_description, '')
+            ) gin_trgm_ops)
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop the search index; pg_trgm is left installed."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY ix_events_search")
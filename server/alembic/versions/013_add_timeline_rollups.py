@@ -0,0 +1,99 @@
+"""add event and case timeline rollups
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, Sequence[str], None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CASE_COUNT_COLUMNS = (
+    "event_count",
+    "finding_count",
+    "action_count",
+    "note_count",
+    "batch_count",
+)
+
+
+def upgrade() -> None:
+    """Add rollup columns and backfill them from existing rows."""
+    op.add_column(
+        "events",
+        sa.Column("batch_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "events",
+        sa.Column(
+            "batch_file_total", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+    for name in CASE_COUNT_COLUMNS:
+        op.add_column(
+            "cases",
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0"),
+        )
+    op.add_column(
+        "cases",
+        sa.Column("file_total", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.add_column("cases", sa.Column("first_event_date", sa.Date(), nullable=True))
+    op.add_column("cases", sa.Column("last_event_date", sa.Date(), nullable=True))
+
+    # Events first: the case file total includes their batch totals
+    op.execute(
+        """
+        UPDATE events SET batch_count = b.batch_count,
+                          batch_file_total = b.file_total
+        FROM (
+            SELECT event_id, count(*) AS batch_count, sum(file_count) AS file_total
+            FROM file_batches GROUP BY event_id
+        ) AS b
+        WHERE events.id = b.event_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE cases SET event_count = e.event_count,
+                         finding_count = e.finding_count,
+                         action_count = e.action_count,
+                         note_count = e.note_count,
+                         batch_count = e.batch_count,
+                         file_total = e.file_total,
+                         first_event_date = e.first_event_date,
+                         last_event_date = e.last_event_date
+        FROM (
+            SELECT case_id,
+                   count(*) AS event_count,
+                   count(*) FILTER (WHERE event_type = 'finding') AS finding_count,
+                   count(*) FILTER (WHERE event_type = 'action') AS action_count,
+                   count(*) FILTER (WHERE event_type = 'note') AS note_count,
+                   sum(batch_count) AS batch_count,
+                   sum(coalesce(file_count, 0) + batch_file_total) AS file_total,
+                   min(event_date) AS first_event_date,
+                   max(event_date) AS last_event_date
+            FROM events GROUP BY case_id
+        ) AS e
+        WHERE cases.id = e.case_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the rollup columns."""
+    for name in ("last_event_date", "first_event_date", "file_total"):
+        op.drop_column("cases", name)
+    for name in reversed(CASE_COUNT_COLUMNS):
+        op.drop_column("cases", name)
+    op.drop_column("events", "batch_file_total")
+    op.drop_column("events", "batch_count")
@@ -0,0 +1,53 @@
+"""add import fingerprints to events
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: Union[str, Sequence[str], None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add nullable fingerprint columns and a unique per-source key index.
+
+    Existing events have no fingerprints (NULL keys don't conflict), so
+    they are never matched by a re-import. The index is built
+    concurrently so event writes aren't blocked on large tables.
+    """
+    op.add_column(
+        "events", sa.Column("import_source", sa.String(255), nullable=True)
+    )
+    op.add_column("events", sa.Column("import_key", sa.String(32), nullable=True))
+    op.add_column("events", sa.Column("import_hash", sa.String(32), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_case_import_key",
+            "events",
+            ["case_id", "import_source", "import_key"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the key index and fingerprint columns."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_events_case_import_key",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("events", "import_hash")
+    op.drop_column("events", "import_key")
+    op.drop_column("events", "import_source")
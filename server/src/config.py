@@ -9,6 +9,19 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 480
     LOGIN_RATE_LIMIT: int = 10
     LOGIN_RATE_WINDOW_SECONDS: int = 60
+    # Import staging; defaults to a directory in the system temp dir
+    IMPORT_STAGING_DIR: str = ""
+    IMPORT_STAGING_MAX_BYTES: int = 2 * 1024 * 1024 * 1024
+    IMPORT_SESSION_TTL_SECONDS: int = 3600
+    IMPORT_MAX_UPLOAD_BYTES: int = 1024 * 1024 * 1024
+    # Part size of chunked (resumable) uploads
+    IMPORT_UPLOAD_CHUNK_BYTES: int = 8 * 1024 * 1024
+    IMPORT_MAX_ROWS: int = 1_000_000
+    # How long validate/confirm wait for an upload's background parse
+    IMPORT_PARSE_WAIT_SECONDS: float = 30
+    # Validation worker processes; 0 validates on a thread instead
+    IMPORT_WORKERS: int = 2
+    IMPORT_MAX_CONCURRENT_PER_USER: int = 2
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -0,0 +1,54 @@
+"""Conditional GET support with weak ETags.
+
+A route computes an ETag from a cheap fingerprint (a version counter,
+or a row count and latest ``updated_at`` aggregated in SQL) and calls
+``check_not_modified`` before loading anything heavy. A matching
+``If-None-Match`` short-circuits the route with 304; otherwise the
+``conditional_get`` middleware stamps the ETag and cache headers onto
+the response.
+"""
+
+import hashlib
+
+from fastapi import HTTPException, Request, Response, status
+
+# Cacheable, but every use must be revalidated with the server
+CACHE_CONTROL = "private, no-cache"
+
+
+def weak_etag(*parts: object) -> str:
+    """Build a weak ETag from the parts of a fingerprint."""
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against an ETag."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def check_not_modified(request: Request, etag: str) -> None:
+    """Record the response ETag, raising 304 if the client already has it."""
+    request.state.etag = etag
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+        )
+
+
+async def conditional_get(request: Request, call_next) -> Response:
+    """Add ETag and Cache-Control headers to responses of ETag-aware routes."""
+    response = await call_next(request)
+    etag = getattr(request.state, "etag", None)
+    if etag is not None and response.status_code == status.HTTP_200_OK:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Response
 
 from src.config import settings
+from src.http_cache import conditional_get
 from src.routers.audit_types import router as audit_types_router
 from src.routers.auth import router as auth_router
 from src.routers.cases import router as cases_router
@@ -13,6 +14,8 @@ from src.routers.imports import router as imports_router
 from src.routers.jira import router as jira_router
 from src.routers.reports import router as reports_router
 from src.routers.users import router as users_router
+from src.services.import_workers import shutdown_pool
+from src.services.timeline_notifier import broadcaster
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,8 @@ async def lifespan(app: FastAPI):
             "Generate one with: python -c 'import secrets; print(secrets.token_urlsafe(64))'"
         )
     yield
+    await broadcaster.close()
+    shutdown_pool()
 
 
 app = FastAPI(title="AuditTrail", root_path="/api", lifespan=lifespan)
@@ -41,6 +46,9 @@ async def security_headers(request: Request, call_next) -> Response:
     return response
 
 
+app.middleware("http")(conditional_get)
+
+
 app.include_router(auth_router)
 app.include_router(audit_types_router)
 app.include_router(cases_router)
@@ -1,8 +1,9 @@
 from src.models.audit_type import AuditType
 from src.models.case import Case
 from src.models.event import Event
+from src.models.event_tombstone import EventTombstone
 from src.models.file_batch import FileBatch
 from src.models.jira_field_mapping import JiraFieldMapping
 from src.models.user import User
 
-__all__ = ["AuditType", "Case", "Event", "FileBatch", "JiraFieldMapping", "User"]
+__all__ = ["AuditType", "Case", "Event", "EventTombstone", "FileBatch", "JiraFieldMapping", "User"]
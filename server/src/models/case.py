@@ -1,7 +1,17 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -35,6 +45,23 @@ class Case(Base):
     created_by_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="RESTRICT"), nullable=False
     )
+    # Next free event sort_order, see services.event_ordering
+    next_sort_order: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+    # Bumped by every timeline write, see services.timeline_versions
+    timeline_version: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+    # Timeline totals, see services.timeline_rollups
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    finding_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    action_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    note_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    batch_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    file_total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    first_event_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    last_event_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -43,10 +70,12 @@ class Case(Base):
     )
 
     # Relationships
-    audit_type = relationship("AuditType", lazy="selectin")
+    # Never loaded implicitly: each query states what it needs via loader
+    # options so reads don't fan out into hidden queries.
+    audit_type = relationship("AuditType", lazy="raise")
     assigned_to = relationship(
-        "User", foreign_keys=[assigned_to_id], lazy="selectin"
+        "User", foreign_keys=[assigned_to_id], lazy="raise"
     )
     created_by = relationship(
-        "User", foreign_keys=[created_by_id], lazy="selectin"
+        "User", foreign_keys=[created_by_id], lazy="raise"
     )
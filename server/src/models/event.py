@@ -1,18 +1,70 @@
 import uuid
 from datetime import date, datetime, time
 
-from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, String, Text, Time, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Time,
+    bindparam,
+    func,
+    inspect,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
 
 from src.database import Base
 
+# Text searched by the timeline ``q`` filter, lowercased for matching
+# substrings of it with a trigram index. It must stay literal SQL (no
+# bind parameters) for queries to match the expression index.
+SEARCH_DOCUMENT = (
+    "lower(coalesce({file_name}, '') || ' ' || coalesce({file_description}, ''))"
+)
+
 
 class Event(Base):
     __tablename__ = "events"
     __table_args__ = (
-        Index("ix_events_case_id", "case_id"),
+        # Matches timeline_order() so per-case reads are index-ordered scans
+        Index(
+            "ix_events_case_timeline",
+            "case_id",
+            "event_date",
+            "event_time",
+            "sort_order",
+            "id",
+        ),
         Index("ix_events_event_date", "event_date"),
+        Index("ix_events_case_version", "case_id", "version"),
+        # Re-imports match rows by key, see services.import_upsert
+        Index(
+            "ix_events_case_import_key",
+            "case_id",
+            "import_source",
+            "import_key",
+            unique=True,
+        ),
+        Index(
+            "ix_events_search",
+            text(
+                SEARCH_DOCUMENT.format(
+                    file_name="file_name", file_description="file_description"
+                )
+                + " gin_trgm_ops"
+            ),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
@@ -31,7 +83,18 @@ class Event(Base):
     metadata_: Mapped[dict] = mapped_column(
         "metadata", JSONB, nullable=False, default=dict
     )
-    sort_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sort_order: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # Case timeline_version of the last write to this event or its batches
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # File batch totals, see services.timeline_rollups
+    batch_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    batch_file_total: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    # Source row fingerprints of imported events, see services.import_upsert
+    import_source: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    import_key: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    import_hash: Mapped[str | None] = mapped_column(String(32), nullable=True)
     created_by_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="RESTRICT"), nullable=False
     )
@@ -42,13 +105,77 @@ class Event(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    # Relationships
-    case = relationship("Case", lazy="selectin")
-    created_by = relationship("User", lazy="selectin")
+    # Relationships (loaded explicitly per query, see Case)
+    case = relationship("Case", lazy="raise")
+    created_by = relationship("User", lazy="raise")
     file_batches = relationship(
         "FileBatch",
         back_populates="event",
-        lazy="selectin",
+        lazy="raise",
         order_by="FileBatch.sort_order",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    @property
+    def loaded_file_batches(self) -> list | None:
+        """The event's file batches if they were loaded with it, else None."""
+        if "file_batches" in inspect(self).unloaded:
+            return None
+        return self.file_batches
+
+
+def timeline_order() -> tuple:
+    """Return the ORDER BY clauses for a case timeline.
+
+    Every timeline read must use this ordering to be served by
+    ``ix_events_case_timeline``; Postgres btree indexes sort NULLs last in
+    ascending order, so ``event_time NULLS LAST`` needs no extra sort.
+    """
+    return (
+        Event.event_date.asc(),
+        Event.event_time.asc().nulls_last(),
+        Event.sort_order.asc(),
+        Event.id.asc(),
+    )
+
+
+def _like_pattern(term: str) -> str:
+    """A LIKE pattern matching ``term`` anywhere, wildcards escaped."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class TimelineSearch(ColumnElement):
+    """Match every word of a query anywhere in an event's name or description.
+
+    Words match case-insensitively as substrings, so ``report`` finds
+    ``report_final.xlsx`` and ``docs/q3`` finds paths containing it.
+    Compiles to ``LIKE`` on the expression indexed by ``ix_events_search``,
+    which a trigram index serves for words of three characters or more.
+    """
+
+    type = Boolean()
+    inherit_cache = True
+    _traverse_internals = [("terms", InternalTraversal.dp_clauseelement_list)]
+
+    def __init__(self, query: str) -> None:
+        self.terms = [
+            bindparam("search_term", _like_pattern(word), unique=True)
+            for word in query.split()
+        ]
+
+
+@compiles(TimelineSearch)
+def _compile_timeline_search(element, compiler, **kw):
+    if not element.terms:
+        return "1 = 1"
+    document = SEARCH_DOCUMENT.format(
+        file_name=compiler.process(Event.file_name, **kw),
+        file_description=compiler.process(Event.file_description, **kw),
+    )
+    matches = " AND ".join(
+        f"{document} LIKE lower({compiler.process(term, **kw)}) ESCAPE '\\'"
+        for term in element.terms
     )
+    return f"({matches})"
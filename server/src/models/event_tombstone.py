@@ -0,0 +1,26 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+
+
+class EventTombstone(Base):
+    """Record of a deleted event, so change feeds can report the deletion."""
+
+    __tablename__ = "event_tombstones"
+    __table_args__ = (
+        Index("ix_event_tombstones_case_version", "case_id", "version"),
+    )
+
+    # Not a foreign key: the event row is gone
+    event_id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    case_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("cases.id", ondelete="CASCADE"), nullable=False
+    )
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
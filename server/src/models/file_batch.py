@@ -27,4 +27,4 @@ class FileBatch(Base):
     )
 
     # Relationships
-    event = relationship("Event", back_populates="file_batches", lazy="selectin")
+    event = relationship("Event", back_populates="file_batches", lazy="raise")
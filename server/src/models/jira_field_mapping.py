@@ -30,4 +30,4 @@ class JiraFieldMapping(Base):
     )
 
     # Relationship
-    audit_type = relationship("AuditType", lazy="selectin")
+    audit_type = relationship("AuditType", lazy="raise")
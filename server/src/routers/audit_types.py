@@ -1,10 +1,11 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.deps import get_current_user, get_db
+from src.http_cache import check_not_modified, weak_etag
 from src.models.audit_type import AuditType
 from src.models.user import User
 from src.schemas.audit_type import AuditTypeList, AuditTypeRead
@@ -14,10 +15,19 @@ router = APIRouter(prefix="/audit-types", tags=["audit-types"])
 
 @router.get("/", response_model=AuditTypeList)
 async def list_audit_types(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> AuditTypeList:
     """List all active audit types."""
+    # Deactivation also bumps updated_at, so count + max catches all edits
+    result = await db.execute(
+        select(func.count(), func.max(AuditType.updated_at)).where(
+            AuditType.is_active == True  # noqa: E712
+        )
+    )
+    check_not_modified(request, weak_etag("audit-types", *result.one()))
+
     result = await db.execute(
         select(AuditType)
         .where(AuditType.is_active == True)  # noqa: E712
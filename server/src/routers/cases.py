@@ -1,12 +1,13 @@
 import uuid
 
 import jsonschema
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from src.deps import get_current_user, get_db
+from src.http_cache import check_not_modified, weak_etag
 from src.models.audit_type import AuditType
 from src.models.case import Case
 from src.models.user import User
@@ -146,17 +147,38 @@ async def list_cases(
 @router.get("/{case_id}", response_model=CaseRead)
 async def get_case(
     case_id: uuid.UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> CaseRead:
     """Get a single case by ID."""
-    result = await db.execute(_case_query().where(Case.id == case_id))
-    case = result.scalar_one_or_none()
-    if case is None:
+    # The case and its embedded audit type and users are fingerprinted by
+    # updated_at; the timeline rollups change with the timeline version
+    creator = aliased(User)
+    assignee = aliased(User)
+    result = await db.execute(
+        select(
+            Case.updated_at,
+            Case.timeline_version,
+            AuditType.updated_at,
+            creator.updated_at,
+            assignee.updated_at,
+        )
+        .join(AuditType, AuditType.id == Case.audit_type_id)
+        .join(creator, creator.id == Case.created_by_id)
+        .outerjoin(assignee, assignee.id == Case.assigned_to_id)
+        .where(Case.id == case_id)
+    )
+    fingerprint = result.one_or_none()
+    if fingerprint is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Case not found",
         )
+    check_not_modified(request, weak_etag("case", case_id, *fingerprint))
+
+    result = await db.execute(_case_query().where(Case.id == case_id))
+    case = result.scalar_one()
     return CaseRead.model_validate(case)
 
 
@@ -1,42 +1,184 @@
+import asyncio
+import base64
+import binascii
+import json
 import uuid
+from datetime import date, time
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, delete, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.deps import get_current_user, get_db
+from src.http_cache import check_not_modified, weak_etag
 from src.models.case import Case
-from src.models.event import Event
+from src.models.event import Event, TimelineSearch, timeline_order
+from src.models.event_tombstone import EventTombstone
 from src.models.user import User
-from src.schemas.event import EventCreate, EventListResponse, EventRead, EventUpdate
+from src.schemas.event import (
+    EventBatchCreate,
+    EventBatchDelete,
+    EventBatchRequest,
+    EventBatchResponse,
+    EventBatchUpdate,
+    EventChangesResponse,
+    EventCreate,
+    EventHistogramBucket,
+    EventHistogramResponse,
+    EventListResponse,
+    EventMove,
+    EventRead,
+    EventUpdate,
+)
+from src.services.event_ordering import move_event, reserve_sort_orders
+from src.services.timeline_notifier import broadcaster
+from src.services.timeline_rollups import (
+    CASE_ROLLUP_FIELDS,
+    ROLLUP_INPUTS,
+    RollupInputs,
+    apply_case_rollup_delta,
+)
+from src.services.timeline_stats import HistogramBucket, event_histogram
+from src.services.timeline_versions import (
+    bump_timeline_version_or_404,
+    record_deletions,
+)
 
 router = APIRouter(prefix="/cases/{case_id}/events", tags=["events"])
 
 VALID_EVENT_TYPES = {"finding", "action", "note"}
 
+# Columns an update may omit but not set to null
+NOT_NULL_UPDATE_FIELDS = ("event_type", "event_date")
+
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+
+# Expansions accepted by the ``include`` parameter of event reads
+EventInclude = Literal["batches"]
+
+# Comment lines keep idle streams open through proxies
+STREAM_KEEPALIVE_SECONDS = 15
+
 
 async def _verify_case_exists(
     case_id: uuid.UUID, db: AsyncSession
-) -> Case:
-    """Fetch a case or raise 404."""
-    result = await db.execute(select(Case).where(Case.id == case_id))
-    case = result.scalar_one_or_none()
-    if case is None:
+) -> None:
+    """Raise 404 unless the case exists (selects only its primary key)."""
+    result = await db.execute(select(Case.id).where(Case.id == case_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found",
+        )
+
+
+async def _get_version_or_404(case_id: uuid.UUID, db: AsyncSession) -> int:
+    """Return the case's current timeline version, or raise 404."""
+    result = await db.execute(
+        select(Case.timeline_version).where(Case.id == case_id)
+    )
+    version = result.scalar_one_or_none()
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Case not found",
         )
-    return case
+    return version
+
 
+def _event_query(case_id: uuid.UUID, include: list[str] | None = None):
+    """Build a base query for events with eagerly loaded relationships.
 
-def _event_query(case_id: uuid.UUID):
-    """Build a base query for events with eagerly loaded relationships."""
-    return (
+    Every event row carries its batch count and file total; the batches
+    themselves cost an extra query and are only loaded for
+    ``include=batches``.
+    """
+    query = (
         select(Event)
         .where(Event.case_id == case_id)
         .options(selectinload(Event.created_by))
     )
+    if include and "batches" in include:
+        query = query.options(selectinload(Event.file_batches))
+    return query
+
+
+def _timeline_filters(
+    date_from: date | None,
+    date_to: date | None,
+    file_type: str | None = None,
+    q: str | None = None,
+) -> list:
+    """Build WHERE clauses for an inclusive date window and search terms."""
+    filters = []
+    if date_from is not None:
+        filters.append(Event.event_date >= date_from)
+    if date_to is not None:
+        filters.append(Event.event_date <= date_to)
+    if file_type is not None:
+        filters.append(Event.file_type == file_type)
+    if q is not None and q.strip():
+        filters.append(TimelineSearch(q.strip()))
+    return filters
+
+
+def _encode_cursor(event: Event) -> str:
+    """Encode an event's timeline position as an opaque pagination cursor."""
+    payload = [
+        event.event_date.isoformat(),
+        event.event_time.isoformat() if event.event_time else None,
+        event.sort_order,
+        str(event.id),
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[date, time | None, int, uuid.UUID]:
+    """Decode a pagination cursor, or raise 400 if it is malformed."""
+    try:
+        raw_date, raw_time, sort_order, event_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+        return (
+            date.fromisoformat(raw_date),
+            time.fromisoformat(raw_time) if raw_time is not None else None,
+            int(sort_order),
+            uuid.UUID(event_id),
+        )
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def _after_cursor(cursor: tuple[date, time | None, int, uuid.UUID]):
+    """Build a keyset predicate selecting events that sort after the cursor.
+
+    Mirrors ``timeline_order()`` (event_date, event_time NULLS LAST,
+    sort_order, id) so each page continues exactly where the last ended.
+    """
+    cursor_date, cursor_time, cursor_sort, cursor_id = cursor
+    tie_break = or_(
+        Event.sort_order > cursor_sort,
+        and_(Event.sort_order == cursor_sort, Event.id > cursor_id),
+    )
+    if cursor_time is None:
+        same_date = and_(Event.event_time.is_(None), tie_break)
+    else:
+        same_date = or_(
+            Event.event_time > cursor_time,
+            Event.event_time.is_(None),
+            and_(Event.event_time == cursor_time, tie_break),
+        )
+    return or_(
+        Event.event_date > cursor_date,
+        and_(Event.event_date == cursor_date, same_date),
+    )
 
 
 def _validate_event_type(event_type: str) -> None:
@@ -48,6 +190,22 @@ def _validate_event_type(event_type: str) -> None:
         )
 
 
+def _validate_update(values: dict) -> None:
+    """Validate the fields of a partial update before it is applied.
+
+    ``EventUpdate`` fields are optional, so an explicit null passes the
+    schema; for NOT NULL columns it would fail at the database instead.
+    """
+    for field in NOT_NULL_UPDATE_FIELDS:
+        if field in values and values[field] is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"{field} cannot be null",
+            )
+    if "event_type" in values:
+        _validate_event_type(values["event_type"])
+
+
 @router.post("/", response_model=EventRead, status_code=status.HTTP_201_CREATED)
 async def create_event(
     case_id: uuid.UUID,
@@ -56,17 +214,10 @@ async def create_event(
     current_user: User = Depends(get_current_user),
 ) -> EventRead:
     """Create a new event in a case timeline."""
-    await _verify_case_exists(case_id, db)
     _validate_event_type(body.event_type)
 
-    # Determine sort_order: max existing + 1
-    result = await db.execute(
-        select(func.coalesce(func.max(Event.sort_order), -1)).where(
-            Event.case_id == case_id
-        )
-    )
-    max_sort = result.scalar() or 0
-    next_sort = max_sort + 1
+    version = await bump_timeline_version_or_404(db, case_id)
+    sort_keys = await reserve_sort_orders(db, case_id)
 
     event = Event(
         case_id=case_id,
@@ -78,10 +229,14 @@ async def create_event(
         file_description=body.file_description,
         file_type=body.file_type,
         metadata_=body.metadata,
-        sort_order=next_sort,
+        sort_order=sort_keys[0],
+        version=version,
         created_by_id=current_user.id,
     )
     db.add(event)
+    # Flush for the row's defaults (batch totals)
+    await db.flush()
+    await apply_case_rollup_delta(db, case_id, [], [RollupInputs.of(event)])
     await db.commit()
 
     # Refresh with relationships
@@ -96,33 +251,342 @@ async def create_event(
 @router.get("/", response_model=EventListResponse)
 async def list_events(
     case_id: uuid.UUID,
+    request: Request,
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    event_type: list[str] | None = Query(None),
+    file_type: str | None = Query(None, max_length=100),
+    q: str | None = Query(None, max_length=200),
+    include: list[EventInclude] | None = Query(None),
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> EventListResponse:
-    """List all events for a case, sorted chronologically."""
-    await _verify_case_exists(case_id, db)
-
-    # Count total events
-    count_result = await db.execute(
-        select(func.count()).where(Event.case_id == case_id)
-    )
-    total = count_result.scalar() or 0
+    """List a page of events for a case, sorted chronologically.
+
+    Pages are keyset-paginated: pass the returned ``next_cursor`` back as
+    ``cursor`` to fetch the following page. ``from``/``to`` restrict the
+    timeline to an inclusive date window; ``event_type`` (repeatable),
+    ``file_type`` and the search words ``q`` (matched anywhere in the file
+    name or description) narrow it further.
+    ``total`` and ``counts_by_type`` come with the first page only;
+    ``counts_by_type`` ignores the ``event_type`` filter so it can drive
+    type facets. ``version`` is the baseline to pass to ``/changes``
+    afterwards; it is read first, so a write landing mid-listing is at
+    worst delivered twice. File batches are only embedded with
+    ``include=batches``.
+    """
+    for t in event_type or ():
+        _validate_event_type(t)
+    version = await _get_version_or_404(case_id, db)
+    # Any timeline write bumps the version; the URL carries the filters
+    check_not_modified(request, weak_etag("events", case_id, version))
+    filters = _timeline_filters(date_from, date_to, file_type, q)
+
+    # Count matching events per type in one aggregate, for the first page
+    # only; the counts don't change as the client pages on
+    total: int | None = None
+    counts_by_type: dict[str, int] | None = None
+    if cursor is None:
+        count_result = await db.execute(
+            select(Event.event_type, func.count())
+            .where(Event.case_id == case_id, *filters)
+            .group_by(Event.event_type)
+        )
+        counts_by_type = {t: count for t, count in count_result}
+        if event_type:
+            total = sum(counts_by_type.get(t, 0) for t in set(event_type))
+        else:
+            total = sum(counts_by_type.values())
+    if event_type:
+        filters.append(Event.event_type.in_(event_type))
 
-    # Fetch events sorted by date, time, then sort_order
+    # Fetch one extra row to learn whether another page follows
     query = (
-        _event_query(case_id)
-        .order_by(
-            Event.event_date.asc(),
-            Event.event_time.asc().nulls_last(),
-            Event.sort_order.asc(),
-        )
+        _event_query(case_id, include)
+        .where(*filters)
+        .order_by(*timeline_order())
+        .limit(limit + 1)
     )
+    if cursor is not None:
+        query = query.where(_after_cursor(_decode_cursor(cursor)))
     result = await db.execute(query)
     events = result.scalars().all()
 
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        next_cursor = _encode_cursor(events[-1])
+
     return EventListResponse(
         items=[EventRead.model_validate(e) for e in events],
         total=total,
+        counts_by_type=counts_by_type,
+        next_cursor=next_cursor,
+        version=version,
+    )
+
+
+@router.get("/histogram", response_model=EventHistogramResponse)
+async def get_event_histogram(
+    case_id: uuid.UUID,
+    request: Request,
+    bucket: HistogramBucket = "day",
+    by: Literal["type"] | None = None,
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    event_type: list[str] | None = Query(None),
+    file_type: str | None = Query(None, max_length=100),
+    q: str | None = Query(None, max_length=200),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> EventHistogramResponse:
+    """Count events per day, week or month, optionally split by type.
+
+    Accepts the same filters as the event list; buckets without events
+    are omitted.
+    """
+    for t in event_type or ():
+        _validate_event_type(t)
+    version = await _get_version_or_404(case_id, db)
+    check_not_modified(request, weak_etag("histogram", case_id, version))
+
+    filters = _timeline_filters(date_from, date_to, file_type, q)
+    if event_type:
+        filters.append(Event.event_type.in_(event_type))
+    rows = await event_histogram(
+        db, case_id, bucket, by_type=by == "type", filters=filters
+    )
+    return EventHistogramResponse(
+        bucket=bucket,
+        items=[
+            EventHistogramBucket(start=start, event_type=t, count=count)
+            for start, t, count in rows
+        ],
+    )
+
+
+@router.get("/changes", response_model=EventChangesResponse)
+async def list_event_changes(
+    case_id: uuid.UUID,
+    since: int = Query(ge=0),
+    include: list[EventInclude] | None = Query(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> EventChangesResponse:
+    """List events written and deleted after timeline version ``since``.
+
+    A batch change re-sends its parent event with updated batch totals
+    (and its batches, with ``include=batches``). Apply the result and
+    keep the returned ``version`` for the next call.
+    """
+    version = await _get_version_or_404(case_id, db)
+    if since > version:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Version is ahead of the server; reload the timeline",
+        )
+
+    events: list[Event] = []
+    deleted_ids: list[uuid.UUID] = []
+    if since < version:
+        result = await db.execute(
+            _event_query(case_id, include)
+            .where(Event.version > since)
+            .order_by(*timeline_order())
+        )
+        events = list(result.scalars().all())
+        result = await db.execute(
+            select(EventTombstone.event_id).where(
+                EventTombstone.case_id == case_id, EventTombstone.version > since
+            )
+        )
+        deleted_ids = list(result.scalars().all())
+
+    return EventChangesResponse(
+        version=version,
+        events=[EventRead.model_validate(e) for e in events],
+        deleted_ids=deleted_ids,
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _timeline_stream(case_id: uuid.UUID, version: int):
+    """Yield SSE messages for a case until the client disconnects."""
+    async with broadcaster.subscribe(case_id) as queue:
+        yield _sse("version", {"version": version})
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    queue.get(), STREAM_KEEPALIVE_SECONDS
+                )
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if message.get("deleted"):
+                yield _sse("deleted", message)
+                return
+            yield _sse("change", message)
+
+
+@router.get("/stream")
+async def stream_events(
+    case_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """Push timeline change notifications for a case as server-sent events.
+
+    Messages carry the case's new timeline version; clients fetch the
+    actual changes from ``/changes``. The first message is the version
+    at subscription time.
+    """
+    version = await _get_version_or_404(case_id, db)
+    # Return the pooled connection; the stream itself needs none
+    await db.close()
+    return StreamingResponse(
+        _timeline_stream(case_id, version),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(":batch", response_model=EventBatchResponse)
+async def batch_events(
+    case_id: uuid.UUID,
+    body: EventBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> EventBatchResponse:
+    """Apply a list of create, update and delete operations atomically.
+
+    All operations are validated before anything is written; the writes
+    are then issued as one executemany statement per kind and committed
+    in a single transaction.
+    """
+    version = await bump_timeline_version_or_404(db, case_id)
+
+    creates = [op for op in body.operations if isinstance(op, EventBatchCreate)]
+    deletes = [op.id for op in body.operations if isinstance(op, EventBatchDelete)]
+    updates = [
+        (op.id, op.data.model_dump(exclude_unset=True))
+        for op in body.operations
+        if isinstance(op, EventBatchUpdate)
+    ]
+
+    # Validate everything up front so a bad operation writes nothing
+    for op in creates:
+        _validate_event_type(op.data.event_type)
+    for _, values in updates:
+        _validate_update(values)
+
+    target_ids = [event_id for event_id, _ in updates] + deletes
+    if len(set(target_ids)) != len(target_ids):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Each event may appear in at most one update or delete operation",
+        )
+    # Load the targets' rollup inputs along with the existence check
+    stored: dict[uuid.UUID, RollupInputs] = {}
+    if target_ids:
+        result = await db.execute(
+            select(Event.id, *ROLLUP_INPUTS).where(
+                Event.case_id == case_id, Event.id.in_(target_ids)
+            )
+        )
+        stored = {row.id: RollupInputs(*row[1:]) for row in result}
+        missing = set(target_ids) - stored.keys()
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Events not found: {', '.join(sorted(map(str, missing)))}",
+            )
+
+    created_ids: list[uuid.UUID] = []
+    if creates:
+        sort_keys = await reserve_sort_orders(db, case_id, len(creates))
+        rows = []
+        for sort_order, op in zip(sort_keys, creates):
+            event_id = uuid.uuid4()
+            created_ids.append(event_id)
+            rows.append({
+                "id": event_id,
+                "case_id": case_id,
+                "event_type": op.data.event_type,
+                "event_date": op.data.event_date,
+                "event_time": op.data.event_time,
+                "file_name": op.data.file_name,
+                "file_count": op.data.file_count,
+                "file_description": op.data.file_description,
+                "file_type": op.data.file_type,
+                "metadata_": op.data.metadata,
+                "sort_order": sort_order,
+                "version": version,
+                "created_by_id": current_user.id,
+            })
+        await db.execute(insert(Event), rows)
+
+    update_rows = []
+    for event_id, values in updates:
+        if "metadata" in values:
+            values["metadata_"] = values.pop("metadata")
+        update_rows.append({"id": event_id, **values, "version": version})
+    if update_rows:
+        await db.execute(update(Event), update_rows)
+
+    if deletes:
+        await db.execute(
+            delete(Event)
+            .where(Event.case_id == case_id, Event.id.in_(deletes))
+            .execution_options(synchronize_session=False)
+        )
+        await record_deletions(db, case_id, deletes, version)
+
+    rollup_updates = [
+        (event_id, {k: v for k, v in values.items() if k in CASE_ROLLUP_FIELDS})
+        for event_id, values in updates
+        if values.keys() & CASE_ROLLUP_FIELDS
+    ]
+    if creates or deletes or rollup_updates:
+        await apply_case_rollup_delta(
+            db,
+            case_id,
+            removed=[stored[event_id] for event_id, _ in rollup_updates]
+            + [stored[event_id] for event_id in deletes],
+            added=[
+                RollupInputs(op.data.event_type, op.data.event_date, op.data.file_count)
+                for op in creates
+            ]
+            + [
+                stored[event_id]._replace(**values)
+                for event_id, values in rollup_updates
+            ],
+        )
+    await db.commit()
+
+    # Re-select everything written in one query
+    changed_ids = created_ids + [event_id for event_id, _ in updates]
+    events_by_id: dict[uuid.UUID, Event] = {}
+    if changed_ids:
+        result = await db.execute(
+            _event_query(case_id)
+            .where(Event.id.in_(changed_ids))
+            .execution_options(populate_existing=True)
+        )
+        events_by_id = {e.id: e for e in result.scalars().all()}
+
+    return EventBatchResponse(
+        created=[EventRead.model_validate(events_by_id[i]) for i in created_ids],
+        updated=[
+            EventRead.model_validate(events_by_id[event_id])
+            for event_id, _ in updates
+        ],
+        deleted=deletes,
     )
 
 
@@ -130,14 +594,15 @@ async def list_events(
 async def get_event(
     case_id: uuid.UUID,
     event_id: uuid.UUID,
+    include: list[EventInclude] | None = Query(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> EventRead:
-    """Get a single event by ID."""
+    """Get a single event by ID; ``include=batches`` embeds its batches."""
     await _verify_case_exists(case_id, db)
 
     result = await db.execute(
-        _event_query(case_id).where(Event.id == event_id)
+        _event_query(case_id, include).where(Event.id == event_id)
     )
     event = result.scalar_one_or_none()
     if event is None:
@@ -157,10 +622,10 @@ async def update_event(
     current_user: User = Depends(get_current_user),
 ) -> EventRead:
     """Partially update an event."""
-    await _verify_case_exists(case_id, db)
+    version = await bump_timeline_version_or_404(db, case_id)
 
     result = await db.execute(
-        _event_query(case_id).where(Event.id == event_id)
+        select(Event).where(Event.id == event_id, Event.case_id == case_id)
     )
     event = result.scalar_one_or_none()
     if event is None:
@@ -171,9 +636,8 @@ async def update_event(
 
     update_data = body.model_dump(exclude_unset=True)
 
-    # Validate event_type if present
-    if "event_type" in update_data and update_data["event_type"] is not None:
-        _validate_event_type(update_data["event_type"])
+    _validate_update(update_data)
+    stored = RollupInputs.of(event)
 
     # Apply updates
     for field, value in update_data.items():
@@ -182,7 +646,69 @@ async def update_event(
             event.metadata_ = value
         else:
             setattr(event, field, value)
+    event.version = version
 
+    if update_data.keys() & CASE_ROLLUP_FIELDS:
+        # Sessions don't autoflush; a moved date bound is looked up again
+        await db.flush()
+        await apply_case_rollup_delta(
+            db, case_id, [stored], [RollupInputs.of(event)]
+        )
+    await db.commit()
+
+    # Refresh with relationships
+    result = await db.execute(
+        _event_query(case_id).where(Event.id == event_id)
+    )
+    event = result.scalar_one()
+
+    return EventRead.model_validate(event)
+
+
+@router.post("/{event_id}/move", response_model=EventRead)
+async def move_event_endpoint(
+    case_id: uuid.UUID,
+    event_id: uuid.UUID,
+    body: EventMove,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> EventRead:
+    """Move an event directly after or before another in the same slot.
+
+    Events are ordered by date and time first, so ``sort_order`` can only
+    reorder events sharing both; the anchor must be in the same slot.
+    """
+    anchor_id = body.before_id or body.after_id
+    if anchor_id == event_id:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="An event cannot be moved relative to itself",
+        )
+    version = await bump_timeline_version_or_404(db, case_id)
+
+    result = await db.execute(
+        select(Event).where(
+            Event.case_id == case_id, Event.id.in_([event_id, anchor_id])
+        )
+    )
+    found = {e.id: e for e in result.scalars().all()}
+    if event_id not in found or anchor_id not in found:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found",
+        )
+    event, anchor = found[event_id], found[anchor_id]
+
+    if (event.event_date, event.event_time) != (anchor.event_date, anchor.event_time):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Events can only be reordered within the same date and time",
+        )
+
+    await move_event(
+        db, event, anchor, before=body.before_id is not None, version=version
+    )
+    event.version = version
     await db.commit()
 
     # Refresh with relationships
@@ -202,7 +728,7 @@ async def delete_event(
     current_user: User = Depends(get_current_user),
 ) -> None:
     """Delete an event from a case timeline."""
-    await _verify_case_exists(case_id, db)
+    version = await bump_timeline_version_or_404(db, case_id)
 
     result = await db.execute(
         select(Event).where(Event.id == event_id, Event.case_id == case_id)
@@ -213,5 +739,9 @@ async def delete_event(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found",
         )
+    stored = RollupInputs.of(event)
     await db.delete(event)
+    await record_deletions(db, case_id, [event_id], version)
+    await db.flush()
+    await apply_case_rollup_delta(db, case_id, [stored], [])
     await db.commit()
@@ -1,14 +1,22 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.deps import get_current_user, get_db
+from src.http_cache import check_not_modified, weak_etag
 from src.models.event import Event
 from src.models.file_batch import FileBatch
 from src.models.user import User
-from src.schemas.file_batch import FileBatchCreate, FileBatchRead, FileBatchUpdate
+from src.schemas.file_batch import (
+    FileBatchCreate,
+    FileBatchRead,
+    FileBatchReplace,
+    FileBatchUpdate,
+)
+from src.services.timeline_rollups import refresh_batch_rollups
+from src.services.timeline_versions import bump_timeline_version_or_404, touch_event
 
 router = APIRouter(
     prefix="/cases/{case_id}/events/{event_id}/batches",
@@ -32,6 +40,16 @@ async def _get_event_or_404(
     return event
 
 
+async def _record_batch_write(
+    db: AsyncSession, event_id: uuid.UUID, case_id: uuid.UUID, version: int
+) -> None:
+    """Re-stamp the event with the write's version and refresh rollups."""
+    # Sessions don't autoflush; the rollups must see the batch write
+    await db.flush()
+    await touch_event(db, event_id, version)
+    await refresh_batch_rollups(db, case_id, event_id)
+
+
 @router.post("/", response_model=FileBatchRead, status_code=status.HTTP_201_CREATED)
 async def create_file_batch(
     case_id: uuid.UUID,
@@ -41,6 +59,7 @@ async def create_file_batch(
     current_user: User = Depends(get_current_user),
 ) -> FileBatchRead:
     """Create a new file batch attached to an event."""
+    version = await bump_timeline_version_or_404(db, case_id)
     await _get_event_or_404(db, event_id, case_id)
 
     batch = FileBatch(
@@ -52,6 +71,7 @@ async def create_file_batch(
         sort_order=body.sort_order,
     )
     db.add(batch)
+    await _record_batch_write(db, event_id, case_id, version)
     await db.commit()
     await db.refresh(batch)
 
@@ -62,11 +82,14 @@ async def create_file_batch(
 async def list_file_batches(
     case_id: uuid.UUID,
     event_id: uuid.UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> list[FileBatchRead]:
     """List all file batches for an event, ordered by sort_order."""
-    await _get_event_or_404(db, event_id, case_id)
+    event = await _get_event_or_404(db, event_id, case_id)
+    # Every batch write re-stamps the parent event's version
+    check_not_modified(request, weak_etag("batches", event_id, event.version))
 
     result = await db.execute(
         select(FileBatch)
@@ -78,6 +101,78 @@ async def list_file_batches(
     return [FileBatchRead.model_validate(b) for b in batches]
 
 
+@router.put("/", response_model=list[FileBatchRead])
+async def replace_file_batches(
+    case_id: uuid.UUID,
+    event_id: uuid.UUID,
+    body: FileBatchReplace,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> list[FileBatchRead]:
+    """Replace an event's whole batch list in one transaction.
+
+    Entries with an ``id`` update that batch, entries without one are
+    created, and existing batches missing from the list are deleted.
+    ``sort_order`` follows list position. The diff against the current
+    rows is applied with one statement per kind, so the cost doesn't
+    grow with the number of batches.
+    """
+    version = await bump_timeline_version_or_404(db, case_id)
+    await _get_event_or_404(db, event_id, case_id)
+
+    kept_ids = [item.id for item in body.batches if item.id is not None]
+    if len(set(kept_ids)) != len(kept_ids):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Each file batch may appear at most once",
+        )
+
+    fields = ("label", "file_count", "description", "file_types", "sort_order")
+    result = await db.execute(
+        select(FileBatch.id, *(getattr(FileBatch, f) for f in fields)).where(
+            FileBatch.event_id == event_id
+        )
+    )
+    current = {row.id: row._asdict() for row in result}
+    missing = set(kept_ids) - current.keys()
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"File batches not found: {', '.join(sorted(map(str, missing)))}",
+        )
+
+    inserts, updates = [], []
+    for position, item in enumerate(body.batches):
+        values = {**item.model_dump(exclude={"id"}), "sort_order": position}
+        if item.id is None:
+            inserts.append({"id": uuid.uuid4(), "event_id": event_id, **values})
+        elif any(current[item.id][f] != values[f] for f in fields):
+            updates.append({"id": item.id, **values})
+    deletes = current.keys() - set(kept_ids)
+
+    if deletes:
+        await db.execute(
+            delete(FileBatch)
+            .where(FileBatch.id.in_(deletes))
+            .execution_options(synchronize_session=False)
+        )
+    if updates:
+        await db.execute(update(FileBatch), updates)
+    if inserts:
+        await db.execute(insert(FileBatch), inserts)
+    if deletes or updates or inserts:
+        await _record_batch_write(db, event_id, case_id, version)
+    await db.commit()
+
+    result = await db.execute(
+        select(FileBatch)
+        .where(FileBatch.event_id == event_id)
+        .order_by(FileBatch.sort_order.asc())
+        .execution_options(populate_existing=True)
+    )
+    return [FileBatchRead.model_validate(b) for b in result.scalars().all()]
+
+
 @router.patch("/{batch_id}", response_model=FileBatchRead)
 async def update_file_batch(
     case_id: uuid.UUID,
@@ -88,6 +183,7 @@ async def update_file_batch(
     current_user: User = Depends(get_current_user),
 ) -> FileBatchRead:
     """Partially update a file batch."""
+    version = await bump_timeline_version_or_404(db, case_id)
     await _get_event_or_404(db, event_id, case_id)
 
     result = await db.execute(
@@ -106,6 +202,7 @@ async def update_file_batch(
     for field, value in update_data.items():
         setattr(batch, field, value)
 
+    await _record_batch_write(db, event_id, case_id, version)
     await db.commit()
     await db.refresh(batch)
 
@@ -121,6 +218,7 @@ async def delete_file_batch(
     current_user: User = Depends(get_current_user),
 ) -> None:
     """Delete a file batch."""
+    version = await bump_timeline_version_or_404(db, case_id)
     await _get_event_or_404(db, event_id, case_id)
 
     result = await db.execute(
@@ -136,4 +234,5 @@ async def delete_file_batch(
         )
 
     await db.delete(batch)
+    await _record_batch_write(db, event_id, case_id, version)
     await db.commit()
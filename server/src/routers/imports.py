@@ -1,190 +1,819 @@
 """Import router for Excel/CSV file upload, column mapping, and batch event creation."""
 
+import asyncio
+import hashlib
+import os
+import shutil
 import uuid
-from datetime import datetime, timezone
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import date, time
+from functools import partial
+from itertools import chain, islice
+from pathlib import Path
+from typing import BinaryIO
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy import func, select
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.deps import get_current_user, get_db
 from src.models.case import Case
-from src.models.event import Event
 from src.models.user import User
 from src.schemas.import_ import (
+    ChunkedUploadCreate,
+    ChunkedUploadResponse,
     ColumnMapping,
     ImportConfirmRequest,
     ImportConfirmResponse,
+    ImportRowsPage,
+    ImportStatusResponse,
     ImportUploadResponse,
     ImportValidationResponse,
     ImportValidationRow,
 )
+from src.services.event_ordering import reserve_sort_orders
 from src.services.import_parser import (
     VALID_EVENT_FIELDS,
-    normalize_cell_value,
-    parse_file,
-    validate_and_transform_row,
+    RowLimitExceeded,
+    iter_file,
+)
+from src.services.import_staging import StagingBudgetExceeded, read_chunk, staging
+from src.services.import_upsert import (
+    RowFingerprinter,
+    existing_hashes,
+    upsert_events,
+)
+from src.services.import_validation import (
+    FORMAT_SAMPLE_SIZE,
+    CompiledValidator,
+    compile_validator,
+    validate_chunk_file,
 )
+from src.services.import_workers import ImportBusy, import_slot, map_chunks
+from src.services.timeline_rollups import refresh_case_rollups
+from src.services.timeline_versions import bump_timeline_version_or_404
 
 router = APIRouter(prefix="/cases/{case_id}/imports", tags=["imports"])
 
-# In-memory session storage for import data between upload and confirm steps.
-# Keyed by session_id, stores parsed headers, data, user_id, and timestamps.
-_import_sessions: dict[str, dict] = {}
+# Maximum upload size; files are parsed from the spooled upload as a stream
+MAX_UPLOAD_SIZE = settings.IMPORT_MAX_UPLOAD_BYTES
 
-# Maximum upload size: 10MB
-MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+PREVIEW_ROWS = 10
 
-# Session expiry: 1 hour
-SESSION_EXPIRY_SECONDS = 3600
+# Interval at which validate/confirm check on a background parse
+PARSE_POLL_SECONDS = 0.2
 
+# Files of a chunked upload, kept in its session directory
+UPLOAD_PART = "part-{index:05d}"
+UPLOAD_FILE = "upload"
+UPLOAD_ASSEMBLING = "Upload is being completed."
 
-def _cleanup_expired_sessions() -> None:
-    """Remove import sessions older than 1 hour."""
-    now = datetime.now(timezone.utc)
-    expired = [
-        sid
-        for sid, sess in _import_sessions.items()
-        if (now - sess.get("created_at", now)).total_seconds()
-        > SESSION_EXPIRY_SECONDS
-    ]
-    for sid in expired:
-        del _import_sessions[sid]
+# Invalid rows returned by validate; the rest are paged via /rows
+ERROR_PREVIEW_ROWS = 100
 
 
 async def _verify_case_exists(
     case_id: uuid.UUID, db: AsyncSession
-) -> Case:
-    """Fetch a case or raise 404."""
-    result = await db.execute(select(Case).where(Case.id == case_id))
-    case = result.scalar_one_or_none()
-    if case is None:
+) -> None:
+    """Raise 404 unless the case exists (selects only its primary key)."""
+    result = await db.execute(select(Case.id).where(Case.id == case_id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Case not found",
         )
-    return case
 
 
-@router.post("/upload", response_model=ImportUploadResponse)
-async def upload_file(
-    case_id: uuid.UUID,
-    file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> ImportUploadResponse:
-    """Upload an Excel or CSV file and get parsed preview data."""
-    await _verify_case_exists(case_id, db)
+async def _load_parsed_session(
+    session_id: str, case_id: uuid.UUID, user: User
+) -> dict:
+    """Load a session, waiting for its upload to finish parsing.
 
-    # Clean up old sessions
-    _cleanup_expired_sessions()
+    Waits up to ``IMPORT_PARSE_WAIT_SECONDS`` (409 after that); a parse
+    that failed is reported as 400 with its error.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.IMPORT_PARSE_WAIT_SECONDS
+    session = await _load_session(session_id, case_id, user)
+    if session["status"] == "receiving":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload is not complete.",
+        )
+    while session["status"] == "parsing":
+        if loop.time() >= deadline:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="File is still being parsed. Please try again shortly.",
+            )
+        await asyncio.sleep(PARSE_POLL_SECONDS)
+        session = await _load_session(session_id, case_id, user)
 
-    # Validate filename
-    if not file.filename:
+    if session["status"] == "failed":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No filename provided",
+            detail=session["error"],
         )
+    return session
 
-    ext = file.filename.rsplit(".", 1)[-1].lower() if "." in file.filename else ""
-    if ext not in ("csv", "xlsx", "xls"):
+
+async def _load_session(session_id: str, case_id: uuid.UUID, user: User) -> dict:
+    """Load a staged import session owned by ``user`` for ``case_id``."""
+    loop = asyncio.get_running_loop()
+    session = await loop.run_in_executor(None, partial(staging.load, session_id))
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import session not found. Please upload the file again.",
+        )
+
+    # Verify ownership
+    if session["user_id"] != str(user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="This import session belongs to another user.",
+        )
+
+    # Verify case matches
+    if session["case_id"] != str(case_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Unsupported file type. Use .csv or .xlsx",
+            detail="Import session does not belong to this case.",
         )
+    return session
 
-    # Read with streaming size check to avoid unbounded memory usage
-    chunks: list[bytes] = []
-    total_size = 0
-    while chunk := await file.read(1024 * 1024):  # 1MB chunks
-        total_size += len(chunk)
-        if total_size > MAX_UPLOAD_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail="File too large (max 10MB)",
-            )
-        chunks.append(chunk)
-    contents = b"".join(chunks)
 
-    # Parse the file
+def _read_chunk_list(path: Path) -> list[list]:
+    return list(read_chunk(path))
+
+
+def _event_values(transformed: dict) -> dict:
+    """Column values for a validated row (dates staged as ISO strings)."""
+    event_time = transformed.get("event_time")
+    return {
+        "event_date": date.fromisoformat(transformed["event_date"]),
+        "event_time": time.fromisoformat(event_time) if event_time else None,
+        "event_type": transformed.get("event_type", "note"),
+        "file_name": transformed.get("file_name"),
+        "file_count": transformed.get("file_count"),
+        "file_description": transformed.get("file_description"),
+        "file_type": transformed.get("file_type"),
+        "metadata_": {},
+    }
+
+
+def _open_session(meta: dict, session_id: str | None) -> str:
+    """Start an import session, or turn a chunked upload into one."""
+    if session_id is None:
+        return staging.create(meta)
+    staging.save(session_id, meta)
+    return session_id
+
+
+def _stage_upload(
+    meta: dict, rows: Iterator[list], session_id: str | None = None
+) -> tuple[str, int]:
+    """Stage parsed rows in an import session; return its id and size."""
+    session_id = _open_session(meta, session_id)
     try:
-        headers, data = parse_file(file.filename, contents)
-    except ValueError as e:
+        row_count = staging.write_rows(session_id, rows)
+    except Exception:
+        staging.delete(session_id)
+        raise
+    staging.save(session_id, {**staging.load(session_id), "row_count": row_count})
+    return session_id, row_count
+
+
+def _read_head(rows: Iterator[list]) -> list[list]:
+    """Parse rows for the preview, plus one to tell whether more follow."""
+    return list(islice(rows, PREVIEW_ROWS + 1))
+
+
+def _stage_parsed_rows(session_id: str, rows: Iterator[list]) -> int:
+    """Stage the rest of an upload, recording progress for the status route."""
+
+    def record_progress(row_count: int) -> None:
+        session = staging.load(session_id)
+        if session is not None:
+            session["row_count"] = row_count
+            staging.save(session_id, session)
+
+    return staging.write_rows(session_id, rows, on_chunk=record_progress)
+
+
+def _record_parse_result(session_id: str, row_count: int, error: str | None) -> None:
+    """Mark a background parse as done, or as failed with ``error``."""
+    # An over-budget session has already been evicted
+    session = staging.load(session_id)
+    if session is None:
+        return
+    if error is None:
+        session.update(status="uploaded", row_count=row_count)
+    else:
+        staging.clear_chunks(session_id, "rows")
+        session.update(status="failed", error=error)
+    staging.save(session_id, session)
+
+
+async def _finish_upload(
+    session_id: str, rows: Iterator[list], slot: AsyncExitStack
+) -> None:
+    """Background task: parse and stage an upload after its preview is sent.
+
+    Releases the user's import slot (held in ``slot``) when done. FastAPI
+    closes the uploaded file only after background tasks have run.
+    """
+    loop = asyncio.get_running_loop()
+    row_count = 0
+    error = None
+    async with slot:
+        try:
+            row_count = await loop.run_in_executor(
+                None, partial(_stage_parsed_rows, session_id, rows)
+            )
+        except RowLimitExceeded as e:
+            error = f"Too many rows (max {e.max_rows})"
+        except StagingBudgetExceeded:
+            error = "Import is too large to stage"
+        except Exception as e:
+            error = f"Failed to parse file: {e}"
+
+    await loop.run_in_executor(
+        None, partial(_record_parse_result, session_id, row_count, error)
+    )
+
+
+def _check_file_type(filename: str) -> None:
+    ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if ext not in ("csv", "xlsx", "xls"):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
+            detail="Unsupported file type. Use .csv or .xlsx",
+        )
+
+
+def _check_file_size(size: int) -> None:
+    if size > MAX_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large (max {MAX_UPLOAD_SIZE // (1024 * 1024)}MB)",
         )
-    except Exception as e:
+
+
+async def _load_upload(upload_id: str, case_id: uuid.UUID, user: User) -> dict:
+    """Load a chunked upload that is still receiving chunks."""
+    session = await _load_session(upload_id, case_id, user)
+    if session["status"] == "assembling":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=UPLOAD_ASSEMBLING,
+        )
+    if session["status"] != "receiving":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to parse file: {e}",
+            detail="Upload is already complete.",
         )
+    return session
+
 
-    if not headers:
+async def _upload_io(func, *args):
+    """Run a blocking step of a chunked upload on the default executor.
+
+    The staging store raises KeyError once the upload's directory is
+    gone, e.g. swept or evicted between chunks; that is a 404.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(None, partial(func, *args))
+    except KeyError:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File appears to be empty (no headers found)",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload session not found. Please upload the file again.",
         )
 
-    # Normalize all cell values for JSON serialization
-    normalized_data = [
-        [normalize_cell_value(cell) for cell in row] for row in data
+
+def _received_chunks(upload_id: str, chunk_count: int) -> list[int]:
+    return [
+        index
+        for index in range(chunk_count)
+        if staging.file_path(upload_id, UPLOAD_PART.format(index=index)).exists()
     ]
 
-    # Store session
-    session_id = str(uuid.uuid4())
-    _import_sessions[session_id] = {
-        "case_id": str(case_id),
-        "user_id": str(current_user.id),
-        "headers": headers,
-        "data": normalized_data,
-        "created_at": datetime.now(timezone.utc),
-    }
 
-    # Return preview (first 10 rows)
-    preview_rows = normalized_data[:10]
+def _upload_response(
+    upload_id: str, session: dict, received: list[int]
+) -> ChunkedUploadResponse:
+    return ChunkedUploadResponse(
+        upload_id=upload_id,
+        filename=session["filename"],
+        size=session["size"],
+        chunk_size=session["chunk_size"],
+        chunk_count=session["chunk_count"],
+        received_chunks=received,
+    )
+
+
+def _store_part(upload_id: str, index: int, data: bytes, checksum: str) -> bool:
+    """Verify a chunk against its SHA-256 and store it; False on mismatch.
+
+    The part is written under a temporary name and renamed, so a retried
+    or interrupted PUT never leaves a partial part behind.
+    """
+    if hashlib.sha256(data).hexdigest() != checksum.strip().lower():
+        return False
+    path = staging.file_path(upload_id, UPLOAD_PART.format(index=index))
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    tmp.write_bytes(data)
+    try:
+        # Parts only appear while receiving; see _claim_upload
+        with staging.lock(upload_id) as session:
+            if session["status"] != "receiving":
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=UPLOAD_ASSEMBLING,
+                )
+            os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    staging.check_budget(upload_id)
+    return True
+
+
+def _claim_upload(upload_id: str) -> None:
+    """Move an upload from receiving to assembling, or raise 409.
+
+    A compare-and-set under the session lock: of concurrent completes
+    only one claims the upload, and part PUTs check the status under the
+    same lock, so the parts don't change while they are joined.
+    """
+    with staging.lock(upload_id) as session:
+        if session["status"] != "receiving":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=UPLOAD_ASSEMBLING,
+            )
+        staging.save(upload_id, {**session, "status": "assembling"})
+
+
+def _assemble_upload(upload_id: str, chunk_count: int) -> Path:
+    """Join a chunked upload's parts into one file for the parser.
+
+    Each part is deleted once copied, so the upload takes about one copy
+    of the file on disk throughout. The upload must be claimed first; a
+    part missing then means the session was swept (KeyError).
+    """
+    target = staging.file_path(upload_id, UPLOAD_FILE)
+    try:
+        with open(target, "wb") as out:
+            for index in range(chunk_count):
+                part = staging.file_path(upload_id, UPLOAD_PART.format(index=index))
+                with open(part, "rb") as f:
+                    shutil.copyfileobj(f, out)
+                part.unlink()
+    except FileNotFoundError:
+        raise KeyError(upload_id) from None
+    return target
+
+
+@asynccontextmanager
+async def _import_slot(user: User) -> AsyncIterator[None]:
+    """Hold one of the user's concurrent import slots, or raise 429."""
+    try:
+        async with import_slot(user.id):
+            yield
+    except ImportBusy:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many imports in progress. Please wait for one to finish.",
+        )
+
+
+def _prepare_validation(
+    session_id: str, headers: list[str], mappings: dict[str, str]
+) -> tuple[CompiledValidator, list[tuple[Path, Path]]]:
+    """Compile the validator and pair each staged chunk with its output."""
+    sample = list(islice(staging.iter_rows(session_id), FORMAT_SAMPLE_SIZE))
+    validator = compile_validator(headers, mappings, sample)
+    staging.clear_chunks(session_id, "validated")
+    jobs = [
+        (source, staging.chunk_path(session_id, i, "validated"))
+        for i, source in enumerate(staging.chunk_paths(session_id))
+    ]
+    return validator, jobs
+
+
+async def _validate_staged(
+    session_id: str, headers: list[str], mappings: dict[str, str]
+) -> tuple[CompiledValidator, list[list[int]], list[ImportValidationRow]]:
+    """Validate every staged chunk in the worker pool, staging the results.
+
+    Returns the validator, ``[rows, errors]`` per chunk (used to page
+    through the staged results) and the first ``ERROR_PREVIEW_ROWS``
+    invalid rows.
+    """
+    loop = asyncio.get_running_loop()
+    validator, jobs = await loop.run_in_executor(
+        None, partial(_prepare_validation, session_id, headers, mappings)
+    )
+    summaries = await map_chunks(
+        partial(validate_chunk_file, validator, max_errors=ERROR_PREVIEW_ROWS),
+        jobs,
+    )
+    await loop.run_in_executor(None, partial(staging.check_budget, session_id))
+
+    chunk_counts: list[list[int]] = []
+    first_errors: list[ImportValidationRow] = []
+    offset = 0
+    for row_count, valid_count, error_rows in summaries:
+        for index, errors, data in error_rows[: ERROR_PREVIEW_ROWS - len(first_errors)]:
+            first_errors.append(
+                ImportValidationRow(
+                    row_number=offset + index + 1, valid=False, errors=errors, data=data
+                )
+            )
+        chunk_counts.append([row_count, row_count - valid_count])
+        offset += row_count
+    return validator, chunk_counts, first_errors
+
+
+def _read_validated_page(
+    session_id: str,
+    chunk_counts: list[list[int]],
+    errors_only: bool,
+    offset: int,
+    limit: int,
+) -> list[ImportValidationRow]:
+    """Read one page of staged validation results.
+
+    Chunks that end before ``offset`` (by row or error count, per
+    ``chunk_counts``) are skipped without being read.
+    """
+    items: list[ImportValidationRow] = []
+    first_row = 0
+    for index, (row_count, error_count) in enumerate(chunk_counts):
+        chunk_total = error_count if errors_only else row_count
+        if offset >= chunk_total:
+            offset -= chunk_total
+            first_row += row_count
+            continue
+        path = staging.chunk_path(session_id, index, "validated")
+        for row_number, (is_valid, data, errors) in enumerate(
+            read_chunk(path), first_row + 1
+        ):
+            if errors_only and is_valid:
+                continue
+            if offset:
+                offset -= 1
+                continue
+            items.append(
+                ImportValidationRow(
+                    row_number=row_number, valid=is_valid, errors=errors, data=data
+                )
+            )
+            if len(items) == limit:
+                return items
+        first_row += row_count
+    return items
+
+
+async def _start_import(
+    case_id: uuid.UUID,
+    user: User,
+    filename: str,
+    stream: BinaryIO,
+    sheet: str | None,
+    background_tasks: BackgroundTasks,
+    slot: AsyncExitStack,
+    session_id: str | None = None,
+) -> ImportUploadResponse:
+    """Read an upload's headers and preview, and stage its rows.
+
+    Returns once the preview is read; a file longer than the preview is
+    parsed and staged by a background task. ``slot`` holds the user's
+    import slot (and anything else to release once parsing ends); it is
+    handed to the background task when there is one. A chunked upload
+    passes its ``session_id``, which is discarded if the file can't be
+    parsed.
+    """
+    parsing_in_background = False
+    try:
+        # Read the headers and the preview; the rest is parsed as it is staged
+        loop = asyncio.get_running_loop()
+        try:
+            headers, rows, sheet_names = await loop.run_in_executor(
+                None,
+                partial(
+                    iter_file,
+                    filename,
+                    stream,
+                    sheet=sheet,
+                    max_rows=settings.IMPORT_MAX_ROWS,
+                ),
+            )
+            head = await loop.run_in_executor(None, partial(_read_head, rows))
+        except RowLimitExceeded as e:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Too many rows (max {e.max_rows})",
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Failed to parse file: {e}",
+            )
+
+        if not headers:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File appears to be empty (no headers found)",
+            )
+
+        # Rows arrive JSON-safe from the parser
+        preview_rows = head[:PREVIEW_ROWS]
+        meta = {
+            "case_id": str(case_id),
+            "user_id": str(user.id),
+            "filename": filename,
+            "headers": headers,
+            "status": "uploaded",
+        }
+
+        if len(head) > PREVIEW_ROWS:
+            # Return the preview now; stage every row (off the event loop)
+            # in the background for validate/confirm to wait on
+            session_id = await loop.run_in_executor(
+                None,
+                partial(
+                    _open_session,
+                    {**meta, "status": "parsing", "row_count": 0},
+                    session_id,
+                ),
+            )
+            background_tasks.add_task(
+                _finish_upload, session_id, chain(head, rows), slot
+            )
+            parsing_in_background = True
+            return ImportUploadResponse(
+                session_id=session_id,
+                filename=filename,
+                status="parsing",
+                headers=headers,
+                row_count=None,
+                preview_rows=preview_rows,
+                sheet_names=sheet_names,
+            )
+
+        # The whole file fit in the preview
+        try:
+            session_id, row_count = await loop.run_in_executor(
+                None, partial(_stage_upload, meta, iter(head), session_id)
+            )
+        except StagingBudgetExceeded:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Import is too large to stage",
+            )
+    except HTTPException:
+        if session_id is not None:
+            await loop.run_in_executor(None, partial(staging.delete, session_id))
+        raise
+    finally:
+        if not parsing_in_background:
+            await slot.aclose()
 
     return ImportUploadResponse(
         session_id=session_id,
-        filename=file.filename,
+        filename=filename,
+        status="uploaded",
         headers=headers,
-        row_count=len(normalized_data),
+        row_count=row_count,
         preview_rows=preview_rows,
+        sheet_names=sheet_names,
     )
 
 
-@router.post("/validate", response_model=ImportValidationResponse)
-async def validate_mapping(
+@router.post("/upload", response_model=ImportUploadResponse)
+async def upload_file(
     case_id: uuid.UUID,
-    body: ColumnMapping,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    sheet: str | None = Query(None, description="Worksheet to read (Excel only)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> ImportValidationResponse:
-    """Validate column mappings against all parsed rows."""
+) -> ImportUploadResponse:
+    """Upload an Excel or CSV file and get parsed preview data.
+
+    Returns once the headers and preview rows are read. A longer file is
+    parsed and staged by a background task; poll the status route until
+    it leaves ``parsing``. Validate and confirm wait for it.
+    """
     await _verify_case_exists(case_id, db)
 
-    # Retrieve session
-    session = _import_sessions.get(body.session_id)
-    if session is None:
+    # Validate filename
+    if not file.filename:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Import session not found. Please upload the file again.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No filename provided",
         )
 
-    # Verify ownership
-    if session["user_id"] != str(current_user.id):
+    _check_file_type(file.filename)
+
+    # The multipart parser has already spooled the upload to a temp file
+    if file.size is not None:
+        _check_file_size(file.size)
+
+    # Parsing and staging is the heavy part; cap concurrent imports per user
+    slot = AsyncExitStack()
+    await slot.enter_async_context(_import_slot(current_user))
+    return await _start_import(
+        case_id, current_user, file.filename, file.file, sheet, background_tasks, slot
+    )
+
+
+@router.post(
+    "/uploads",
+    response_model=ChunkedUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_chunked_upload(
+    case_id: uuid.UUID,
+    body: ChunkedUploadCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> ChunkedUploadResponse:
+    """Start a resumable upload, sent as numbered chunks.
+
+    PUT each chunk (in any order, retrying as needed), then complete the
+    upload to parse it as the upload route would. A dropped connection
+    only loses the chunk in flight; GET the upload to see which chunks
+    the server has.
+    """
+    await _verify_case_exists(case_id, db)
+    _check_file_type(body.filename)
+    _check_file_size(body.size)
+
+    chunk_size = settings.IMPORT_UPLOAD_CHUNK_BYTES
+    meta = {
+        "case_id": str(case_id),
+        "user_id": str(current_user.id),
+        "filename": body.filename,
+        "status": "receiving",
+        "size": body.size,
+        "chunk_size": chunk_size,
+        "chunk_count": -(-body.size // chunk_size),
+    }
+    loop = asyncio.get_running_loop()
+    upload_id = await loop.run_in_executor(None, partial(staging.create, meta))
+    return _upload_response(upload_id, meta, [])
+
+
+@router.get("/uploads/{upload_id}", response_model=ChunkedUploadResponse)
+async def get_chunked_upload(
+    case_id: uuid.UUID,
+    upload_id: str,
+    current_user: User = Depends(get_current_user),
+) -> ChunkedUploadResponse:
+    """Report which chunks of an upload have been received."""
+    session = await _load_upload(upload_id, case_id, current_user)
+    received = await _upload_io(_received_chunks, upload_id, session["chunk_count"])
+    return _upload_response(upload_id, session, received)
+
+
+@router.put(
+    "/uploads/{upload_id}/chunks/{index}", response_model=ChunkedUploadResponse
+)
+async def upload_chunk(
+    case_id: uuid.UUID,
+    upload_id: str,
+    index: int,
+    request: Request,
+    checksum: str = Header(
+        ..., alias="X-Chunk-SHA256", description="Hex SHA-256 of the chunk"
+    ),
+    current_user: User = Depends(get_current_user),
+) -> ChunkedUploadResponse:
+    """Store one chunk of an upload (the raw bytes are the request body)."""
+    session = await _load_upload(upload_id, case_id, current_user)
+    if not 0 <= index < session["chunk_count"]:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="This import session belongs to another user.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Chunk index out of range (0-{session['chunk_count'] - 1})",
         )
 
-    # Verify case matches
-    if session["case_id"] != str(case_id):
+    # Every chunk but the last is exactly chunk_size bytes
+    chunk_size = session["chunk_size"]
+    expected = min(chunk_size, session["size"] - index * chunk_size)
+    data = bytearray()
+    async for piece in request.stream():
+        data += piece
+        if len(data) > expected:
+            break
+    if len(data) != expected:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Import session does not belong to this case.",
+            detail=f"Chunk {index} must be {expected} bytes",
+        )
+
+    try:
+        stored = await _upload_io(_store_part, upload_id, index, bytes(data), checksum)
+    except StagingBudgetExceeded:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Import is too large to stage",
+        )
+    if not stored:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Chunk {index} checksum mismatch. Please send it again.",
+        )
+
+    received = await _upload_io(_received_chunks, upload_id, session["chunk_count"])
+    return _upload_response(upload_id, session, received)
+
+
+@router.post("/uploads/{upload_id}/complete", response_model=ImportUploadResponse)
+async def complete_chunked_upload(
+    case_id: uuid.UUID,
+    upload_id: str,
+    background_tasks: BackgroundTasks,
+    sheet: str | None = Query(None, description="Worksheet to read (Excel only)"),
+    current_user: User = Depends(get_current_user),
+) -> ImportUploadResponse:
+    """Assemble a fully received upload and parse it like an upload.
+
+    The upload id becomes the import session id.
+    """
+    session = await _load_upload(upload_id, case_id, current_user)
+    received = await _upload_io(_received_chunks, upload_id, session["chunk_count"])
+    missing = sorted(set(range(session["chunk_count"])) - set(received))
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Upload is missing chunks: {', '.join(map(str, missing[:20]))}",
         )
 
+    slot = AsyncExitStack()
+    await slot.enter_async_context(_import_slot(current_user))
+    claimed = False
+    try:
+        await _upload_io(_claim_upload, upload_id)
+        claimed = True
+        path = await _upload_io(_assemble_upload, upload_id, session["chunk_count"])
+        # Released (last in, first out) once parsing ends
+        slot.callback(path.unlink, missing_ok=True)
+        stream = slot.enter_context(await _upload_io(path.open, "rb"))
+    except BaseException:
+        await slot.aclose()
+        if claimed:
+            # Its parts may be partly consumed; it can't be resumed
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(staging.delete, upload_id)
+            )
+        raise
+    return await _start_import(
+        case_id,
+        current_user,
+        session["filename"],
+        stream,
+        sheet,
+        background_tasks,
+        slot,
+        session_id=upload_id,
+    )
+
+
+@router.post("/validate", response_model=ImportValidationResponse)
+async def validate_mapping(
+    case_id: uuid.UUID,
+    body: ColumnMapping,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> ImportValidationResponse:
+    """Validate column mappings against all parsed rows."""
+    await _verify_case_exists(case_id, db)
+    # Waiting for the parse and validating can take a while; don't hold
+    # a pooled connection idle in a transaction meanwhile
+    await db.commit()
+    session = await _load_parsed_session(body.session_id, case_id, current_user)
+
     # Validate mappings
     if not body.mappings:
         raise HTTPException(
@@ -218,41 +847,88 @@ async def validate_mapping(
         )
 
     # Validate all rows
-    data = session["data"]
-    validation_rows: list[ImportValidationRow] = []
-    valid_count = 0
-    error_count = 0
-    validated_rows: list[tuple[bool, dict]] = []
-
-    for i, row in enumerate(data):
-        is_valid, transformed, errors = validate_and_transform_row(
-            row, headers, body.mappings
-        )
-        if is_valid:
-            valid_count += 1
-        else:
-            error_count += 1
-
-        validated_rows.append((is_valid, transformed))
-        validation_rows.append(
-            ImportValidationRow(
-                row_number=i + 1,
-                valid=is_valid,
-                errors=errors,
-                data=transformed,
+    async with _import_slot(current_user):
+        try:
+            validator, chunk_counts, first_errors = await _validate_staged(
+                body.session_id, headers, body.mappings
             )
-        )
+        except StagingBudgetExceeded:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Import is too large to stage",
+            )
+    total_rows = sum(rows for rows, _ in chunk_counts)
+    error_count = sum(errors for _, errors in chunk_counts)
 
-    # Store validation results in session
-    session["validated_rows"] = validated_rows
+    # Record the mapping; confirm and the rows route read the staged results
     session["mappings"] = body.mappings
+    session["valid_count"] = total_rows - error_count
+    session["chunk_counts"] = chunk_counts
+    session["status"] = "validated"
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, partial(staging.save, body.session_id, session))
 
     return ImportValidationResponse(
         session_id=body.session_id,
-        total_rows=len(data),
-        valid_count=valid_count,
+        total_rows=total_rows,
+        valid_count=total_rows - error_count,
         error_count=error_count,
-        rows=validation_rows,
+        errors=first_errors,
+        date_formats=validator.date_formats,
+        ambiguous_date_columns=validator.ambiguous_date_columns,
+    )
+
+
+@router.get("/{session_id}/rows", response_model=ImportRowsPage)
+async def list_validated_rows(
+    case_id: uuid.UUID,
+    session_id: str,
+    errors_only: bool = Query(False, description="Only rows that failed validation"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: User = Depends(get_current_user),
+) -> ImportRowsPage:
+    """Page through the validation results of every row."""
+    session = await _load_session(session_id, case_id, current_user)
+    chunk_counts = session.get("chunk_counts")
+    if chunk_counts is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Must validate mapping before listing rows.",
+        )
+
+    loop = asyncio.get_running_loop()
+    items = await loop.run_in_executor(
+        None,
+        partial(
+            _read_validated_page, session_id, chunk_counts, errors_only, offset, limit
+        ),
+    )
+    index = 1 if errors_only else 0
+    return ImportRowsPage(
+        items=items,
+        total=sum(counts[index] for counts in chunk_counts),
+        offset=offset,
+        limit=limit,
+    )
+
+
+@router.get("/{session_id}", response_model=ImportStatusResponse)
+async def get_import_status(
+    case_id: uuid.UUID,
+    session_id: str,
+    current_user: User = Depends(get_current_user),
+) -> ImportStatusResponse:
+    """Report an import session's phase and confirm progress."""
+    session = await _load_session(session_id, case_id, current_user)
+    return ImportStatusResponse(
+        session_id=session_id,
+        filename=session["filename"],
+        status=session["status"],
+        row_count=session.get("row_count", 0),
+        error=session.get("error"),
+        valid_count=session.get("valid_count"),
+        inserted_count=session.get("inserted_count", 0),
     )
 
 
@@ -265,90 +941,125 @@ async def confirm_import(
 ) -> ImportConfirmResponse:
     """Confirm the import and bulk-create events from validated rows."""
     await _verify_case_exists(case_id, db)
-
-    # Retrieve session
-    session = _import_sessions.get(body.session_id)
-    if session is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Import session not found. Please upload the file again.",
-        )
-
-    # Verify ownership
-    if session["user_id"] != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="This import session belongs to another user.",
-        )
-
-    # Verify case matches
-    if session["case_id"] != str(case_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Import session does not belong to this case.",
-        )
+    # Don't hold a pooled connection idle in a transaction while the
+    # parse finishes; the writes below start a new one
+    await db.commit()
+    session = await _load_parsed_session(body.session_id, case_id, current_user)
 
     # Verify validation was completed
-    validated_rows = session.get("validated_rows")
-    if validated_rows is None:
+    valid_total = session.get("valid_count")
+    if valid_total is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Must validate mapping before confirming import.",
         )
 
-    # Get current max sort_order
-    result = await db.execute(
-        select(func.coalesce(func.max(Event.sort_order), -1)).where(
-            Event.case_id == case_id
+    # The whole import is one timeline write with one block of sort keys
+    version = await bump_timeline_version_or_404(db, case_id)
+    reserved = await reserve_sort_orders(db, case_id, valid_total)
+    if reserved is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found",
         )
-    )
-    next_sort = (result.scalar() or 0) + 1
+    sort_keys = iter(reserved)
+    # Rows are matched against earlier imports of the same log only
+    source = session["filename"][:255]
+    common = {
+        "case_id": case_id,
+        "version": version,
+        "created_by_id": current_user.id,
+        "import_source": source,
+    }
 
-    # Create events from valid rows
+    # Write valid rows one staged chunk at a time: one lookup of the
+    # chunk's fingerprints, then an upsert executemany of its new and
+    # changed rows, no ORM objects. Progress is recorded for the status
+    # route.
     created_count = 0
+    updated_count = 0
+    unchanged_count = 0
     error_count = 0
     errors: list[str] = []
+    row_number = 0
+    fingerprint = RowFingerprinter()
+    upsert = upsert_events(db.get_bind().dialect.name)
+    loop = asyncio.get_running_loop()
+    session["status"] = "confirming"
+    session["inserted_count"] = 0
 
-    for i, (is_valid, transformed) in enumerate(validated_rows):
-        if not is_valid:
-            continue
+    try:
+        chunks = await loop.run_in_executor(
+            None, partial(staging.chunk_paths, body.session_id, "validated")
+        )
+        for chunk in chunks:
+            rows = await loop.run_in_executor(None, partial(_read_chunk_list, chunk))
+            values: list[dict] = []
+            for is_valid, transformed, _ in rows:
+                row_number += 1
+                if not is_valid:
+                    continue
+                try:
+                    import_key, import_hash = fingerprint(transformed)
+                    values.append(
+                        {
+                            **_event_values(transformed),
+                            **common,
+                            "import_key": import_key,
+                            "import_hash": import_hash,
+                        }
+                    )
+                except (KeyError, TypeError, ValueError) as e:
+                    error_count += 1
+                    errors.append(f"Row {row_number}: {e}")
 
-        try:
-            event = Event(
-                case_id=case_id,
-                event_date=transformed["event_date"],
-                event_time=transformed.get("event_time"),
-                event_type=transformed.get("event_type", "note"),
-                file_name=transformed.get("file_name"),
-                file_count=transformed.get("file_count"),
-                file_description=transformed.get("file_description"),
-                file_type=transformed.get("file_type"),
-                metadata_={},
-                sort_order=next_sort,
-                created_by_id=current_user.id,
+            known = await existing_hashes(
+                db, case_id, source, [row["import_key"] for row in values]
+            )
+            writes: list[dict] = []
+            for row in values:
+                known_hash = known.get(row["import_key"])
+                if known_hash is None:
+                    # Updated events keep their place in the timeline
+                    row["sort_order"] = next(sort_keys)
+                    created_count += 1
+                elif known_hash != row["import_hash"]:
+                    updated_count += 1
+                else:
+                    unchanged_count += 1
+                    continue
+                writes.append(row)
+            if writes:
+                await db.execute(upsert, writes)
+            session["inserted_count"] = (
+                created_count + updated_count + unchanged_count
+            )
+            await loop.run_in_executor(
+                None, partial(staging.save, body.session_id, session)
             )
-            db.add(event)
-            next_sort += 1
-            created_count += 1
-        except Exception as e:
-            error_count += 1
-            errors.append(f"Row {i + 1}: {e}")
 
-    # Commit all events
-    try:
+        # Commit all events
+        await refresh_case_rollups(db, case_id)
         await db.commit()
     except Exception:
         await db.rollback()
+        session["status"] = "validated"
+        session["inserted_count"] = 0
+        await loop.run_in_executor(
+            None, partial(staging.save, body.session_id, session)
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to save imported events",
         )
 
     # Clean up session
-    _import_sessions.pop(body.session_id, None)
+    await loop.run_in_executor(None, partial(staging.delete, body.session_id))
 
     return ImportConfirmResponse(
         created_count=created_count,
+        updated_count=updated_count,
+        unchanged_count=unchanged_count,
         error_count=error_count,
         errors=errors,
     )
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.deps import get_current_user, get_db
+from src.http_cache import check_not_modified, weak_etag
 from src.models.user import User
 from src.schemas.user import UserRead
 
@@ -11,10 +12,16 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 @router.get("/", response_model=list[UserRead])
 async def list_users(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> list[UserRead]:
     """List all active users for assignment dropdowns."""
+    result = await db.execute(
+        select(func.count(), func.max(User.updated_at)).where(User.is_active == True)
+    )
+    check_not_modified(request, weak_etag("users", *result.one()))
+
     result = await db.execute(
         select(User).where(User.is_active == True).order_by(User.full_name)
     )
@@ -1,5 +1,5 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -35,6 +35,14 @@ class CaseRead(BaseModel):
     assigned_to: UserRead | None = None
     created_by_id: uuid.UUID
     created_by: UserRead | None = None
+    event_count: int = 0
+    finding_count: int = 0
+    action_count: int = 0
+    note_count: int = 0
+    batch_count: int = 0
+    file_total: int = 0
+    first_event_date: date | None = None
+    last_event_date: date | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -1,7 +1,8 @@
 import uuid
 from datetime import date, datetime, time
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from src.schemas.file_batch import FileBatchRead
 from src.schemas.user import UserRead
@@ -43,7 +44,12 @@ class EventRead(BaseModel):
     sort_order: int
     created_by_id: uuid.UUID
     created_by: UserRead | None = None
-    file_batches: list[FileBatchRead] = []
+    # Only embedded when requested with include=batches
+    file_batches: list[FileBatchRead] | None = Field(
+        default=None, validation_alias="loaded_file_batches"
+    )
+    batch_count: int = 0
+    batch_file_total: int = 0
     created_at: datetime
     updated_at: datetime
 
@@ -52,4 +58,70 @@ class EventRead(BaseModel):
 
 class EventListResponse(BaseModel):
     items: list[EventRead]
-    total: int
+    # Only on the first page; later pages (with a cursor) leave them null
+    total: int | None = None
+    counts_by_type: dict[str, int] | None = None
+    next_cursor: str | None = None
+    version: int = 0
+
+
+class EventHistogramBucket(BaseModel):
+    start: date
+    event_type: str | None = None
+    count: int
+
+
+class EventHistogramResponse(BaseModel):
+    bucket: str
+    items: list[EventHistogramBucket]
+
+
+class EventChangesResponse(BaseModel):
+    version: int
+    events: list[EventRead]
+    deleted_ids: list[uuid.UUID]
+
+
+class EventMove(BaseModel):
+    """Place an event directly after or before another event in its slot."""
+
+    after_id: uuid.UUID | None = None
+    before_id: uuid.UUID | None = None
+
+    @model_validator(mode="after")
+    def validate_single_anchor(self) -> "EventMove":
+        if (self.after_id is None) == (self.before_id is None):
+            raise ValueError("Exactly one of after_id or before_id is required")
+        return self
+
+
+class EventBatchCreate(BaseModel):
+    op: Literal["create"]
+    data: EventCreate
+
+
+class EventBatchUpdate(BaseModel):
+    op: Literal["update"]
+    id: uuid.UUID
+    data: EventUpdate
+
+
+class EventBatchDelete(BaseModel):
+    op: Literal["delete"]
+    id: uuid.UUID
+
+
+EventBatchOperation = Annotated[
+    EventBatchCreate | EventBatchUpdate | EventBatchDelete,
+    Field(discriminator="op"),
+]
+
+
+class EventBatchRequest(BaseModel):
+    operations: list[EventBatchOperation] = Field(min_length=1, max_length=1000)
+
+
+class EventBatchResponse(BaseModel):
+    created: list[EventRead]
+    updated: list[EventRead]
+    deleted: list[uuid.UUID]
@@ -20,6 +20,22 @@ class FileBatchUpdate(BaseModel):
     sort_order: int | None = None
 
 
+class FileBatchReplaceItem(BaseModel):
+    """One entry of a full batch list; ``id`` keeps an existing batch."""
+
+    id: uuid.UUID | None = None
+    label: str = Field(max_length=200)
+    file_count: int = Field(ge=0)
+    description: str | None = None
+    file_types: str | None = None
+
+
+class FileBatchReplace(BaseModel):
+    """The complete, ordered batch list of an event."""
+
+    batches: list[FileBatchReplaceItem] = Field(max_length=1000)
+
+
 class FileBatchRead(BaseModel):
     id: uuid.UUID
     event_id: uuid.UUID
@@ -1,6 +1,6 @@
 """Pydantic schemas for the data import flow."""
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -10,11 +10,37 @@ class ImportUploadResponse(BaseModel):
 
     session_id: str
     filename: str
+    status: Literal["parsing", "uploaded"] = Field(
+        description="'parsing' while the rest of the file is staged in the background"
+    )
     headers: list[str]
-    row_count: int
+    row_count: int | None = Field(
+        description="Rows in the file; None until parsing finishes"
+    )
     preview_rows: list[list[Any]] = Field(
         description="First 10 rows of parsed data"
     )
+    sheet_names: list[str] = Field(
+        default_factory=list, description="All worksheets in the workbook"
+    )
+
+
+class ChunkedUploadCreate(BaseModel):
+    """Start a chunked, resumable upload of an import file."""
+
+    filename: str = Field(min_length=1)
+    size: int = Field(gt=0, description="File size in bytes")
+
+
+class ChunkedUploadResponse(BaseModel):
+    """A chunked upload and the chunks received so far."""
+
+    upload_id: str
+    filename: str
+    size: int
+    chunk_size: int = Field(description="Bytes per chunk; the last may be shorter")
+    chunk_count: int
+    received_chunks: list[int]
 
 
 class ColumnMapping(BaseModel):
@@ -36,13 +62,33 @@ class ImportValidationRow(BaseModel):
 
 
 class ImportValidationResponse(BaseModel):
-    """Validation results for all rows after column mapping."""
+    """Validation summary after column mapping, with the first errors."""
 
     session_id: str
     total_rows: int
     valid_count: int
     error_count: int
-    rows: list[ImportValidationRow]
+    errors: list[ImportValidationRow] = Field(
+        description="First invalid rows; page through all rows via /rows"
+    )
+    date_formats: dict[str, str] = Field(
+        default_factory=dict,
+        description="Date format (strptime) inferred for each date column",
+    )
+    ambiguous_date_columns: list[str] = Field(
+        default_factory=list,
+        description="Date columns whose values read as both month-first "
+        "and day-first dates",
+    )
+
+
+class ImportRowsPage(BaseModel):
+    """A page of per-row validation results."""
+
+    items: list[ImportValidationRow]
+    total: int
+    offset: int
+    limit: int
 
 
 class ImportConfirmRequest(BaseModel):
@@ -52,8 +98,34 @@ class ImportConfirmRequest(BaseModel):
 
 
 class ImportConfirmResponse(BaseModel):
-    """Response after confirming the import."""
+    """Response after confirming the import.
 
-    created_count: int
+    Rows already imported into the case are matched by fingerprint:
+    changed ones update their event, the rest are skipped.
+    """
+
+    created_count: int = Field(description="New events created")
+    updated_count: int = Field(
+        default=0, description="Previously imported events whose row changed"
+    )
+    unchanged_count: int = Field(
+        default=0, description="Previously imported rows skipped as unchanged"
+    )
     error_count: int
     errors: list[str]
+
+
+class ImportStatusResponse(BaseModel):
+    """An import session's phase, polled while a long step runs."""
+
+    session_id: str
+    filename: str
+    status: Literal[
+        "receiving", "parsing", "failed", "uploaded", "validated", "confirming"
+    ]
+    row_count: int = Field(default=0, description="Rows staged so far while parsing")
+    error: str | None = Field(default=None, description="Why parsing failed")
+    valid_count: int | None = None
+    inserted_count: int = Field(
+        default=0, description="Valid rows written or skipped so far by confirm"
+    )
@@ -34,3 +34,4 @@ class DashboardStats(BaseModel):
     date_range_end: date | None = None
     events_by_type: dict[str, int] = {}
     events_by_date: dict[str, int] = {}
+    activity_bucket: str = "day"
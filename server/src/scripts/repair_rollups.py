@@ -0,0 +1,33 @@
+"""Recompute the timeline rollups of every case.
+
+Write paths keep the rollups current; run this after editing events or
+file batches outside the API, e.g. ``python -m src.scripts.repair_rollups``.
+"""
+
+import asyncio
+
+from sqlalchemy import select
+
+from src.database import async_session
+from src.models.case import Case
+from src.services.timeline_rollups import repair_rollups
+
+
+async def repair() -> None:
+    async with async_session() as session:
+        result = await session.execute(select(Case.id, Case.case_number))
+        cases = result.all()
+
+        repaired = 0
+        for case_id, case_number in cases:
+            if await repair_rollups(session, case_id):
+                repaired += 1
+                print(f"Repaired rollups of case #{case_number}")
+            # One short transaction per case keeps write paths unblocked
+            await session.commit()
+
+        print(f"Checked {len(cases)} cases, repaired {repaired}")
+
+
+if __name__ == "__main__":
+    asyncio.run(repair())
@@ -0,0 +1,149 @@
+"""Allocation and maintenance of per-case event sort keys.
+
+``sort_order`` only breaks ties between events sharing a date and time
+(a "slot"). Keys are handed out ``SORT_KEY_GAP`` apart so an event can be
+moved between two neighbours by writing the midpoint, touching one row.
+When a gap is exhausted only the affected slot is respread.
+"""
+
+import uuid
+from datetime import date, time
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.case import Case
+from src.models.event import Event
+
+SORT_KEY_GAP = 1024
+
+
+async def reserve_sort_orders(
+    db: AsyncSession, case_id: uuid.UUID, count: int = 1
+) -> range | None:
+    """Reserve ``count`` sort keys for a case, spaced ``SORT_KEY_GAP`` apart.
+
+    Increments the case's counter with a single ``UPDATE ... RETURNING``,
+    so allocation is O(1) and the row lock serializes concurrent writers
+    until their transaction ends. Returns the reserved keys, or None if
+    the case does not exist.
+    """
+    span = count * SORT_KEY_GAP
+    result = await db.execute(
+        update(Case)
+        .where(Case.id == case_id)
+        # Keep updated_at as-is: allocating a position isn't a case edit
+        .values(
+            next_sort_order=Case.next_sort_order + span,
+            updated_at=Case.updated_at,
+        )
+        .returning(Case.next_sort_order)
+        .execution_options(synchronize_session=False)
+    )
+    end = result.scalar_one_or_none()
+    if end is None:
+        return None
+    return range(end - span, end, SORT_KEY_GAP)
+
+
+def _slot_filter(case_id: uuid.UUID, event_date: date, event_time: time | None):
+    """Match events sharing a timeline slot (same case, date and time)."""
+    time_clause = (
+        Event.event_time.is_(None)
+        if event_time is None
+        else Event.event_time == event_time
+    )
+    return (Event.case_id == case_id, Event.event_date == event_date, time_clause)
+
+
+async def _neighbour_key(
+    db: AsyncSession, event: Event, anchor: Event, before: bool
+) -> int | None:
+    """Return the key on the far side of ``anchor`` from the move target.
+
+    Rows sharing the anchor's key (left by the old ``MAX() + 1`` allocator)
+    count as neighbours, so a tie comes back as the anchor's own key.
+    """
+    slot = _slot_filter(anchor.case_id, anchor.event_date, anchor.event_time)
+    if before:
+        query = select(func.max(Event.sort_order)).where(
+            *slot, Event.sort_order <= anchor.sort_order
+        )
+    else:
+        query = select(func.min(Event.sort_order)).where(
+            *slot, Event.sort_order >= anchor.sort_order
+        )
+    result = await db.execute(
+        query.where(Event.id != event.id, Event.id != anchor.id)
+    )
+    return result.scalar()
+
+
+async def respread_slot(
+    db: AsyncSession,
+    case_id: uuid.UUID,
+    event_date: date,
+    event_time: time | None,
+    exclude_id: uuid.UUID | None = None,
+    version: int | None = None,
+) -> None:
+    """Rewrite a slot's keys ``SORT_KEY_GAP`` apart, preserving their order.
+
+    If ``version`` is given the rewritten events are stamped with it, so
+    delta-syncing clients pick up their new keys.
+    """
+    query = (
+        select(Event.id, Event.sort_order)
+        .where(*_slot_filter(case_id, event_date, event_time))
+        .order_by(Event.sort_order.asc(), Event.id.asc())
+    )
+    if exclude_id is not None:
+        query = query.where(Event.id != exclude_id)
+    result = await db.execute(query)
+    rows = result.all()
+    if not rows:
+        return
+    base = rows[0].sort_order
+    stamp = {} if version is None else {"version": version}
+    await db.execute(
+        update(Event).execution_options(synchronize_session=False),
+        [
+            {"id": row.id, "sort_order": base + i * SORT_KEY_GAP, **stamp}
+            for i, row in enumerate(rows)
+        ],
+    )
+
+
+async def move_event(
+    db: AsyncSession,
+    event: Event,
+    anchor: Event,
+    before: bool,
+    version: int | None = None,
+) -> None:
+    """Give ``event`` a key directly before or after ``anchor`` in its slot.
+
+    Normally this writes only ``event.sort_order``. If the anchor and its
+    neighbour are adjacent integers, or tie on the same key, the slot is
+    respread first, so the cost of rebalancing is amortized over
+    ``log2(SORT_KEY_GAP)`` moves.
+    ``version`` stamps any events rewritten by a respread.
+    """
+    neighbour = await _neighbour_key(db, event, anchor, before)
+    if neighbour is not None and abs(anchor.sort_order - neighbour) < 2:
+        await respread_slot(
+            db,
+            anchor.case_id,
+            anchor.event_date,
+            anchor.event_time,
+            exclude_id=event.id,
+            version=version,
+        )
+        await db.refresh(anchor, ["sort_order"])
+        neighbour = await _neighbour_key(db, event, anchor, before)
+
+    if neighbour is None:
+        offset = -SORT_KEY_GAP if before else SORT_KEY_GAP
+        event.sort_order = anchor.sort_order + offset
+    else:
+        event.sort_order = (anchor.sort_order + neighbour) // 2
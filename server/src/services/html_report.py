@@ -1,6 +1,5 @@
 import logging
 import uuid
-from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -11,8 +10,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.models.case import Case
-from src.models.event import Event
+from src.models.event import Event, timeline_order
 from src.schemas.report import DashboardStats
+from src.services.timeline_stats import choose_bucket, event_histogram
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +36,12 @@ CHART_LAYOUT_DEFAULTS = dict(
     margin=dict(l=60, r=30, t=50, b=50),
 )
 
+ACTIVITY_TITLES = {
+    "day": "Daily Activity",
+    "week": "Weekly Activity",
+    "month": "Monthly Activity",
+}
+
 
 class HtmlReportService:
     """Service for generating self-contained interactive HTML reports."""
@@ -76,16 +82,20 @@ class HtmlReportService:
                 selectinload(Event.file_batches),
                 selectinload(Event.created_by),
             )
-            .order_by(
-                Event.event_date.asc(),
-                Event.event_time.asc().nulls_last(),
-                Event.sort_order.asc(),
-            )
+            .order_by(*timeline_order())
         )
         events = list(events_result.scalars().all())
 
-        # Compute dashboard stats
-        stats = self._compute_stats(events)
+        # Compute dashboard stats; activity is bucketed in SQL so long
+        # cases chart weeks or months instead of every single day
+        stats = self._compute_stats(case)
+        stats.activity_bucket = choose_bucket(
+            stats.date_range_start, stats.date_range_end
+        )
+        histogram = await event_histogram(db, case_id, stats.activity_bucket)
+        stats.events_by_date = {
+            start.isoformat(): count for start, _, count in histogram
+        }
 
         return {
             "case": case,
@@ -96,35 +106,20 @@ class HtmlReportService:
             ),
         }
 
-    def _compute_stats(self, events: list) -> DashboardStats:
-        """Compute dashboard statistics from events."""
-        if not events:
-            return DashboardStats()
-
-        total_file_batches = sum(len(e.file_batches) for e in events)
-        total_files_from_events = sum(e.file_count or 0 for e in events)
-        total_files_from_batches = sum(
-            b.file_count for e in events for b in e.file_batches
-        )
-        total_files = total_files_from_events + total_files_from_batches
-
-        dates = [e.event_date for e in events]
-        date_range_start = min(dates) if dates else None
-        date_range_end = max(dates) if dates else None
-
-        events_by_type = dict(Counter(e.event_type for e in events))
-        events_by_date = dict(
-            Counter(e.event_date.isoformat() for e in events)
-        )
-
+    def _compute_stats(self, case: Case) -> DashboardStats:
+        """Compute dashboard statistics from the case's timeline rollups."""
+        type_counts = {
+            "finding": case.finding_count,
+            "action": case.action_count,
+            "note": case.note_count,
+        }
         return DashboardStats(
-            total_events=len(events),
-            total_file_batches=total_file_batches,
-            total_files=total_files,
-            date_range_start=date_range_start,
-            date_range_end=date_range_end,
-            events_by_type=events_by_type,
-            events_by_date=events_by_date,
+            total_events=case.event_count,
+            total_file_batches=case.batch_count,
+            total_files=case.file_total,
+            date_range_start=case.first_event_date,
+            date_range_end=case.last_event_date,
+            events_by_type={t: n for t, n in type_counts.items() if n},
         )
 
     # ------------------------------------------------------------------
@@ -288,7 +283,7 @@ class HtmlReportService:
         )
 
     def _generate_daily_activity_chart(self, stats: DashboardStats) -> str:
-        """Generate a bar chart showing events per day.
+        """Generate a bar chart showing events per day, week or month.
 
         Uses include_plotlyjs=False since plotly.js is already loaded.
         """
@@ -320,7 +315,7 @@ class HtmlReportService:
             )
 
         fig.update_layout(
-            title="Daily Activity",
+            title=ACTIVITY_TITLES[stats.activity_bucket],
             xaxis=dict(title="Date", type="date", gridcolor="#f1f5f9"),
             yaxis=dict(title="Events", gridcolor="#f1f5f9"),
             height=300,
@@ -385,6 +380,7 @@ class HtmlReportService:
                 "events_by_type": stats.events_by_type,
                 "events_by_date": stats.events_by_date,
             },
+            "activity_title": ACTIVITY_TITLES[stats.activity_bucket],
             "events": data["events"],
             "metadata": case.metadata_ or {},
             "timeline_chart_html": data.get("timeline_chart_html", ""),
@@ -1,12 +1,15 @@
-"""File parsing service for Excel and CSV imports with encoding detection."""
+"""File parsing service for Excel and CSV imports."""
 
 import csv
+import io
+from collections.abc import Iterator
 from datetime import date, datetime, time
-from io import BytesIO, StringIO
+from io import BytesIO
+from typing import BinaryIO
 
-import chardet
 import openpyxl
 
+from src.services.csv_detect import detect_csv_format
 
 VALID_EVENT_FIELDS = {
     "event_type",
@@ -20,6 +23,11 @@ VALID_EVENT_FIELDS = {
 
 VALID_EVENT_TYPES = {"finding", "action", "note"}
 
+ISO_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Bytes read from the start of a CSV to detect its encoding and dialect
+CSV_SAMPLE_BYTES = 64 * 1024
+
 
 def normalize_cell_value(value: object) -> str | int | float | None:
     """Convert cell values to JSON-safe types."""
@@ -40,99 +48,156 @@ def normalize_cell_value(value: object) -> str | int | float | None:
     return str(value)
 
 
-def parse_excel(file_bytes: bytes) -> tuple[list[str], list[list]]:
-    """Parse an Excel (.xlsx) file and return headers and data rows.
+class RowLimitExceeded(ValueError):
+    """An import file has more data rows than the configured limit."""
+
+    def __init__(self, max_rows: int) -> None:
+        super().__init__(f"File has more than {max_rows} data rows")
+        self.max_rows = max_rows
+
+
+def _limit_rows(rows: Iterator[list], max_rows: int | None) -> Iterator[list]:
+    """Pass ``rows`` through, raising once more than ``max_rows`` are seen."""
+    if max_rows is None:
+        yield from rows
+        return
+    for count, row in enumerate(rows, 1):
+        if count > max_rows:
+            raise RowLimitExceeded(max_rows)
+        yield row
+
 
-    Uses read_only mode for memory efficiency and data_only to get
-    computed values instead of formulas.
+def iter_excel(
+    stream: BinaryIO, sheet: str | None = None
+) -> tuple[list[str], Iterator[list], list[str]]:
+    """Parse an Excel (.xlsx) workbook from a binary stream, row by row.
+
+    Uses read_only mode so openpyxl reads the sheet XML lazily, and
+    data_only to get computed values instead of formulas. Reads ``sheet``
+    (default: the active sheet). Returns the headers, an iterator over
+    the non-empty data rows with normalized cell values, and the names
+    of all sheets in the workbook.
     """
-    wb = openpyxl.load_workbook(
-        BytesIO(file_bytes), read_only=True, data_only=True
-    )
-    ws = wb.active
-    if ws is None:
+    wb = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+    sheet_names = wb.sheetnames
+    if sheet is None:
+        ws = wb.active
+    elif sheet in sheet_names:
+        ws = wb[sheet]
+    else:
         wb.close()
-        return [], []
+        raise ValueError(
+            f"Sheet '{sheet}' not found. Available sheets: {', '.join(sheet_names)}"
+        )
 
-    rows = list(ws.iter_rows(values_only=True))
-    wb.close()
-
-    if not rows:
-        return [], []
+    raw_rows = ws.iter_rows(values_only=True) if ws is not None else iter(())
+    first = next(raw_rows, None)
+    if first is None:
+        wb.close()
+        return [], iter(()), sheet_names
 
     # First row = headers
     headers = [
         str(h).strip() if h is not None else f"Column_{i}"
-        for i, h in enumerate(rows[0])
+        for i, h in enumerate(first)
     ]
 
-    # Remaining rows = data, filter out completely empty rows
-    data = []
-    for row in rows[1:]:
-        if any(cell is not None for cell in row):
-            normalized = [normalize_cell_value(cell) for cell in row]
-            data.append(normalized)
-
-    return headers, data
+    def rows() -> Iterator[list]:
+        try:
+            # Remaining rows = data, filter out completely empty rows
+            for row in raw_rows:
+                if any(cell is not None for cell in row):
+                    yield [normalize_cell_value(cell) for cell in row]
+        finally:
+            wb.close()
 
+    return headers, rows(), sheet_names
 
-def parse_csv(file_bytes: bytes) -> tuple[list[str], list[list]]:
-    """Parse a CSV file with automatic encoding and dialect detection.
 
-    Uses chardet for encoding detection and csv.Sniffer for delimiter
-    detection. Falls back to UTF-8 and standard CSV dialect on failure.
-    """
-    # Detect encoding
-    detected = chardet.detect(file_bytes[:10000])
-    encoding = detected.get("encoding", "utf-8") or "utf-8"
-    confidence = detected.get("confidence", 0.0) or 0.0
+def parse_excel(file_bytes: bytes) -> tuple[list[str], list[list]]:
+    """Parse an Excel file held in memory; see ``iter_excel``."""
+    headers, rows, _ = iter_excel(BytesIO(file_bytes))
+    return headers, list(rows)
 
-    # Fall back to UTF-8 for low confidence
-    if confidence < 0.5:
-        encoding = "utf-8"
 
-    try:
-        text = file_bytes.decode(encoding)
-    except (UnicodeDecodeError, LookupError):
-        text = file_bytes.decode("utf-8", errors="replace")
+def iter_csv(stream: BinaryIO) -> tuple[list[str], Iterator[list]]:
+    """Parse a CSV from a binary stream without loading it into memory.
 
-    # Strip BOM
-    if text.startswith("\ufeff"):
-        text = text[1:]
+    Encoding and dialect are detected from a head sample (see
+    ``csv_detect``); the stream is then rewound and decoded
+    incrementally, so rows are produced one at a time. Returns the
+    headers and an iterator over the non-empty data rows.
+    """
+    head = stream.read(CSV_SAMPLE_BYTES)
+    stream.seek(0)
+    encoding, dialect = detect_csv_format(
+        head, complete=len(head) < CSV_SAMPLE_BYTES
+    )
 
-    # Detect CSV dialect (delimiter, quoting)
-    try:
-        dialect = csv.Sniffer().sniff(text[:5000])
-    except csv.Error:
-        dialect = csv.excel  # type: ignore[assignment]
+    text = io.TextIOWrapper(stream, encoding=encoding, errors="replace", newline="")
+    reader = csv.reader(text, dialect)
+    header_row = next(reader, None)
+    if header_row is None:
+        text.detach()
+        return [], iter(())
 
-    reader = csv.reader(StringIO(text), dialect)
-    rows = list(reader)
+    # Strip a BOM the decoder left behind (e.g. one added twice by an export)
+    headers = [h.strip() for h in header_row]
+    if headers:
+        headers[0] = headers[0].lstrip("\ufeff")
 
-    if not rows:
-        return [], []
+    def rows() -> Iterator[list]:
+        try:
+            # Filter out empty rows
+            for row in reader:
+                if any(cell.strip() for cell in row):
+                    yield row
+        finally:
+            # Leave the caller's stream open. An abandoned generator may be
+            # finalized after the caller closed the stream, e.g. once an
+            # upload's background parse failed; then there is nothing to
+            # detach from
+            if not text.closed:
+                text.detach()
 
-    headers = [h.strip() for h in rows[0]]
+    return headers, rows()
 
-    # Filter out empty rows
-    data = []
-    for row in rows[1:]:
-        if any(cell.strip() for cell in row):
-            data.append(row)
 
-    return headers, data
+def parse_csv(file_bytes: bytes) -> tuple[list[str], list[list]]:
+    """Parse a CSV file held in memory; see ``iter_csv``."""
+    headers, rows = iter_csv(BytesIO(file_bytes))
+    return headers, list(rows)
+
+
+def iter_file(
+    filename: str,
+    stream: BinaryIO,
+    sheet: str | None = None,
+    max_rows: int | None = None,
+) -> tuple[list[str], Iterator[list], list[str]]:
+    """Route streaming file parsing based on extension.
+
+    Returns the headers, an iterator over the data rows (JSON-safe
+    values, at most ``max_rows`` of them) and the workbook's sheet names
+    (empty for CSV). ``sheet`` selects the worksheet of an Excel file.
+    """
+    ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if ext == "csv":
+        headers, rows = iter_csv(stream)
+        sheet_names: list[str] = []
+    elif ext in ("xlsx", "xls"):
+        headers, rows, sheet_names = iter_excel(stream, sheet)
+    else:
+        raise ValueError(f"Unsupported file type: .{ext}. Use .csv or .xlsx")
+    return headers, _limit_rows(rows, max_rows), sheet_names
 
 
 def parse_file(
     filename: str, file_bytes: bytes
 ) -> tuple[list[str], list[list]]:
     """Route file parsing based on extension."""
-    ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
-    if ext == "csv":
-        return parse_csv(file_bytes)
-    if ext in ("xlsx", "xls"):
-        return parse_excel(file_bytes)
-    raise ValueError(f"Unsupported file type: .{ext}. Use .csv or .xlsx")
+    headers, rows, _ = iter_file(filename, BytesIO(file_bytes))
+    return headers, list(rows)
 
 
 # --- Row validation for column mapping ---
@@ -151,8 +216,9 @@ def parse_date(value: object) -> date | None:
     if not s:
         return None
 
-    # Try ISO format first, then common formats
-    formats = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d"]
+    # Try ISO format first, then common formats; spreadsheet datetimes
+    # are staged as ISO timestamps
+    formats = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d", ISO_DATETIME_FORMAT]
     for fmt in formats:
         try:
             return datetime.strptime(s, fmt).date()
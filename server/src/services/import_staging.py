@@ -0,0 +1,248 @@
+"""Disk-backed staging of import data between upload, validate and confirm.
+
+Each import session is a directory under the staging root holding a
+small ``meta.json`` and its rows as compact JSON-lines chunk files
+(``rows-00000.jsonl``, ...). Workers keep nothing in memory between
+requests, so every uvicorn worker on the host sees every session; a
+multi-host deployment needs the staging root on a shared volume.
+
+The store enforces a global byte budget by evicting the least recently
+used sessions, and sessions expire ``ttl_seconds`` after their last use.
+Writes of ``meta.json`` are atomic (write then rename), so a concurrent
+reader never sees a partial file; ``lock`` serializes status changes that
+must not race, such as two requests completing one upload.
+"""
+
+import fcntl
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+
+from src.config import settings
+
+# Rows per chunk file; chunks are also the unit of parallel validation
+ROW_CHUNK_SIZE = 5000
+
+META_FILE = "meta.json"
+LOCK_FILE = ".lock"
+
+
+class StagingBudgetExceeded(Exception):
+    """A single import needs more space than the whole staging budget."""
+
+
+class ImportStagingStore:
+    """Import sessions stored as directories of JSON-lines chunks."""
+
+    def __init__(self, root: str | Path, max_bytes: int, ttl_seconds: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+    def _dir(self, session_id: str) -> Path | None:
+        # Session ids come from clients; only well-formed UUIDs map to paths
+        try:
+            return self.root / str(uuid.UUID(session_id))
+        except (ValueError, TypeError):
+            return None
+
+    def _write_meta(self, path: Path, meta: dict) -> None:
+        tmp = path / f".{META_FILE}.{uuid.uuid4().hex}"
+        tmp.write_text(json.dumps(meta, separators=(",", ":")))
+        os.replace(tmp, path / META_FILE)
+
+    def create(self, meta: dict) -> str:
+        """Start a session with ``meta`` and return its id."""
+        self.sweep()
+        session_id = str(uuid.uuid4())
+        path = self.root / session_id
+        path.mkdir(parents=True)
+        self._write_meta(path, {**meta, "created_at": time.time()})
+        return session_id
+
+    def load(self, session_id: str) -> dict | None:
+        """Return a session's metadata, or None if unknown or expired."""
+        path = self._dir(session_id)
+        if path is None:
+            return None
+        try:
+            meta = json.loads((path / META_FILE).read_text())
+            last_used = (path / META_FILE).stat().st_mtime
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if time.time() - last_used > self.ttl_seconds:
+            self.delete(session_id)
+            return None
+        # The meta file's mtime doubles as the LRU timestamp
+        os.utime(path / META_FILE)
+        return meta
+
+    def save(self, session_id: str, meta: dict) -> None:
+        """Replace a session's metadata."""
+        path = self._dir(session_id)
+        if path is None or not path.is_dir():
+            raise KeyError(session_id)
+        self._write_meta(path, meta)
+
+    @contextmanager
+    def lock(self, session_id: str) -> Iterator[dict]:
+        """Hold a session's lock and yield its metadata.
+
+        An ``flock`` on a file in the session's directory, so it holds
+        across threads and worker processes; a compare-and-set of the
+        status reads and saves the metadata under it. Raises KeyError if
+        the session is gone.
+        """
+        path = self._dir(session_id)
+        if path is None:
+            raise KeyError(session_id)
+        try:
+            fd = os.open(path / LOCK_FILE, os.O_CREAT | os.O_WRONLY)
+        except FileNotFoundError:
+            raise KeyError(session_id) from None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            meta = self.load(session_id)
+            if meta is None:
+                raise KeyError(session_id)
+            yield meta
+        finally:
+            os.close(fd)
+
+    def delete(self, session_id: str) -> None:
+        path = self._dir(session_id)
+        if path is not None:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def write_rows(
+        self,
+        session_id: str,
+        rows: Iterable[list],
+        name: str = "rows",
+        on_chunk: Callable[[int], None] | None = None,
+    ) -> int:
+        """Write ``rows`` as chunk files called ``name``; return the row count.
+
+        Rows are consumed lazily, so a generator is staged in bounded
+        memory. The budget is checked after each chunk, so an oversized
+        import stops within a chunk of the limit rather than filling the
+        disk first. Existing chunks of the same name are replaced.
+        ``on_chunk`` is called with the rows written so far after each
+        chunk.
+        """
+        self.clear_chunks(session_id, name)
+        count = 0
+        rows = iter(rows)
+        while chunk := list(islice(rows, ROW_CHUNK_SIZE)):
+            write_chunk(self.chunk_path(session_id, count // ROW_CHUNK_SIZE, name), chunk)
+            count += len(chunk)
+            self.check_budget(session_id)
+            if on_chunk is not None:
+                on_chunk(count)
+        return count
+
+    def chunk_path(self, session_id: str, index: int, name: str = "rows") -> Path:
+        """Path of a session's ``index``-th chunk file called ``name``."""
+        return self.file_path(session_id, f"{name}-{index:05d}.jsonl")
+
+    def file_path(self, session_id: str, filename: str) -> Path:
+        """Path of a file kept in a session's directory."""
+        path = self._dir(session_id)
+        if path is None or not path.is_dir():
+            raise KeyError(session_id)
+        return path / filename
+
+    def clear_chunks(self, session_id: str, name: str) -> None:
+        """Delete a session's chunk files called ``name``."""
+        for old in self.chunk_paths(session_id, name):
+            old.unlink()
+
+    def check_budget(self, session_id: str) -> None:
+        """Make room for a session that just grew; see ``_enforce_budget``."""
+        self._enforce_budget(keep=str(uuid.UUID(session_id)))
+
+    def chunk_paths(self, session_id: str, name: str = "rows") -> list[Path]:
+        """Return a session's chunk files called ``name``, in row order."""
+        path = self._dir(session_id)
+        if path is None:
+            return []
+        return sorted(path.glob(f"{name}-*.jsonl"))
+
+    def iter_rows(self, session_id: str, name: str = "rows") -> Iterator[list]:
+        """Yield the staged rows called ``name`` one at a time."""
+        for chunk in self.chunk_paths(session_id, name):
+            yield from read_chunk(chunk)
+
+    def _session_sizes(self) -> list[tuple[float, int, Path]]:
+        """(last used, bytes, path) for every session directory."""
+        sessions = []
+        if not self.root.is_dir():
+            return sessions
+        for path in self.root.iterdir():
+            try:
+                last_used = (path / META_FILE).stat().st_mtime
+                size = sum(f.stat().st_size for f in path.iterdir())
+            except FileNotFoundError:
+                # Half-created or concurrently deleted
+                continue
+            sessions.append((last_used, size, path))
+        return sessions
+
+    def _enforce_budget(self, keep: str) -> None:
+        """Evict least recently used sessions until under the byte budget."""
+        sessions = sorted(self._session_sizes())
+        if sum(size for _, size, path in sessions if path.name == keep) > self.max_bytes:
+            # Evicting everyone else would not make room; drop only this one
+            shutil.rmtree(self.root / keep, ignore_errors=True)
+            raise StagingBudgetExceeded(keep)
+        total = sum(size for _, size, _ in sessions)
+        for _, size, path in sessions:
+            if total <= self.max_bytes:
+                return
+            if path.name != keep:
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+
+    def sweep(self) -> None:
+        """Delete sessions unused for longer than the TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        for last_used, _, path in self._session_sizes():
+            if last_used < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def read_chunk(path: Path) -> Iterator[list]:
+    """Yield the rows of one chunk file."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def write_chunk(path: Path, rows: Iterable[list]) -> int:
+    """Write one chunk file; return its row count.
+
+    A plain function of the path, so worker processes can write the
+    chunks they produce without a store.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as out:
+        for row in rows:
+            out.write(json.dumps(row, separators=(",", ":"), default=str))
+            out.write("\n")
+            count += 1
+    return count
+
+
+staging = ImportStagingStore(
+    settings.IMPORT_STAGING_DIR
+    or Path(tempfile.gettempdir()) / "audittrail-imports",
+    max_bytes=settings.IMPORT_STAGING_MAX_BYTES,
+    ttl_seconds=settings.IMPORT_SESSION_TTL_SECONDS,
+)
@@ -0,0 +1,105 @@
+"""Idempotent re-import of rows already imported into a case.
+
+Every imported event records two fingerprints of its source row:
+
+- ``import_key`` identifies the row: a hash of when and what
+  (``KEY_FIELDS``), plus how many earlier rows of the same import had
+  the same values, so repeated identical rows stay distinct events.
+- ``import_hash`` is a hash of every mapped field, to tell whether a row
+  with a known key has changed.
+
+Keys are only matched within one source log, ``import_source`` (the
+uploaded file's name): ``(case_id, import_source, import_key)`` is
+unique, so confirm inserts rows with new keys, updates rows whose hash
+changed and skips the rest; re-importing a grown export of the same log
+only writes the new and edited rows, while a different log with rows at
+the same time and file name adds its own events. Events created by hand
+have no fingerprints.
+"""
+
+import hashlib
+import json
+import uuid
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import Insert
+
+from src.models.event import Event
+
+# Fields identifying a row; the others may change between exports
+KEY_FIELDS = ("event_date", "event_time", "file_name")
+HASH_FIELDS = (
+    "event_date",
+    "event_time",
+    "event_type",
+    "file_name",
+    "file_count",
+    "file_description",
+    "file_type",
+)
+
+# Columns an import may overwrite on an existing event; sort_order and
+# metadata stay as they are
+UPDATE_COLUMNS = (*HASH_FIELDS, "import_hash", "version")
+
+
+def _digest(values: list) -> str:
+    encoded = json.dumps(values, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class RowFingerprinter:
+    """Fingerprints the validated rows of one import, in file order."""
+
+    def __init__(self) -> None:
+        # Rows seen per key digest, to number repeated rows
+        self._seen: dict[str, int] = {}
+
+    def __call__(self, transformed: dict) -> tuple[str, str]:
+        """Return ``(import_key, import_hash)`` for a transformed row."""
+        row = {"event_type": "note", **transformed}
+        identity = _digest([row.get(field) for field in KEY_FIELDS])
+        occurrence = self._seen.get(identity, 0)
+        self._seen[identity] = occurrence + 1
+        return (
+            _digest([identity, occurrence]),
+            _digest([row.get(field) for field in HASH_FIELDS]),
+        )
+
+
+async def existing_hashes(
+    db: AsyncSession, case_id: uuid.UUID, source: str, keys: list[str]
+) -> dict[str, str]:
+    """The ``import_hash`` of each of ``keys`` already imported into a case
+    from ``source``."""
+    if not keys:
+        return {}
+    result = await db.execute(
+        select(Event.import_key, Event.import_hash).where(
+            Event.case_id == case_id,
+            Event.import_source == source,
+            Event.import_key.in_(keys),
+        )
+    )
+    return dict(result.tuples().all())
+
+
+def upsert_events(dialect_name: str) -> Insert:
+    """INSERT events, updating those whose key exists and hash differs.
+
+    ``ON CONFLICT`` has the same form in Postgres and SQLite, but each
+    dialect has its own construct. The conflict clause also covers a
+    concurrent import of the same rows.
+    """
+    dialect = sqlite if dialect_name == "sqlite" else postgresql
+    stmt = dialect.insert(Event)
+    return stmt.on_conflict_do_update(
+        index_elements=[Event.case_id, Event.import_source, Event.import_key],
+        set_={
+            **{column: stmt.excluded[column] for column in UPDATE_COLUMNS},
+            "updated_at": func.now(),
+        },
+        where=Event.import_hash != stmt.excluded.import_hash,
+    )
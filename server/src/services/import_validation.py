@@ -0,0 +1,317 @@
+"""Column-compiled validation of mapped import rows.
+
+``validate_and_transform_row`` resolves every mapped column by name and
+tries each date/time format in turn, for every row. ``compile_validator``
+does that work once per mapping: column indices are resolved up front,
+and each date and time column gets the format that best fits a sample
+of its values. Rows are then validated a chunk at a time, one column at
+a time, with a regex-based parser for the chosen format; only values
+that don't fit it go through the general ``parse_date``/``parse_time``.
+
+The results (validity, transformed data, error messages) are the same as
+``validate_and_transform_row`` except that a date column resolved as
+day-first reads every row day-first, where the per-value fallback would
+read ``03/04/2025`` month-first. Columns whose sample can't tell the two
+orders apart are reported as ambiguous.
+"""
+
+import re
+from collections.abc import Callable, Sequence
+from datetime import date, datetime, time
+from pathlib import Path
+
+from src.services.import_parser import (
+    ISO_DATETIME_FORMAT,
+    VALID_EVENT_TYPES,
+    parse_date,
+    parse_int,
+    parse_time,
+)
+from src.services.import_staging import read_chunk, write_chunk
+
+# Formats tried in the same priority as parse_date/parse_time
+DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d")
+TIME_FORMATS = ("%H:%M:%S", "%H:%M", "%I:%M %p", "%I:%M:%S %p")
+
+# Formats that read the same text with day and month swapped
+SWAPPED_DATE_FORMATS = {"%m/%d/%Y": "%d/%m/%Y", "%d/%m/%Y": "%m/%d/%Y"}
+
+# Values per column used to pick its format
+FORMAT_SAMPLE_SIZE = 1000
+
+# Fast parsers: a pattern and the order of its (year, month, day) or
+# (hour, minute, second) groups; strptime's digit counts are kept
+_DATE_PATTERNS = {
+    "%Y-%m-%d": (re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})"), (0, 1, 2)),
+    "%m/%d/%Y": (re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})"), (2, 0, 1)),
+    "%d/%m/%Y": (re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})"), (2, 1, 0)),
+    "%Y/%m/%d": (re.compile(r"(\d{4})/(\d{1,2})/(\d{1,2})"), (0, 1, 2)),
+}
+_TIME_PATTERNS = {
+    "%H:%M:%S": re.compile(r"(\d{1,2}):(\d{1,2}):(\d{1,2})"),
+    "%H:%M": re.compile(r"(\d{1,2}):(\d{1,2})"),
+}
+
+# Marks a column that sets nothing on a row
+_UNSET = object()
+
+
+def _date_parser(fmt: str) -> Callable[[str], date | None]:
+    pattern, order = _DATE_PATTERNS[fmt]
+    iso = fmt == "%Y-%m-%d"
+
+    def parse(s: str) -> date | None:
+        if iso and len(s) > 10 and s[10] == "T":
+            # Spreadsheet datetimes are staged as ISO timestamps
+            try:
+                return datetime.strptime(s, ISO_DATETIME_FORMAT).date()
+            except ValueError:
+                return None
+        match = pattern.fullmatch(s)
+        if match is None:
+            return None
+        parts = match.groups()
+        try:
+            return date(
+                int(parts[order[0]]), int(parts[order[1]]), int(parts[order[2]])
+            )
+        except ValueError:
+            return None
+
+    return parse
+
+
+def _time_parser(fmt: str) -> Callable[[str], time | None]:
+    pattern = _TIME_PATTERNS.get(fmt)
+    if pattern is None:
+        # 12-hour formats are rare enough to leave to strptime
+        return lambda s: parse_time(s)
+
+    def parse(s: str) -> time | None:
+        match = pattern.fullmatch(s)
+        if match is None:
+            return None
+        try:
+            return time(*(int(part) for part in match.groups()))
+        except ValueError:
+            return None
+
+    return parse
+
+
+def infer_date_format(values: Sequence[object]) -> tuple[str | None, bool]:
+    """Pick the date format matching most of ``values``.
+
+    Returns the format (None if nothing matched) and whether the choice
+    is ambiguous: every matched value reads as a valid date both
+    month-first and day-first, so the sample can't tell them apart.
+    """
+    samples = [str(v).strip() for v in values if v is not None and str(v).strip()]
+    counts = {
+        fmt: sum(1 for s in samples if _date_parser(fmt)(s) is not None)
+        for fmt in DATE_FORMATS
+    }
+    # max() keeps the first of equal counts, i.e. parse_date's priority
+    best = max(DATE_FORMATS, key=lambda fmt: counts[fmt])
+    if counts[best] == 0:
+        return None, False
+    swapped = SWAPPED_DATE_FORMATS.get(best)
+    return best, swapped is not None and counts[swapped] == counts[best]
+
+
+def infer_time_format(values: Sequence[object]) -> str | None:
+    """Pick the time format matching most of ``values`` (None if none)."""
+    samples = [str(v).strip() for v in values if v is not None and str(v).strip()]
+    counts = {
+        fmt: sum(1 for s in samples if _time_parser(fmt)(s) is not None)
+        for fmt in TIME_FORMATS
+    }
+    best = max(TIME_FORMATS, key=lambda fmt: counts[fmt])
+    return best if counts[best] else None
+
+
+class CompiledValidator:
+    """Validates rows for one column mapping; see ``compile_validator``."""
+
+    def __init__(
+        self,
+        columns: list[tuple[str, int | None, str]],
+        date_formats: dict[str, str],
+        time_formats: dict[str, str],
+        ambiguous_date_columns: list[str],
+    ) -> None:
+        # (column name, index or None if missing, event field)
+        self.columns = columns
+        self.date_formats = date_formats
+        self.time_formats = time_formats
+        self.ambiguous_date_columns = ambiguous_date_columns
+
+    def _parse_column(
+        self, name: str, field: str, raws: list
+    ) -> tuple[list, list[str | None]]:
+        """Parse one column; return its values and per-row errors."""
+        values: list = []
+        errors: list[str | None] = []
+
+        if field == "event_date":
+            fmt = self.date_formats.get(name)
+            fast = _date_parser(fmt) if fmt else None
+            for raw in raws:
+                parsed = None
+                if raw is not None:
+                    s = str(raw).strip()
+                    if fast is not None:
+                        parsed = fast(s)
+                    if parsed is None and s:
+                        parsed = parse_date(s)
+                if parsed is None:
+                    values.append(_UNSET)
+                    errors.append(f"Invalid date in column '{name}': {raw!r}")
+                else:
+                    values.append(parsed.isoformat())
+                    errors.append(None)
+
+        elif field == "event_time":
+            fmt = self.time_formats.get(name)
+            fast = _time_parser(fmt) if fmt else None
+            for raw in raws:
+                parsed = None
+                if raw is not None:
+                    s = str(raw).strip()
+                    if fast is not None:
+                        parsed = fast(s)
+                    if parsed is None and s:
+                        parsed = parse_time(s)
+                # Time is optional, no error if None
+                values.append(_UNSET if parsed is None else parsed.isoformat())
+                errors.append(None)
+
+        elif field == "event_type":
+            for raw in raws:
+                s = str(raw).strip().lower() if raw else ""
+                if s and s in VALID_EVENT_TYPES:
+                    values.append(s)
+                    errors.append(None)
+                elif s:
+                    values.append(_UNSET)
+                    errors.append(
+                        f"Invalid event type in column '{name}': "
+                        f"'{raw}'. Must be one of: "
+                        f"{', '.join(sorted(VALID_EVENT_TYPES))}"
+                    )
+                else:
+                    values.append(_UNSET)
+                    errors.append(None)
+
+        elif field == "file_count":
+            for raw in raws:
+                parsed_int = parse_int(raw)
+                if parsed_int is not None:
+                    values.append(parsed_int)
+                    errors.append(None)
+                elif raw is not None and str(raw).strip():
+                    values.append(_UNSET)
+                    errors.append(f"Invalid number in column '{name}': {raw!r}")
+                else:
+                    values.append(_UNSET)
+                    errors.append(None)
+
+        elif field in ("file_name", "file_description", "file_type"):
+            for raw in raws:
+                s = str(raw).strip() if raw is not None else ""
+                values.append(s if s else _UNSET)
+                errors.append(None)
+
+        else:
+            values = [_UNSET] * len(raws)
+            errors = [None] * len(raws)
+
+        return values, errors
+
+    def validate_rows(self, rows: Sequence[list]) -> list[tuple[bool, dict, list[str]]]:
+        """Validate a chunk of rows; results match validate_and_transform_row."""
+        parsed = []
+        for name, index, field in self.columns:
+            if index is None:
+                message = f"Column '{name}' not found in headers"
+                parsed.append((field, [_UNSET] * len(rows), [message] * len(rows)))
+                continue
+            raws = [row[index] if index < len(row) else None for row in rows]
+            parsed.append((field, *self._parse_column(name, field, raws)))
+
+        results = []
+        for i in range(len(rows)):
+            transformed: dict[str, object] = {}
+            errors: list[str] = []
+            for field, values, column_errors in parsed:
+                value = values[i]
+                if value is not _UNSET:
+                    transformed[field] = value
+                error = column_errors[i]
+                if error is not None:
+                    errors.append(error)
+
+            # event_date is required
+            if "event_date" not in transformed:
+                errors.append("Event date is required but missing or invalid")
+            results.append((not errors, transformed, errors))
+        return results
+
+
+def compile_validator(
+    headers: list[str],
+    mappings: dict[str, str],
+    sample_rows: Sequence[list] = (),
+) -> CompiledValidator:
+    """Resolve a mapping against ``headers`` and infer column formats.
+
+    ``sample_rows`` (e.g. the first rows of the file) are used to pick
+    the format of each date and time column.
+    """
+    positions = {name: i for i, name in reversed(list(enumerate(headers)))}
+    columns = [
+        (name, positions.get(name), field) for name, field in mappings.items()
+    ]
+
+    date_formats: dict[str, str] = {}
+    time_formats: dict[str, str] = {}
+    ambiguous: list[str] = []
+    sample = sample_rows[:FORMAT_SAMPLE_SIZE]
+    for name, index, field in columns:
+        if index is None or field not in ("event_date", "event_time"):
+            continue
+        values = [row[index] for row in sample if index < len(row)]
+        if field == "event_date":
+            fmt, is_ambiguous = infer_date_format(values)
+            if fmt is not None:
+                date_formats[name] = fmt
+            if is_ambiguous:
+                ambiguous.append(name)
+        else:
+            fmt = infer_time_format(values)
+            if fmt is not None:
+                time_formats[name] = fmt
+
+    return CompiledValidator(columns, date_formats, time_formats, ambiguous)
+
+
+def validate_chunk_file(
+    validator: CompiledValidator, source: Path, target: Path, max_errors: int
+) -> tuple[int, int, list[tuple[int, list[str], dict]]]:
+    """Validate one staged chunk, writing ``[valid, data, errors]`` rows.
+
+    Runs in an import worker process (see ``import_workers.map_chunks``),
+    so it returns only a summary: the chunk's row count, its valid row
+    count, and ``(index, errors, data)`` for its first ``max_errors``
+    invalid rows.
+    """
+    results = validator.validate_rows(list(read_chunk(source)))
+    write_chunk(target, (list(result) for result in results))
+    valid_count = 0
+    first_errors = []
+    for index, (is_valid, data, errors) in enumerate(results):
+        if is_valid:
+            valid_count += 1
+        elif len(first_errors) < max_errors:
+            first_errors.append((index, errors, data))
+    return len(results), valid_count, first_errors
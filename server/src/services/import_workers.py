@@ -0,0 +1,87 @@
+"""Worker pool and per-user admission for CPU-heavy import steps.
+
+Validation fans a session's staged chunks out to a process pool, so a
+large import uses several cores without holding the GIL of the API
+worker that serves everyone else. Parsing reads the upload's spooled
+temp file, which lives in the API process, so it stays on a thread.
+
+Each user may run ``IMPORT_MAX_CONCURRENT_PER_USER`` heavy import steps
+at a time (per API worker process); each step keeps at most
+``IMPORT_WORKERS`` chunks in flight, so concurrent imports share the
+pool instead of queueing behind one another.
+"""
+
+import asyncio
+import multiprocessing
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import TypeVar
+
+from src.config import settings
+
+R = TypeVar("R")
+
+_pool: ProcessPoolExecutor | None = None
+
+_active_imports: dict[uuid.UUID, int] = defaultdict(int)
+
+
+class ImportBusy(Exception):
+    """The user already has the maximum number of imports in progress."""
+
+
+def get_pool() -> Executor | None:
+    """The shared process pool, or None to run on the default executor."""
+    global _pool
+    if settings.IMPORT_WORKERS <= 0:
+        return None
+    if _pool is None:
+        # spawn: forking a process that runs threads is unsafe
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.IMPORT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+async def map_chunks(fn: Callable[..., R], jobs: Iterable[tuple]) -> list[R]:
+    """Call ``fn(*job)`` for each job in the pool; results in job order.
+
+    ``fn`` and its arguments must be picklable (module-level functions,
+    plain data). At most ``IMPORT_WORKERS`` jobs are in flight at once.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_pool()
+    window = asyncio.Semaphore(max(settings.IMPORT_WORKERS, 1))
+
+    async def run(job: tuple) -> R:
+        async with window:
+            return await loop.run_in_executor(pool, partial(fn, *job))
+
+    return await asyncio.gather(*(run(job) for job in jobs))
+
+
+@asynccontextmanager
+async def import_slot(user_id: uuid.UUID) -> AsyncIterator[None]:
+    """Hold one of the user's concurrent import slots, or raise ImportBusy."""
+    if _active_imports[user_id] >= settings.IMPORT_MAX_CONCURRENT_PER_USER:
+        raise ImportBusy(user_id)
+    _active_imports[user_id] += 1
+    try:
+        yield
+    finally:
+        _active_imports[user_id] -= 1
+        if not _active_imports[user_id]:
+            del _active_imports[user_id]
+
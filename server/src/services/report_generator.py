@@ -24,7 +24,7 @@ from sqlalchemy.orm import selectinload
 from weasyprint import HTML
 
 from src.models.case import Case
-from src.models.event import Event
+from src.models.event import Event, timeline_order
 from src.models.user import User
 
 # Template setup
@@ -76,11 +76,7 @@ async def collect_report_data(
             selectinload(Event.file_batches),
             selectinload(Event.created_by),
         )
-        .order_by(
-            Event.event_date.asc(),
-            Event.event_time.asc().nulls_last(),
-            Event.sort_order.asc(),
-        )
+        .order_by(*timeline_order())
     )
     events = events_result.scalars().all()
 
@@ -0,0 +1,128 @@
+"""Fan-out of timeline change notifications to subscribed clients.
+
+A trigger on ``cases`` (migration 011) sends ``pg_notify`` on
+``TIMELINE_CHANNEL`` whenever a case or its timeline changes; every
+event and file batch write bumps ``cases.timeline_version``, so one
+trigger covers all of them. Each worker holds a single asyncpg
+connection that LISTENs on the channel and copies each notification
+into the bounded queues of the clients subscribed to that case.
+Database connection usage is therefore constant per worker no matter
+how many clients are connected.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_CHANNEL = "timeline_changes"
+
+# Only the newest version matters to a client, so a slow reader just
+# loses older notifications rather than growing its queue
+QUEUE_SIZE = 8
+
+RECONNECT_DELAY_SECONDS = 5
+
+
+def _asyncpg_dsn(database_url: str) -> str:
+    """Convert a SQLAlchemy URL into a DSN asyncpg accepts."""
+    url = make_url(database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class TimelineBroadcaster:
+    """Per-worker LISTEN connection shared by all stream subscribers."""
+
+    def __init__(self, database_url: str, queue_size: int = QUEUE_SIZE) -> None:
+        self._dsn = _asyncpg_dsn(database_url)
+        self._queue_size = queue_size
+        self._subscribers: dict[uuid.UUID, set[asyncio.Queue]] = defaultdict(set)
+        self._conn: asyncpg.Connection | None = None
+        self._lock = asyncio.Lock()
+        self._reconnect_task: asyncio.Task | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    async def _ensure_listening(self) -> None:
+        """Open the LISTEN connection on first use (or after it was lost)."""
+        async with self._lock:
+            if self._conn is not None and not self._conn.is_closed():
+                return
+            conn = await asyncpg.connect(self._dsn)
+            await conn.add_listener(TIMELINE_CHANNEL, self._on_notify)
+            conn.add_termination_listener(self._on_terminate)
+            self._conn = conn
+
+    def _on_notify(self, conn, pid, channel, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            case_id = uuid.UUID(message["case_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed timeline notification: %r", payload)
+            return
+        self.publish(case_id, message)
+
+    def _on_terminate(self, conn) -> None:
+        logger.warning("Timeline LISTEN connection lost; reconnecting")
+        self._conn = None
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.get_running_loop().create_task(
+                self._reconnect()
+            )
+
+    async def _reconnect(self) -> None:
+        while self.subscriber_count:
+            try:
+                await self._ensure_listening()
+            except (OSError, asyncpg.PostgresError):
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                continue
+            # Notifications sent while disconnected are lost; tell every
+            # subscriber to catch up from its last version
+            for case_id in list(self._subscribers):
+                self.publish(case_id, {"case_id": str(case_id), "resync": True})
+            return
+
+    def publish(self, case_id: uuid.UUID, message: dict) -> None:
+        """Queue ``message`` for every subscriber of ``case_id``."""
+        for queue in self._subscribers.get(case_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    @asynccontextmanager
+    async def subscribe(self, case_id: uuid.UUID) -> AsyncIterator[asyncio.Queue]:
+        """Yield a queue receiving the notifications for one case."""
+        await self._ensure_listening()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers[case_id].add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers[case_id].discard(queue)
+            if not self._subscribers[case_id]:
+                del self._subscribers[case_id]
+
+    async def close(self) -> None:
+        """Close the LISTEN connection, e.g. on application shutdown."""
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._conn is not None and not self._conn.is_closed():
+            self._conn.remove_termination_listener(self._on_terminate)
+            await self._conn.close()
+        self._conn = None
+
+
+broadcaster = TimelineBroadcaster(settings.DATABASE_URL)
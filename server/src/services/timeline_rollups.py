@@ -0,0 +1,266 @@
+"""Denormalized totals for events and cases.
+
+``events.batch_count``/``batch_file_total`` summarise an event's file
+batches; the case columns (event counts per type, batch count, file
+total, first and last event date) summarise its timeline. Reads take
+them straight from the row instead of loading and summing every event.
+
+Each write path adjusts the rollups it affects in its own transaction,
+after its writes; sessions don't autoflush, so ORM writes are flushed
+first. Event writes pass the rollup inputs of the events they touch,
+before and after, to ``apply_case_rollup_delta``; batch writes move the
+case totals by the change in their event's totals. Either way the cost
+follows the rows written, not the size of the case. The first and last
+event dates are only looked up again when an event on one of them goes
+or moves, an index seek on the timeline index. Bulk imports recompute
+the case with ``refresh_case_rollups`` instead, and
+``python -m src.scripts.repair_rollups`` recomputes every case, e.g.
+after rows were edited by hand.
+"""
+
+import uuid
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from datetime import date
+from typing import NamedTuple
+
+from sqlalchemy import Date, case, func, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.case import Case
+from src.models.event import Event
+from src.models.file_batch import FileBatch
+
+# Event fields that feed the case rollups; other edits skip the refresh
+CASE_ROLLUP_FIELDS = frozenset({"event_type", "event_date", "file_count"})
+
+EVENT_TYPE_COLUMNS = {
+    "finding": Case.finding_count,
+    "action": Case.action_count,
+    "note": Case.note_count,
+}
+
+# Event columns the case rollups are computed from
+ROLLUP_INPUTS = (
+    Event.event_type,
+    Event.event_date,
+    Event.file_count,
+    Event.batch_count,
+    Event.batch_file_total,
+)
+
+
+class RollupInputs(NamedTuple):
+    """The ``ROLLUP_INPUTS`` of one event."""
+
+    event_type: str
+    event_date: date
+    file_count: int | None
+    batch_count: int = 0
+    batch_file_total: int = 0
+
+    @classmethod
+    def of(cls, event: Event) -> "RollupInputs":
+        return cls(*(getattr(event, column.key) for column in ROLLUP_INPUTS))
+
+
+def _event_rollup_values() -> dict:
+    """SET clauses recomputing an event's batch totals from its batches."""
+    return {
+        "batch_count": select(func.count())
+        .where(FileBatch.event_id == Event.id)
+        .scalar_subquery(),
+        "batch_file_total": select(func.coalesce(func.sum(FileBatch.file_count), 0))
+        .where(FileBatch.event_id == Event.id)
+        .scalar_subquery(),
+        # Rollups aren't edits; leave updated_at alone
+        "updated_at": Event.updated_at,
+    }
+
+
+async def refresh_event_rollups(
+    db: AsyncSession, event_ids: Iterable[uuid.UUID]
+) -> None:
+    """Recompute the batch count and file total of the given events."""
+    await db.execute(
+        update(Event)
+        .where(Event.id.in_(list(event_ids)))
+        .values(**_event_rollup_values())
+        # Expire the rollups of rows already loaded in this session
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+async def refresh_batch_rollups(
+    db: AsyncSession, case_id: uuid.UUID, event_id: uuid.UUID
+) -> None:
+    """Recompute an event's batch totals after a write to its batches.
+
+    The case totals first move by the difference between the event's
+    recomputed and stored totals, which only reads the event's batches.
+    """
+
+    def stored(column):
+        return select(column).where(Event.id == event_id).scalar_subquery()
+
+    def current(expression):
+        return (
+            select(expression).where(FileBatch.event_id == event_id).scalar_subquery()
+        )
+
+    await db.execute(
+        update(Case)
+        .where(Case.id == case_id)
+        .values(
+            batch_count=Case.batch_count
+            + current(func.count())
+            - stored(Event.batch_count),
+            file_total=Case.file_total
+            + current(func.coalesce(func.sum(FileBatch.file_count), 0))
+            - stored(Event.batch_file_total),
+            updated_at=Case.updated_at,
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+    await refresh_event_rollups(db, [event_id])
+
+
+def _date_bound(column, earliest: bool, removed: Counter, added: Counter):
+    """The new first (``earliest``) or last event date after a change.
+
+    Added dates can only extend the range. A removed date can only move
+    the bound it sits on, which is then looked up again; the lookup also
+    sees the added dates, as the writes are already flushed.
+    """
+    pick = min if earliest else max
+    value = column
+    if added:
+        edge = literal(pick(added), Date())
+        beyond = column > edge if earliest else column < edge
+        value = case((column.is_(None) | beyond, edge), else_=column)
+    if removed:
+        edge = pick(removed)
+        on_bound = column >= edge if earliest else column <= edge
+        lookup = (
+            select((func.min if earliest else func.max)(Event.event_date))
+            .where(Event.case_id == Case.id)
+            .scalar_subquery()
+        )
+        value = case((on_bound, lookup), else_=value)
+    return value
+
+
+async def apply_case_rollup_delta(
+    db: AsyncSession,
+    case_id: uuid.UUID,
+    removed: Sequence[RollupInputs],
+    added: Sequence[RollupInputs],
+) -> None:
+    """Adjust a case's totals for a write to some of its events.
+
+    ``removed`` holds the rollup inputs of deleted events and of changed
+    events before the change; ``added`` those of created events and of
+    changed events after it.
+    """
+    types = Counter(row.event_type for row in added)
+    types.subtract(row.event_type for row in removed)
+    batches = sum(row.batch_count for row in added) - sum(
+        row.batch_count for row in removed
+    )
+    files = sum((row.file_count or 0) + row.batch_file_total for row in added) - sum(
+        (row.file_count or 0) + row.batch_file_total for row in removed
+    )
+    # An event changed without moving cancels out of both
+    removed_dates = Counter(row.event_date for row in removed)
+    added_dates = Counter(row.event_date for row in added)
+    removed_dates, added_dates = (
+        removed_dates - added_dates,
+        added_dates - removed_dates,
+    )
+
+    await db.execute(
+        update(Case)
+        .where(Case.id == case_id)
+        .values(
+            event_count=Case.event_count + len(added) - len(removed),
+            **{
+                column.key: column + types[event_type]
+                for event_type, column in EVENT_TYPE_COLUMNS.items()
+            },
+            batch_count=Case.batch_count + batches,
+            file_total=Case.file_total + files,
+            first_event_date=_date_bound(
+                Case.first_event_date, True, removed_dates, added_dates
+            ),
+            last_event_date=_date_bound(
+                Case.last_event_date, False, removed_dates, added_dates
+            ),
+            # Timeline writes aren't case edits; leave updated_at alone
+            updated_at=Case.updated_at,
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+async def refresh_case_rollups(db: AsyncSession, case_id: uuid.UUID) -> None:
+    """Recompute a case's timeline totals from all of its events.
+
+    Scans the whole case, so it is for bulk imports and repairs; other
+    writes use ``apply_case_rollup_delta``. Each total is a scalar
+    subquery correlated to the case row. Event rollups must be current
+    first: the case file total includes ``events.batch_file_total``.
+    """
+
+    def aggregate(expression):
+        return select(expression).where(Event.case_id == Case.id).scalar_subquery()
+
+    await db.execute(
+        update(Case)
+        .where(Case.id == case_id)
+        .values(
+            event_count=aggregate(func.count()),
+            **{
+                column.key: aggregate(
+                    func.count().filter(Event.event_type == event_type)
+                )
+                for event_type, column in EVENT_TYPE_COLUMNS.items()
+            },
+            batch_count=aggregate(func.coalesce(func.sum(Event.batch_count), 0)),
+            file_total=aggregate(
+                func.coalesce(
+                    func.sum(func.coalesce(Event.file_count, 0) + Event.batch_file_total),
+                    0,
+                )
+            ),
+            first_event_date=aggregate(func.min(Event.event_date)),
+            last_event_date=aggregate(func.max(Event.event_date)),
+            # Timeline writes aren't case edits; leave updated_at alone
+            updated_at=Case.updated_at,
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+async def repair_rollups(db: AsyncSession, case_id: uuid.UUID) -> bool:
+    """Recompute every rollup of a case and its events.
+
+    Returns True if the stored case totals were wrong.
+    """
+    columns = (
+        Case.event_count,
+        *EVENT_TYPE_COLUMNS.values(),
+        Case.batch_count,
+        Case.file_total,
+        Case.first_event_date,
+        Case.last_event_date,
+    )
+    snapshot = select(*columns).where(Case.id == case_id)
+    before = (await db.execute(snapshot)).one_or_none()
+    await db.execute(
+        update(Event)
+        .where(Event.case_id == case_id)
+        .values(**_event_rollup_values())
+        .execution_options(synchronize_session="fetch")
+    )
+    await refresh_case_rollups(db, case_id)
+    return (await db.execute(snapshot)).one_or_none() != before
@@ -0,0 +1,87 @@
+"""SQL-side aggregation of case timelines for charts.
+
+Counting happens in the database with ``date_trunc`` and ``GROUP BY``,
+so a chart of a multi-year case transfers a few hundred buckets rather
+than every event row.
+"""
+
+import uuid
+from datetime import date
+from typing import Literal
+
+from sqlalchemy import Date, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from src.models.event import Event
+
+HistogramBucket = Literal["day", "week", "month"]
+
+BUCKET_UNITS = ("day", "week", "month")
+
+# Longest span (in days) charted with each bucket before moving up
+AUTO_BUCKET_LIMITS = (("day", 92), ("week", 2 * 366))
+
+
+class DateBucket(ColumnElement):
+    """Start date of the day, week (Monday) or month containing a date."""
+
+    type = Date()
+    inherit_cache = True
+    _traverse_internals = [
+        ("unit", InternalTraversal.dp_string),
+        ("column", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, unit: str, column) -> None:
+        if unit not in BUCKET_UNITS:
+            raise ValueError(f"Unsupported bucket: {unit}")
+        self.unit = unit
+        self.column = column
+
+
+@compiles(DateBucket)
+def _compile_date_bucket(element, compiler, **kw):
+    # The unit is rendered inline so SELECT and GROUP BY compile to the
+    # same expression (bind parameters would be distinct placeholders)
+    column = compiler.process(element.column, **kw)
+    return f"CAST(date_trunc('{element.unit}', CAST({column} AS TIMESTAMP)) AS DATE)"
+
+
+def choose_bucket(start: date | None, end: date | None) -> HistogramBucket:
+    """Pick the finest bucket that keeps a chart of ``start..end`` readable."""
+    if start is None or end is None:
+        return "day"
+    span = (end - start).days
+    for unit, limit in AUTO_BUCKET_LIMITS:
+        if span <= limit:
+            return unit
+    return "month"
+
+
+async def event_histogram(
+    db: AsyncSession,
+    case_id: uuid.UUID,
+    bucket: HistogramBucket,
+    by_type: bool = False,
+    filters: list | None = None,
+) -> list[tuple[date, str | None, int]]:
+    """Count a case's events per bucket, optionally split by event type.
+
+    Returns ``(bucket_start, event_type, count)`` rows in bucket order;
+    ``event_type`` is None unless ``by_type`` is set.
+    """
+    start = DateBucket(bucket, Event.event_date).label("start")
+    columns = [start, Event.event_type] if by_type else [start]
+    query = (
+        select(*columns, func.count())
+        .where(Event.case_id == case_id, *(filters or ()))
+        .group_by(*columns)
+        .order_by(*columns)
+    )
+    result = await db.execute(query)
+    if by_type:
+        return [(row[0], row[1], row[2]) for row in result]
+    return [(row[0], None, row[1]) for row in result]
@@ -0,0 +1,81 @@
+"""Per-case timeline versions for incremental (delta) sync.
+
+Every write to a case's events or file batches bumps
+``cases.timeline_version`` and stamps the touched events with the new
+value; deleted events leave an ``EventTombstone``. A client holding
+version ``v`` catches up by fetching events with ``version > v`` and
+tombstones with ``version > v``.
+
+The bump is an ``UPDATE`` on the case row, which holds its lock until
+the transaction ends, so versions become visible in increasing order.
+"""
+
+import uuid
+from collections.abc import Iterable
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.case import Case
+from src.models.event import Event
+from src.models.event_tombstone import EventTombstone
+
+
+async def bump_timeline_version(db: AsyncSession, case_id: uuid.UUID) -> int | None:
+    """Increment a case's timeline version and return the new value.
+
+    Returns None if the case does not exist, so callers can use this as
+    their case existence check.
+    """
+    result = await db.execute(
+        update(Case)
+        .where(Case.id == case_id)
+        # Timeline writes aren't case edits; leave updated_at alone
+        .values(
+            timeline_version=Case.timeline_version + 1,
+            updated_at=Case.updated_at,
+        )
+        .returning(Case.timeline_version)
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one_or_none()
+
+
+async def bump_timeline_version_or_404(db: AsyncSession, case_id: uuid.UUID) -> int:
+    """Start a timeline write: bump the case version, or raise 404.
+
+    Every write path bumps first, so the case row is always locked before
+    any event or batch row and concurrent writes can't deadlock.
+    """
+    version = await bump_timeline_version(db, case_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found",
+        )
+    return version
+
+
+async def touch_event(db: AsyncSession, event_id: uuid.UUID, version: int) -> None:
+    """Stamp an event with ``version`` after one of its batches changed."""
+    await db.execute(
+        update(Event)
+        .where(Event.id == event_id)
+        .values(version=version, updated_at=Event.updated_at)
+    )
+
+
+async def record_deletions(
+    db: AsyncSession,
+    case_id: uuid.UUID,
+    event_ids: Iterable[uuid.UUID],
+    version: int,
+) -> None:
+    """Write tombstones for deleted events in one executemany statement."""
+    rows = [
+        {"event_id": event_id, "case_id": case_id, "version": version}
+        for event_id in event_ids
+    ]
+    if rows:
+        await db.execute(insert(EventTombstone), rows)
@@ -14,6 +14,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 
 from datetime import date, time, datetime
 
+from src.config import settings
 from src.database import Base
 from src.deps import create_access_token, get_password_hash, get_db, get_current_user
 from src.main import app
@@ -21,6 +22,8 @@ from src.models.case import Case
 from src.models.event import Event
 from src.models.user import User
 from src.routers.auth import _login_attempts
+from src.services.import_staging import staging
+from src.services.timeline_stats import DateBucket
 
 # --- SQLite compatibility shims ---
 
@@ -30,6 +33,21 @@ def compile_jsonb_sqlite(type_, compiler, **kw):
     return "JSON"
 
 
+# date_trunc equivalent, registered as a SQL function on each connection
+def _date_bucket(unit: str, value: str) -> str:
+    day = date.fromisoformat(value)
+    if unit == "week":
+        day = date.fromordinal(day.toordinal() - day.weekday())
+    elif unit == "month":
+        day = day.replace(day=1)
+    return day.isoformat()
+
+
+@compiles(DateBucket, "sqlite")
+def compile_date_bucket_sqlite(element, compiler, **kw):
+    return f"date_bucket('{element.unit}', {compiler.process(element.column, **kw)})"
+
+
 # Auto-increment counter for case_number (Identity() doesn't work with SQLite)
 _case_number_counter = itertools.count(1)
 
@@ -64,6 +82,38 @@ engine = create_async_engine(TEST_DATABASE_URL, echo=False)
 TestSession = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+@sa_event.listens_for(engine.sync_engine, "connect")
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    dbapi_connection.create_function("date_bucket", 2, _date_bucket, deterministic=True)
+
+
+class QueryCounter:
+    """Records every SQL statement sent to the test database."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+
+@pytest.fixture
+def query_counter():
+    """Count SQL statements executed while the fixture is active."""
+    counter = QueryCounter()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        counter.statements.append(statement)
+
+    sa_event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    yield counter
+    sa_event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
 @pytest_asyncio.fixture(autouse=True)
 async def setup_database():
     """Create all tables before each test, drop after."""
@@ -75,6 +125,19 @@ async def setup_database():
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture(autouse=True)
+def import_staging(tmp_path, monkeypatch):
+    """Stage import sessions in a per-test directory."""
+    monkeypatch.setattr(staging, "root", tmp_path / "imports")
+    return staging
+
+
+@pytest.fixture(autouse=True)
+def inline_import_workers(monkeypatch):
+    """Validate imports on a thread rather than a spawned process pool."""
+    monkeypatch.setattr(settings, "IMPORT_WORKERS", 0)
+
+
 @pytest_asyncio.fixture
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """Provide a test database session."""
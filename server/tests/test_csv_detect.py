@@ -0,0 +1,95 @@
+"""Regression corpus for CSV encoding and dialect detection."""
+
+import pytest
+
+from src.services import csv_detect
+from src.services.csv_detect import (
+    DETECT_MAX_BYTES,
+    detect_csv_format,
+    detect_encoding,
+)
+
+
+def _long_quoted_fields() -> str:
+    return "a,b\n" + "".join(f'"{"x," * 400}",{i}\n' for i in range(40))
+
+
+def _many_unbalanced_quotes() -> str:
+    # Sniffer's quote regex backtracks on these: ~0.1s on 5 KB
+    return '"' + ',"'.join(["x"] * 1600) + "\n"
+
+
+# name -> (text, expected delimiter, expected columns)
+CORPUS = {
+    "comma": ("Date,Type,File\n2025-01-15,note,a.txt\n", ",", 3),
+    "semicolon": ("Date;Type\n2025-01-15;note\n2025-01-16;finding\n", ";", 2),
+    "tab": ("Date\tFile\n2025-01-15\ta.txt\n", "\t", 2),
+    "pipe": ("Date|File|Count\n2025-01-15|a.txt|3\n", "|", 3),
+    "single_column_date": ("Date\n2025-02-01\n2025-02-02\n", ",", 1),
+    "single_column_text": ("Notes\nCopied: a.txt\nDeleted - b.txt\n", ",", 1),
+    "decimal_commas": ("Name;Size\nx;1,5\ny;2,25\nz;3\n", ";", 2),
+    "quoted_delimiters": (
+        'Date,Description\n2025-01-15,"a; b; c"\n2025-01-16,"d; e"\n',
+        ",",
+        2,
+    ),
+    "quoted_newlines": ('Date,Notes\n2025-01-15,"line one\nline two"\n', ",", 2),
+    "ragged_rows": (
+        "Date,Type,File\n2025-01-15,note,a.txt\n2025-01-16,note\n2025-01-17,note,c.txt\n",
+        ",",
+        3,
+    ),
+    "space_after_comma": ("Date, Type\n2025-01-15, note\n", ",", 2),
+    "long_quoted_fields": (_long_quoted_fields(), ",", 2),
+    "many_unbalanced_quotes": (_many_unbalanced_quotes(), ",", 1601),
+}
+
+
+class TestCorpus:
+    @pytest.mark.parametrize("name", sorted(CORPUS))
+    def test_detects_delimiter(self, name):
+        text, delimiter, _ = CORPUS[name]
+        _, dialect = detect_csv_format(text.encode("utf-8"), complete=True)
+        assert dialect.delimiter == delimiter
+
+    def test_large_sample_is_truncated(self, monkeypatch):
+        samples = []
+        detect_dialect = csv_detect.detect_dialect
+
+        def spy(sample):
+            samples.append(sample)
+            return detect_dialect(sample)
+
+        monkeypatch.setattr(csv_detect, "detect_dialect", spy)
+        head = ("a;b\n" + "1;2\n" * 100_000).encode("utf-8")
+        _, dialect = detect_csv_format(head, complete=True)
+
+        assert dialect.delimiter == ";"
+        assert len(samples[0]) < DETECT_MAX_BYTES
+        # Cut back to the last complete line
+        assert samples[0].endswith("\n1;2")
+
+    def test_space_after_delimiter(self):
+        _, dialect = detect_csv_format(b"a, b\n1, 2\n", complete=True)
+        assert dialect.skipinitialspace
+
+    def test_incomplete_last_line_ignored(self):
+        head = ("a;b\n" + "1;2\n" * 10 + "3;4;5;6;7;8").encode("utf-8")
+        _, dialect = detect_csv_format(head)
+        assert dialect.delimiter == ";"
+
+
+class TestEncoding:
+    def test_bom(self):
+        assert detect_encoding("a,b".encode("utf-8-sig")) == "utf-8-sig"
+        assert detect_encoding("a,b".encode("utf-16")) == "utf-16"
+
+    def test_utf8_fast_path(self):
+        assert detect_encoding("café,日本\n".encode()) == "utf-8"
+
+    def test_utf8_cut_mid_character(self):
+        assert detect_encoding("café".encode()[:-1]) == "utf-8"
+
+    def test_legacy_encoding(self):
+        content = "name;city\nRenée;Zürich\nJosé;Málaga\n" * 20
+        assert detect_encoding(content.encode("cp1252")) != "utf-8"
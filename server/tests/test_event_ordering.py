@@ -0,0 +1,202 @@
+"""Tests for per-case sort_order allocation and moves."""
+
+import uuid
+from datetime import date, time
+
+from sqlalchemy import select
+
+from src.models.case import Case
+from src.models.event import Event
+from src.services.event_ordering import (
+    SORT_KEY_GAP,
+    move_event,
+    reserve_sort_orders,
+    respread_slot,
+)
+from tests.factories import make_audit_type, make_case, make_event
+
+
+async def _make_case(db_session, test_user) -> Case:
+    at = make_audit_type()
+    db_session.add(at)
+    await db_session.flush()
+    case = make_case(at.id, test_user.id)
+    db_session.add(case)
+    await db_session.commit()
+    return case
+
+
+class TestReserveSortOrders:
+    async def test_single_reservations_are_sequential(self, db_session, test_user):
+        case = await _make_case(db_session, test_user)
+
+        assert await reserve_sort_orders(db_session, case.id) == range(0, 1024, 1024)
+        assert (await reserve_sort_orders(db_session, case.id))[0] == 1024
+        assert (await reserve_sort_orders(db_session, case.id))[0] == 2048
+
+    async def test_block_reservations_do_not_overlap(self, db_session, test_user):
+        case = await _make_case(db_session, test_user)
+
+        first = await reserve_sort_orders(db_session, case.id, 100)
+        second = await reserve_sort_orders(db_session, case.id, 5)
+        assert len(first) == 100
+        assert first[0] == 0
+        assert second[0] == 100 * SORT_KEY_GAP
+        assert (await reserve_sort_orders(db_session, case.id))[0] == 105 * SORT_KEY_GAP
+
+    async def test_counters_are_per_case(self, db_session, test_user):
+        case_a = await _make_case(db_session, test_user)
+        case_b = await _make_case(db_session, test_user)
+
+        await reserve_sort_orders(db_session, case_a.id, 10)
+        assert (await reserve_sort_orders(db_session, case_b.id))[0] == 0
+
+    async def test_unknown_case(self, db_session):
+        assert await reserve_sort_orders(db_session, uuid.uuid4()) is None
+
+    async def test_does_not_touch_updated_at(self, db_session, test_user):
+        case = await _make_case(db_session, test_user)
+        before = (
+            await db_session.execute(select(Case.updated_at).where(Case.id == case.id))
+        ).scalar_one()
+
+        await reserve_sort_orders(db_session, case.id)
+
+        after = (
+            await db_session.execute(select(Case.updated_at).where(Case.id == case.id))
+        ).scalar_one()
+        assert after == before
+
+
+async def _make_slot(db_session, test_user, keys) -> list[Event]:
+    case = await _make_case(db_session, test_user)
+    events = [
+        make_event(
+            case.id,
+            test_user.id,
+            event_date=date(2025, 1, 10),
+            event_time=time(9, 0),
+            sort_order=key,
+        )
+        for key in keys
+    ]
+    db_session.add_all(events)
+    await db_session.commit()
+    return events
+
+
+async def _slot_order(db_session, case_id) -> list[uuid.UUID]:
+    result = await db_session.execute(
+        select(Event.id)
+        .where(Event.case_id == case_id)
+        .order_by(Event.sort_order, Event.id)
+    )
+    return list(result.scalars().all())
+
+
+class TestMoveEvent:
+    async def test_move_between_neighbours_uses_midpoint(self, db_session, test_user):
+        a, b, c = await _make_slot(db_session, test_user, [0, 1024, 2048])
+
+        await move_event(db_session, c, a, before=False)
+        await db_session.commit()
+
+        assert c.sort_order == 512
+        assert await _slot_order(db_session, a.case_id) == [a.id, c.id, b.id]
+
+    async def test_move_to_ends(self, db_session, test_user):
+        a, b, c = await _make_slot(db_session, test_user, [0, 1024, 2048])
+
+        await move_event(db_session, a, c, before=False)
+        await move_event(db_session, c, b, before=True)
+        await db_session.commit()
+
+        assert a.sort_order == 2048 + SORT_KEY_GAP
+        assert c.sort_order == 1024 - SORT_KEY_GAP
+        assert await _slot_order(db_session, a.case_id) == [c.id, b.id, a.id]
+
+    async def test_exhausted_gap_respreads_slot(self, db_session, test_user):
+        a, b, c = await _make_slot(db_session, test_user, [5, 6, 100])
+
+        await move_event(db_session, c, a, before=False)
+        await db_session.commit()
+
+        assert await _slot_order(db_session, a.case_id) == [a.id, c.id, b.id]
+        keys = (
+            await db_session.execute(
+                select(Event.sort_order)
+                .where(Event.case_id == a.case_id)
+                .order_by(Event.sort_order)
+            )
+        ).scalars().all()
+        assert keys[1] - keys[0] >= SORT_KEY_GAP // 2 - 1
+
+    async def test_move_after_tied_legacy_key(self, db_session, test_user):
+        a, b, c = await _make_slot(db_session, test_user, [7, 7, 8])
+        first, second = sorted([a, b], key=lambda e: e.id)
+
+        await move_event(db_session, c, first, before=False)
+        await db_session.commit()
+
+        assert await _slot_order(db_session, a.case_id) == [
+            first.id, c.id, second.id
+        ]
+
+    async def test_move_before_tied_legacy_key(self, db_session, test_user):
+        a, b, c = await _make_slot(db_session, test_user, [3, 5, 5])
+        first, second = sorted([b, c], key=lambda e: e.id)
+
+        await move_event(db_session, a, second, before=True)
+        await db_session.commit()
+
+        assert await _slot_order(db_session, a.case_id) == [
+            first.id, a.id, second.id
+        ]
+
+    async def test_repeated_moves_into_same_gap(self, db_session, test_user):
+        events = await _make_slot(
+            db_session, test_user, [i * SORT_KEY_GAP for i in range(20)]
+        )
+        first, second, rest = events[0], events[1], events[2:]
+
+        # Each move halves the gap after ``first``; far more than log2(GAP)
+        for event in reversed(rest):
+            await move_event(db_session, event, first, before=False)
+        await db_session.commit()
+
+        assert await _slot_order(db_session, first.case_id) == (
+            [first.id] + [e.id for e in rest] + [second.id]
+        )
+
+    async def test_respread_keeps_order(self, db_session, test_user):
+        a, _, _ = await _make_slot(db_session, test_user, [3, 4, 5])
+
+        await respread_slot(db_session, a.case_id, date(2025, 1, 10), time(9, 0))
+        await db_session.commit()
+
+        keys = (
+            await db_session.execute(
+                select(Event.sort_order)
+                .where(Event.case_id == a.case_id)
+                .order_by(Event.sort_order)
+            )
+        ).scalars().all()
+        assert keys == [3, 3 + SORT_KEY_GAP, 3 + 2 * SORT_KEY_GAP]
+
+    async def test_respread_stamps_version(self, db_session, test_user):
+        a, b, c = await _make_slot(db_session, test_user, [3, 4, 5])
+
+        await respread_slot(
+            db_session, a.case_id, date(2025, 1, 10), time(9, 0),
+            exclude_id=a.id, version=7,
+        )
+        await db_session.commit()
+
+        versions = dict(
+            (
+                await db_session.execute(
+                    select(Event.id, Event.version).where(Event.case_id == a.case_id)
+                )
+            ).all()
+        )
+        assert versions == {a.id: 0, b.id: 7, c.id: 7}
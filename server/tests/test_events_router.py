@@ -1,6 +1,7 @@
 """Integration tests for events router."""
 
 import uuid
+from datetime import date
 
 import pytest
 
@@ -84,6 +85,168 @@ class TestListEvents:
         # Should be sorted chronologically
         assert data["items"][0]["event_date"] == "2025-01-10"
         assert data["items"][1]["event_date"] == "2025-01-20"
+        assert data["counts_by_type"] == {"note": 2}
+        assert data["next_cursor"] is None
+
+    async def test_list_events_cursor_pagination(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+
+        from datetime import date, time
+
+        events = [
+            make_event(case.id, test_user.id, event_date=date(2025, 1, 10), event_time=None, sort_order=0),
+            make_event(case.id, test_user.id, event_date=date(2025, 1, 10), event_time=time(9, 0), sort_order=1),
+            make_event(case.id, test_user.id, event_date=date(2025, 1, 10), event_time=time(9, 0), sort_order=2),
+            make_event(case.id, test_user.id, event_date=date(2025, 1, 11), event_type="finding", sort_order=3),
+            make_event(case.id, test_user.id, event_date=date(2025, 1, 12), event_time=None, sort_order=4),
+        ]
+        db_session.add_all(events)
+        await db_session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await authenticated_client.get(
+                f"/cases/{case.id}/events/", params=params
+            )
+            assert response.status_code == 200
+            data = response.json()
+            if cursor is None:
+                assert data["total"] == 5
+                assert data["counts_by_type"] == {"note": 4, "finding": 1}
+            else:
+                # Counted once, on the first page
+                assert data["total"] is None
+                assert data["counts_by_type"] is None
+            seen.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        # Timed events precede untimed ones within a day
+        expected = [events[1], events[2], events[0], events[3], events[4]]
+        assert seen == [str(e.id) for e in expected]
+
+    async def test_list_events_date_window(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+
+        from datetime import date
+
+        for day in (5, 10, 15, 20):
+            db_session.add(make_event(case.id, test_user.id, event_date=date(2025, 1, day)))
+        await db_session.commit()
+
+        response = await authenticated_client.get(
+            f"/cases/{case.id}/events/",
+            params={"from": "2025-01-10", "to": "2025-01-15"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert [i["event_date"] for i in data["items"]] == ["2025-01-10", "2025-01-15"]
+
+    async def test_list_events_invalid_cursor(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        response = await authenticated_client.get(
+            f"/cases/{case.id}/events/", params={"cursor": "not-a-cursor"}
+        )
+        assert response.status_code == 400
+
+    async def _seed_filterable(self, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+        db_session.add_all([
+            make_event(case.id, test_user.id, event_type="finding", file_name="invoice_2025.pdf", file_type="pdf", sort_order=0),
+            make_event(case.id, test_user.id, event_type="finding", file_description="Duplicate invoice found", file_type="xlsx", sort_order=1),
+            make_event(case.id, test_user.id, event_type="note", file_name="invoice_notes.txt", file_type="pdf", sort_order=2),
+            make_event(case.id, test_user.id, event_type="action", file_name="contract.pdf", file_type="pdf", sort_order=3),
+        ])
+        await db_session.commit()
+        return case
+
+    async def test_list_events_filters(self, authenticated_client, db_session, test_user):
+        case = await self._seed_filterable(db_session, test_user)
+
+        response = await authenticated_client.get(
+            f"/cases/{case.id}/events/",
+            params={"q": "invoice", "event_type": ["finding", "action"]},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert {i["event_type"] for i in data["items"]} == {"finding"}
+        # Type facets ignore the event_type filter
+        assert data["counts_by_type"] == {"finding": 2, "note": 1}
+
+        response = await authenticated_client.get(
+            f"/cases/{case.id}/events/", params={"file_type": "pdf", "q": "invoice"}
+        )
+        assert [i["file_name"] for i in response.json()["items"]] == [
+            "invoice_2025.pdf", "invoice_notes.txt"
+        ]
+
+    async def test_search_matches_partial_names(self, authenticated_client, db_session, test_user):
+        case = await self._seed_filterable(db_session, test_user)
+        url = f"/cases/{case.id}/events/"
+
+        async def names(q):
+            response = await authenticated_client.get(url, params={"q": q})
+            assert response.status_code == 200
+            return [i["file_name"] for i in response.json()["items"]]
+
+        # Inside words, across case, and every word must match
+        assert await names("VOIC") == ["invoice_2025.pdf", None, "invoice_notes.txt"]
+        assert await names("_2025.p") == ["invoice_2025.pdf"]
+        assert await names("invoice notes") == ["invoice_notes.txt"]
+        # LIKE wildcards in the query are taken literally
+        assert await names("%") == []
+        assert await names("t_pdf") == []
+
+    async def test_list_events_filtered_pagination(self, authenticated_client, db_session, test_user):
+        case = await self._seed_filterable(db_session, test_user)
+        url = f"/cases/{case.id}/events/"
+
+        first = (await authenticated_client.get(url, params={"q": "invoice", "limit": 2})).json()
+        assert first["total"] == 3
+        assert first["next_cursor"] is not None
+        second = (
+            await authenticated_client.get(
+                url, params={"q": "invoice", "limit": 2, "cursor": first["next_cursor"]}
+            )
+        ).json()
+        assert second["next_cursor"] is None
+        assert len(first["items"]) + len(second["items"]) == 3
+
+    async def test_list_events_invalid_type_filter(self, authenticated_client, db_session, test_user):
+        case = await self._seed_filterable(db_session, test_user)
+
+        response = await authenticated_client.get(
+            f"/cases/{case.id}/events/", params={"event_type": "bogus"}
+        )
+        assert response.status_code == 422
 
 
 class TestGetEvent:
@@ -105,6 +268,32 @@ class TestGetEvent:
         assert response.status_code == 200
         assert response.json()["id"] == str(event.id)
 
+    async def test_get_event_batch_expansion(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+        event = make_event(case.id, test_user.id)
+        db_session.add(event)
+        await db_session.commit()
+        url = f"/cases/{case.id}/events/{event.id}"
+        await authenticated_client.put(f"{url}/batches/", json={"batches": [
+            {"label": "Scans", "file_count": 3},
+            {"label": "Mail", "file_count": 4},
+        ]})
+
+        data = (await authenticated_client.get(url)).json()
+        assert data["file_batches"] is None
+        assert (data["batch_count"], data["batch_file_total"]) == (2, 7)
+
+        data = (await authenticated_client.get(url, params={"include": "batches"})).json()
+        assert [b["label"] for b in data["file_batches"]] == ["Scans", "Mail"]
+
+        response = await authenticated_client.get(url, params={"include": "bogus"})
+        assert response.status_code == 422
+
     async def test_get_event_not_found(self, authenticated_client, db_session, test_user):
         at = make_audit_type()
         db_session.add(at)
@@ -139,6 +328,24 @@ class TestUpdateEvent:
         assert response.status_code == 200
         assert response.json()["event_type"] == "finding"
 
+    async def test_update_event_rejects_null_date(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+
+        event = make_event(case.id, test_user.id)
+        db_session.add(event)
+        await db_session.commit()
+
+        response = await authenticated_client.patch(
+            f"/cases/{case.id}/events/{event.id}",
+            json={"event_date": None},
+        )
+        assert response.status_code == 422
+
 
 class TestDeleteEvent:
     async def test_delete_event(self, authenticated_client, db_session, test_user):
@@ -172,6 +379,334 @@ class TestDeleteEvent:
         assert response.status_code == 404
 
 
+class TestBatchEvents:
+    async def test_batch_create_update_delete(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+
+        keep = make_event(case.id, test_user.id, event_type="note", sort_order=0)
+        doomed = make_event(case.id, test_user.id, sort_order=1)
+        db_session.add_all([keep, doomed])
+        await db_session.commit()
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/events:batch",
+            json={
+                "operations": [
+                    {"op": "create", "data": {"event_type": "finding", "event_date": "2025-02-01"}},
+                    {"op": "create", "data": {"event_date": "2025-02-02", "file_name": "b.pdf"}},
+                    {"op": "update", "id": str(keep.id), "data": {"event_type": "action", "metadata": {"k": "v"}}},
+                    {"op": "delete", "id": str(doomed.id)},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [e["event_type"] for e in data["created"]] == ["finding", "note"]
+        assert [e["sort_order"] for e in data["created"]] == [0, 1024]
+        assert data["updated"][0]["event_type"] == "action"
+        assert data["updated"][0]["metadata"] == {"k": "v"}
+        assert data["deleted"] == [str(doomed.id)]
+
+        listing = (await authenticated_client.get(f"/cases/{case.id}/events/")).json()
+        assert listing["total"] == 3
+        assert str(doomed.id) not in {e["id"] for e in listing["items"]}
+
+    async def test_batch_invalid_operation_writes_nothing(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/events:batch",
+            json={
+                "operations": [
+                    {"op": "create", "data": {"event_date": "2025-02-01"}},
+                    {"op": "create", "data": {"event_type": "bogus", "event_date": "2025-02-01"}},
+                ]
+            },
+        )
+        assert response.status_code == 422
+
+        listing = (await authenticated_client.get(f"/cases/{case.id}/events/")).json()
+        assert listing["total"] == 0
+
+    async def test_batch_rejects_null_for_required_fields(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+        event = make_event(case.id, test_user.id)
+        db_session.add(event)
+        await db_session.commit()
+
+        for field in ("event_type", "event_date"):
+            response = await authenticated_client.post(
+                f"/cases/{case.id}/events:batch",
+                json={
+                    "operations": [
+                        {"op": "create", "data": {"event_date": "2025-02-01"}},
+                        {"op": "update", "id": str(event.id), "data": {field: None}},
+                    ]
+                },
+            )
+            assert response.status_code == 422
+            assert response.json()["detail"] == f"{field} cannot be null"
+
+        listing = (await authenticated_client.get(f"/cases/{case.id}/events/")).json()
+        assert listing["total"] == 1
+        assert listing["items"][0]["event_type"] == event.event_type
+
+    async def test_batch_unknown_event(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/events:batch",
+            json={"operations": [{"op": "delete", "id": str(uuid.uuid4())}]},
+        )
+        assert response.status_code == 404
+
+
+class TestMoveEvent:
+    async def _seed(self, db_session, test_user, **last_overrides):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+        events = [
+            make_event(case.id, test_user.id, sort_order=0),
+            make_event(case.id, test_user.id, sort_order=1024),
+            make_event(case.id, test_user.id, sort_order=2048, **last_overrides),
+        ]
+        db_session.add_all(events)
+        await db_session.commit()
+        return case, events
+
+    async def test_move_after(self, authenticated_client, db_session, test_user):
+        case, (a, b, c) = await self._seed(db_session, test_user)
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/events/{c.id}/move", json={"after_id": str(a.id)}
+        )
+        assert response.status_code == 200
+        assert response.json()["sort_order"] == 512
+
+        listing = (await authenticated_client.get(f"/cases/{case.id}/events/")).json()
+        assert [e["id"] for e in listing["items"]] == [str(a.id), str(c.id), str(b.id)]
+
+    async def test_move_before(self, authenticated_client, db_session, test_user):
+        case, (a, b, c) = await self._seed(db_session, test_user)
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/events/{c.id}/move", json={"before_id": str(a.id)}
+        )
+        assert response.status_code == 200
+
+        listing = (await authenticated_client.get(f"/cases/{case.id}/events/")).json()
+        assert [e["id"] for e in listing["items"]] == [str(c.id), str(a.id), str(b.id)]
+
+    async def test_move_requires_one_anchor(self, authenticated_client, db_session, test_user):
+        case, (a, b, c) = await self._seed(db_session, test_user)
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/events/{c.id}/move",
+            json={"after_id": str(a.id), "before_id": str(b.id)},
+        )
+        assert response.status_code == 422
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/events/{c.id}/move", json={}
+        )
+        assert response.status_code == 422
+
+    async def test_move_across_slots_rejected(self, authenticated_client, db_session, test_user):
+        case, (a, _, c) = await self._seed(
+            db_session, test_user, event_date=date(2025, 1, 16)
+        )
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/events/{c.id}/move", json={"after_id": str(a.id)}
+        )
+        assert response.status_code == 422
+
+    async def test_move_unknown_anchor(self, authenticated_client, db_session, test_user):
+        case, (_, _, c) = await self._seed(db_session, test_user)
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/events/{c.id}/move",
+            json={"after_id": str(uuid.uuid4())},
+        )
+        assert response.status_code == 404
+
+
+class TestEventChanges:
+    async def _seed(self, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+        return case
+
+    async def _changes(self, client, case_id, since, **params):
+        response = await client.get(
+            f"/cases/{case_id}/events/changes", params={"since": since, **params}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    async def test_changes_since_listing(self, authenticated_client, db_session, test_user):
+        case = await self._seed(db_session, test_user)
+        base = f"/cases/{case.id}/events"
+        kept = (await authenticated_client.post(f"{base}/", json={"event_date": "2025-01-15"})).json()
+        doomed = (await authenticated_client.post(f"{base}/", json={"event_date": "2025-01-16"})).json()
+
+        listing = (await authenticated_client.get(f"{base}/")).json()
+        version = listing["version"]
+        assert version == 2
+
+        created = (await authenticated_client.post(f"{base}/", json={"event_date": "2025-01-17"})).json()
+        await authenticated_client.delete(f"{base}/{doomed['id']}")
+
+        changes = await self._changes(authenticated_client, case.id, version)
+        assert changes["version"] == version + 2
+        assert [e["id"] for e in changes["events"]] == [created["id"]]
+        assert changes["deleted_ids"] == [doomed["id"]]
+        assert kept["id"] not in {e["id"] for e in changes["events"]}
+
+    async def test_batch_write_resends_parent_event(self, authenticated_client, db_session, test_user):
+        case = await self._seed(db_session, test_user)
+        base = f"/cases/{case.id}/events"
+        event = (await authenticated_client.post(f"{base}/", json={"event_date": "2025-01-15"})).json()
+        version = (await authenticated_client.get(f"{base}/")).json()["version"]
+
+        await authenticated_client.post(
+            f"{base}/{event['id']}/batches/", json={"label": "Scans", "file_count": 3}
+        )
+
+        changes = await self._changes(authenticated_client, case.id, version)
+        assert [e["id"] for e in changes["events"]] == [event["id"]]
+        assert changes["events"][0]["batch_count"] == 1
+        assert changes["events"][0]["file_batches"] is None
+
+        changes = await self._changes(
+            authenticated_client, case.id, version, include="batches"
+        )
+        assert [b["label"] for b in changes["events"][0]["file_batches"]] == ["Scans"]
+
+    async def test_up_to_date_client_gets_nothing(self, authenticated_client, db_session, test_user):
+        case = await self._seed(db_session, test_user)
+        await authenticated_client.post(
+            f"/cases/{case.id}/events/", json={"event_date": "2025-01-15"}
+        )
+
+        changes = await self._changes(authenticated_client, case.id, 1)
+        assert changes == {"version": 1, "events": [], "deleted_ids": []}
+
+    async def test_version_ahead_of_server(self, authenticated_client, db_session, test_user):
+        case = await self._seed(db_session, test_user)
+
+        response = await authenticated_client.get(
+            f"/cases/{case.id}/events/changes", params={"since": 5}
+        )
+        assert response.status_code == 409
+
+    async def test_changes_unknown_case(self, authenticated_client):
+        response = await authenticated_client.get(
+            f"/cases/{uuid.uuid4()}/events/changes", params={"since": 0}
+        )
+        assert response.status_code == 404
+
+
+class TestEventHistogram:
+    async def _seed(self, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+        # 2025-03-03 is a Monday
+        db_session.add_all([
+            make_event(case.id, test_user.id, event_type="finding", event_date=date(2025, 3, 3), file_name="invoice.pdf"),
+            make_event(case.id, test_user.id, event_type="note", event_date=date(2025, 3, 3), sort_order=1),
+            make_event(case.id, test_user.id, event_type="finding", event_date=date(2025, 3, 9)),
+            make_event(case.id, test_user.id, event_type="action", event_date=date(2025, 4, 2)),
+        ])
+        await db_session.commit()
+        return case
+
+    async def _histogram(self, client, case_id, **params):
+        response = await client.get(f"/cases/{case_id}/events/histogram", params=params)
+        assert response.status_code == 200
+        return response.json()
+
+    async def test_daily_buckets(self, authenticated_client, db_session, test_user):
+        case = await self._seed(db_session, test_user)
+
+        data = await self._histogram(authenticated_client, case.id)
+        assert data["bucket"] == "day"
+        assert [(i["start"], i["count"]) for i in data["items"]] == [
+            ("2025-03-03", 2), ("2025-03-09", 1), ("2025-04-02", 1)
+        ]
+
+    async def test_weekly_and_monthly_buckets(self, authenticated_client, db_session, test_user):
+        case = await self._seed(db_session, test_user)
+
+        weekly = await self._histogram(authenticated_client, case.id, bucket="week")
+        assert [(i["start"], i["count"]) for i in weekly["items"]] == [
+            ("2025-03-03", 3), ("2025-03-31", 1)
+        ]
+        monthly = await self._histogram(authenticated_client, case.id, bucket="month")
+        assert [(i["start"], i["count"]) for i in monthly["items"]] == [
+            ("2025-03-01", 3), ("2025-04-01", 1)
+        ]
+
+    async def test_split_by_type_with_filters(self, authenticated_client, db_session, test_user):
+        case = await self._seed(db_session, test_user)
+
+        data = await self._histogram(
+            authenticated_client, case.id, bucket="month", by="type", to="2025-03-31"
+        )
+        assert [(i["start"], i["event_type"], i["count"]) for i in data["items"]] == [
+            ("2025-03-01", "finding", 2), ("2025-03-01", "note", 1)
+        ]
+
+        data = await self._histogram(authenticated_client, case.id, q="invoice")
+        assert [(i["start"], i["count"]) for i in data["items"]] == [("2025-03-03", 1)]
+
+    async def test_invalid_bucket(self, authenticated_client, db_session, test_user):
+        case = await self._seed(db_session, test_user)
+
+        response = await authenticated_client.get(
+            f"/cases/{case.id}/events/histogram", params={"bucket": "year"}
+        )
+        assert response.status_code == 422
+
+    async def test_histogram_unknown_case(self, authenticated_client):
+        response = await authenticated_client.get(
+            f"/cases/{uuid.uuid4()}/events/histogram"
+        )
+        assert response.status_code == 404
+
+
 class TestSortOrderAutoIncrement:
     async def test_sort_order_increments(self, authenticated_client, db_session, test_user):
         at = make_audit_type()
@@ -193,4 +728,4 @@ class TestSortOrderAutoIncrement:
             json={"event_type": "note", "event_date": "2025-01-16", "metadata": {}},
         )
         assert r2.status_code == 201
-        assert r2.json()["sort_order"] == 1
+        assert r2.json()["sort_order"] == 1024
@@ -52,6 +52,18 @@ class TestCreateFileBatch:
         )
         assert response.status_code == 404
 
+    async def test_create_batch_nonexistent_case(self, authenticated_client):
+        response = await authenticated_client.post(
+            f"/cases/{uuid.uuid4()}/events/{uuid.uuid4()}/batches/",
+            json={
+                "label": "Batch",
+                "file_count": 1,
+                "sort_order": 0,
+            },
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Case not found"
+
 
 class TestListFileBatches:
     async def test_list_batches(self, authenticated_client, db_session, test_user):
@@ -171,3 +183,86 @@ class TestDeleteFileBatch:
             f"/cases/{case.id}/events/{event.id}/batches/{uuid.uuid4()}"
         )
         assert response.status_code == 404
+
+
+class TestReplaceFileBatches:
+    async def _seed(self, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+        event = make_event(case.id, test_user.id)
+        db_session.add(event)
+        await db_session.flush()
+        batches = [
+            make_file_batch(event.id, label=label, sort_order=i)
+            for i, label in enumerate(["Keep", "Edit", "Drop"])
+        ]
+        db_session.add_all(batches)
+        await db_session.commit()
+        return case, event, batches
+
+    async def test_replace_batches(self, authenticated_client, db_session, test_user):
+        case, event, (keep, edit, drop) = await self._seed(db_session, test_user)
+
+        response = await authenticated_client.put(
+            f"/cases/{case.id}/events/{event.id}/batches/",
+            json={"batches": [
+                {"label": "New", "file_count": 2},
+                {"id": str(edit.id), "label": "Edited", "file_count": 7},
+                {"id": str(keep.id), "label": "Keep", "file_count": 5,
+                 "description": "A test file batch", "file_types": "pdf, xlsx"},
+            ]},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [b["label"] for b in data] == ["New", "Edited", "Keep"]
+        assert [b["sort_order"] for b in data] == [0, 1, 2]
+        assert data[1]["id"] == str(edit.id)
+        assert data[1]["file_count"] == 7
+        assert str(drop.id) not in {b["id"] for b in data}
+
+        listed = await authenticated_client.get(
+            f"/cases/{case.id}/events/{event.id}/batches/"
+        )
+        assert listed.json() == data
+
+    async def test_replace_with_empty_list(self, authenticated_client, db_session, test_user):
+        case, event, _ = await self._seed(db_session, test_user)
+
+        response = await authenticated_client.put(
+            f"/cases/{case.id}/events/{event.id}/batches/", json={"batches": []}
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+
+    async def test_replace_unknown_batch_writes_nothing(self, authenticated_client, db_session, test_user):
+        case, event, (keep, _, _) = await self._seed(db_session, test_user)
+        url = f"/cases/{case.id}/events/{event.id}/batches/"
+
+        response = await authenticated_client.put(url, json={"batches": [
+            {"id": str(keep.id), "label": "Keep", "file_count": 5},
+            {"id": str(uuid.uuid4()), "label": "Ghost", "file_count": 1},
+        ]})
+        assert response.status_code == 404
+        assert len((await authenticated_client.get(url)).json()) == 3
+
+    async def test_replace_duplicate_ids(self, authenticated_client, db_session, test_user):
+        case, event, (keep, _, _) = await self._seed(db_session, test_user)
+
+        item = {"id": str(keep.id), "label": "Keep", "file_count": 5}
+        response = await authenticated_client.put(
+            f"/cases/{case.id}/events/{event.id}/batches/",
+            json={"batches": [item, item]},
+        )
+        assert response.status_code == 422
+
+    async def test_replace_nonexistent_event(self, authenticated_client, db_session, test_user):
+        case, _, _ = await self._seed(db_session, test_user)
+
+        response = await authenticated_client.put(
+            f"/cases/{case.id}/events/{uuid.uuid4()}/batches/", json={"batches": []}
+        )
+        assert response.status_code == 404
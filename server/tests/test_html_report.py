@@ -32,6 +32,15 @@ def mock_case():
         audit_type=SimpleNamespace(name="USB Usage"),
         assigned_to=SimpleNamespace(full_name="Alice Auditor"),
         created_by=SimpleNamespace(full_name="Bob Manager"),
+        # Timeline rollups matching mock_events
+        event_count=3,
+        finding_count=1,
+        action_count=1,
+        note_count=1,
+        batch_count=1,
+        file_total=158,
+        first_event_date=date(2026, 1, 15),
+        last_event_date=date(2026, 1, 17),
     )
     return case
 
@@ -243,6 +252,12 @@ class TestChartGeneration:
         assert "daily-chart" in html
         assert "No events recorded" in html
 
+    def test_activity_chart_title_follows_bucket(self, service, mock_stats):
+        """Weekly buckets should be labelled as weekly activity."""
+        mock_stats.activity_bucket = "week"
+        html = service._generate_daily_activity_chart(mock_stats)
+        assert "Weekly Activity" in html
+
     def test_timeline_chart_has_event_type_traces(self, service, mock_events):
         """Timeline chart should create traces for each event type."""
         html = service._generate_timeline_chart(mock_events, "Test Case")
@@ -348,30 +363,32 @@ class TestTemplateRendering:
 class TestComputeStats:
     """Tests for dashboard stats computation."""
 
-    def test_empty_events(self, service):
-        """Empty events list should return zero stats."""
-        stats = service._compute_stats([])
+    def test_empty_case(self, service, mock_case):
+        """A case without events should return zero stats."""
+        mock_case.event_count = mock_case.finding_count = 0
+        mock_case.action_count = mock_case.note_count = 0
+        mock_case.batch_count = mock_case.file_total = 0
+        mock_case.first_event_date = mock_case.last_event_date = None
+        stats = service._compute_stats(mock_case)
         assert stats.total_events == 0
         assert stats.total_files == 0
         assert stats.date_range_start is None
+        assert stats.events_by_type == {}
 
-    def test_stats_with_events(self, service, mock_events):
-        """Stats should correctly count events and files."""
-        stats = service._compute_stats(mock_events)
+    def test_stats_from_rollups(self, service, mock_case):
+        """Stats should be read from the case rollups."""
+        stats = service._compute_stats(mock_case)
         assert stats.total_events == 3
         assert stats.total_file_batches == 1
-        # 5 (from event 1) + 150 (from event 2) + 0 (event 3) + 3 (batch) = 158
         assert stats.total_files == 158
         assert stats.date_range_start == date(2026, 1, 15)
         assert stats.date_range_end == date(2026, 1, 17)
         assert stats.events_by_type == {"finding": 1, "action": 1, "note": 1}
 
-    def test_stats_events_by_date(self, service, mock_events):
-        """Events by date should have correct counts."""
-        stats = service._compute_stats(mock_events)
-        assert stats.events_by_date["2026-01-15"] == 1
-        assert stats.events_by_date["2026-01-16"] == 1
-        assert stats.events_by_date["2026-01-17"] == 1
+    def test_stats_leave_activity_to_histogram(self, service, mock_case):
+        """Events by date are counted in SQL by collect_report_data."""
+        stats = service._compute_stats(mock_case)
+        assert stats.events_by_date == {}
 
 
 # ======================================================================
@@ -0,0 +1,118 @@
+"""Tests for ETag helpers and conditional GET behaviour."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from src.http_cache import CACHE_CONTROL, etag_matches, weak_etag
+from src.models.case import Case
+from src.models.user import User
+from tests.factories import make_audit_type, make_case, make_event
+
+
+class TestEtagMatches:
+    def test_weak_etags_compare_equal(self):
+        etag = weak_etag("x", 1)
+        assert etag.startswith('W/"')
+        assert etag_matches(etag, etag)
+        assert etag_matches(etag.removeprefix("W/"), etag)
+
+    def test_list_and_wildcard(self):
+        etag = weak_etag("x", 1)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches("*", etag)
+
+    def test_mismatch_or_missing(self):
+        assert not etag_matches(weak_etag("x", 2), weak_etag("x", 1))
+        assert not etag_matches(None, weak_etag("x", 1))
+
+    def test_fingerprint_parts_change_etag(self):
+        assert weak_etag("events", 1) != weak_etag("events", 2)
+
+
+class TestConditionalGet:
+    async def _seed(self, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+        event = make_event(case.id, test_user.id)
+        db_session.add(event)
+        await db_session.commit()
+        return case, event
+
+    async def test_get_case_etag_roundtrip(self, authenticated_client, db_session, test_user):
+        case, _ = await self._seed(db_session, test_user)
+        url = f"/cases/{case.id}"
+
+        first = await authenticated_client.get(url)
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == CACHE_CONTROL
+        etag = first.headers["ETag"]
+
+        cached = await authenticated_client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+
+        # SQLite's CURRENT_TIMESTAMP has one-second resolution, so move
+        # updated_at forward explicitly instead of relying on the clock
+        await db_session.execute(
+            update(Case)
+            .where(Case.id == case.id)
+            .values(updated_at=datetime.now(timezone.utc) + timedelta(minutes=1))
+        )
+        await db_session.commit()
+        changed = await authenticated_client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+    async def test_user_edit_changes_case_etag(self, authenticated_client, db_session, test_user):
+        case, _ = await self._seed(db_session, test_user)
+        url = f"/cases/{case.id}"
+        etag = (await authenticated_client.get(url)).headers["ETag"]
+
+        # The case embeds its creator; renaming them must not serve a 304
+        await db_session.execute(
+            update(User)
+            .where(User.id == test_user.id)
+            .values(
+                full_name="Renamed User",
+                updated_at=datetime.now(timezone.utc) + timedelta(minutes=1),
+            )
+        )
+        await db_session.commit()
+        response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["created_by"]["full_name"] == "Renamed User"
+
+    async def test_event_write_changes_timeline_etag(self, authenticated_client, db_session, test_user):
+        case, event = await self._seed(db_session, test_user)
+        url = f"/cases/{case.id}/events/"
+        etag = (await authenticated_client.get(url)).headers["ETag"]
+
+        await authenticated_client.patch(
+            f"/cases/{case.id}/events/{event.id}", json={"file_name": "x.pdf"}
+        )
+        response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+    async def test_batch_write_changes_batch_list_etag(self, authenticated_client, db_session, test_user):
+        case, event = await self._seed(db_session, test_user)
+        url = f"/cases/{case.id}/events/{event.id}/batches/"
+        etag = (await authenticated_client.get(url)).headers["ETag"]
+        assert (
+            await authenticated_client.get(url, headers={"If-None-Match": etag})
+        ).status_code == 304
+
+        await authenticated_client.post(url, json={"label": "Scans", "file_count": 1})
+        response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+    async def test_routes_without_etag_are_untouched(self, authenticated_client):
+        response = await authenticated_client.get("/health")
+        assert "ETag" not in response.headers
+        assert "Cache-Control" not in response.headers
@@ -7,8 +7,13 @@ from datetime import date, datetime, time
 import pytest
 
 from src.services.import_parser import (
+    CSV_SAMPLE_BYTES,
     VALID_EVENT_FIELDS,
     VALID_EVENT_TYPES,
+    RowLimitExceeded,
+    iter_csv,
+    iter_excel,
+    iter_file,
     normalize_cell_value,
     parse_csv,
     parse_date,
@@ -174,6 +179,44 @@ class TestParseCsv:
         assert len(data) == 2
 
 
+class TestIterCsv:
+    def test_rows_are_lazy(self):
+        stream = io.BytesIO(b"a,b\n1,2\n3,4")
+        headers, rows = iter_csv(stream)
+        assert headers == ["a", "b"]
+        assert next(rows) == ["1", "2"]
+        assert list(rows) == [["3", "4"]]
+
+    def test_stream_left_open(self):
+        stream = io.BytesIO(b"a,b\n1,2")
+        _, rows = iter_csv(stream)
+        list(rows)
+        assert not stream.closed
+
+    def test_multibyte_characters_across_sample(self):
+        # Non-ASCII text only appears well past the detection sample
+        filler = "a,b\n" + "x,y\n" * (CSV_SAMPLE_BYTES // 4)
+        content = filler + "caf\u00e9,\u65e5\u672c\n"
+        _, rows = iter_csv(io.BytesIO(content.encode("utf-8")))
+        assert list(rows)[-1] == ["caf\u00e9", "\u65e5\u672c"]
+
+    def test_quoted_newlines(self):
+        content = 'a,b\n"line one\nline two",2\n'
+        _, rows = iter_csv(io.BytesIO(content.encode("utf-8")))
+        assert list(rows) == [["line one\nline two", "2"]]
+
+    def test_single_column(self):
+        headers, rows = iter_csv(io.BytesIO(b"Date\n2025-02-01\n"))
+        assert headers == ["Date"]
+        assert list(rows) == [["2025-02-01"]]
+
+    def test_legacy_encoding(self):
+        content = "name;city\nRen\u00e9e;Z\u00fcrich\nJos\u00e9;M\u00e1laga\n" * 20
+        headers, rows = iter_csv(io.BytesIO(content.encode("cp1252")))
+        assert headers == ["name", "city"]
+        assert next(rows) == ["Ren\u00e9e", "Z\u00fcrich"]
+
+
 class TestParseExcel:
     def _make_xlsx(self, rows):
         """Create a minimal xlsx in memory."""
@@ -206,6 +249,57 @@ class TestParseExcel:
         assert headers[1] == "col2"
 
 
+class TestIterExcel:
+    def _make_workbook(self, sheets: dict[str, list[list]]) -> io.BytesIO:
+        import openpyxl
+
+        wb = openpyxl.Workbook()
+        wb.remove(wb.active)
+        for title, rows in sheets.items():
+            ws = wb.create_sheet(title)
+            for row in rows:
+                ws.append(row)
+        buf = io.BytesIO()
+        wb.save(buf)
+        buf.seek(0)
+        return buf
+
+    def test_cells_normalized(self):
+        stream = self._make_workbook(
+            {"Log": [["when", "count"], [datetime(2025, 1, 15, 9, 30), 3.0]]}
+        )
+        headers, rows, sheet_names = iter_excel(stream)
+        assert headers == ["when", "count"]
+        assert list(rows) == [["2025-01-15T09:30:00", 3]]
+        assert sheet_names == ["Log"]
+
+    def test_sheet_selection(self):
+        stream = self._make_workbook(
+            {"Summary": [["total"], [2]], "Events": [["date"], ["2025-01-15"]]}
+        )
+        headers, rows, sheet_names = iter_excel(stream, sheet="Events")
+        assert headers == ["date"]
+        assert list(rows) == [["2025-01-15"]]
+        assert sheet_names == ["Summary", "Events"]
+
+    def test_unknown_sheet(self):
+        stream = self._make_workbook({"Summary": [["total"]]})
+        with pytest.raises(ValueError, match="Sheet 'Events' not found"):
+            iter_excel(stream, sheet="Events")
+
+
+class TestRowLimit:
+    def test_within_limit(self):
+        _, rows, _ = iter_file("t.csv", io.BytesIO(b"a\n1\n2"), max_rows=2)
+        assert list(rows) == [["1"], ["2"]]
+
+    def test_over_limit(self):
+        _, rows, _ = iter_file("t.csv", io.BytesIO(b"a\n1\n2\n3"), max_rows=2)
+        assert next(rows) == ["1"]
+        with pytest.raises(RowLimitExceeded, match="more than 2 data rows"):
+            list(rows)
+
+
 class TestParseFile:
     def test_csv_routing(self):
         content = "a,b\n1,2"
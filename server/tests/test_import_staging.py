@@ -0,0 +1,147 @@
+"""Tests for disk-backed import session staging."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from src.services import import_staging as staging_module
+from src.services.import_staging import ImportStagingStore, StagingBudgetExceeded
+
+
+@pytest.fixture
+def store(tmp_path) -> ImportStagingStore:
+    return ImportStagingStore(tmp_path / "imports", max_bytes=10_000, ttl_seconds=60)
+
+
+def _age(store: ImportStagingStore, session_id: str, seconds: float) -> None:
+    """Pretend a session was last used ``seconds`` ago."""
+    meta = store.root / session_id / staging_module.META_FILE
+    past = time.time() - seconds
+    os.utime(meta, (past, past))
+
+
+class TestSessions:
+    def test_create_load_save(self, store):
+        session_id = store.create({"case_id": "c", "headers": ["a"]})
+        meta = store.load(session_id)
+        assert meta["headers"] == ["a"]
+        assert "created_at" in meta
+
+        meta["mappings"] = {"a": "event_date"}
+        store.save(session_id, meta)
+        assert store.load(session_id)["mappings"] == {"a": "event_date"}
+
+    def test_unknown_and_malformed_ids(self, store):
+        assert store.load("00000000-0000-0000-0000-000000000000") is None
+        assert store.load("../etc") is None
+        assert store.load("nonexistent") is None
+
+    def test_delete(self, store):
+        session_id = store.create({})
+        store.delete(session_id)
+        assert store.load(session_id) is None
+
+    def test_expired_session_is_gone(self, store):
+        session_id = store.create({})
+        _age(store, session_id, 120)
+        assert store.load(session_id) is None
+        assert not (store.root / session_id).exists()
+
+    def test_create_sweeps_expired_sessions(self, store):
+        old = store.create({})
+        _age(store, old, 120)
+        store.create({})
+        assert not (store.root / old).exists()
+
+    def test_lock_serializes_status_changes(self, store):
+        session_id = store.create({"status": "receiving"})
+        claims = []
+
+        def claim():
+            with store.lock(session_id) as meta:
+                claims.append(meta["status"] == "receiving")
+                store.save(session_id, {**meta, "status": "assembling"})
+
+        threads = [threading.Thread(target=claim) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(claims) == [False] * 7 + [True]
+
+    def test_lock_on_missing_session(self, store):
+        session_id = store.create({})
+        store.delete(session_id)
+        with pytest.raises(KeyError):
+            with store.lock(session_id):
+                pass
+        with pytest.raises(KeyError):
+            with store.lock("nonexistent"):
+                pass
+
+
+class TestRows:
+    def test_rows_round_trip_across_chunks(self, store, monkeypatch):
+        monkeypatch.setattr(staging_module, "ROW_CHUNK_SIZE", 2)
+        session_id = store.create({})
+        rows = [[str(i), i] for i in range(5)]
+
+        progress = []
+        assert store.write_rows(session_id, iter(rows), on_chunk=progress.append) == 5
+        assert progress == [2, 4, 5]
+        assert len(store.chunk_paths(session_id)) == 3
+        assert list(store.iter_rows(session_id)) == rows
+
+    def test_named_rows_replace_previous(self, store):
+        session_id = store.create({})
+        store.write_rows(session_id, [[True, {"a": 1}], [False, {}]], name="validated")
+        store.write_rows(session_id, [[True, {"a": 2}]], name="validated")
+
+        assert list(store.iter_rows(session_id, name="validated")) == [[True, {"a": 2}]]
+        assert list(store.iter_rows(session_id)) == []
+
+
+class TestBudget:
+    def test_least_recently_used_session_evicted(self, store):
+        store.max_bytes = 2_500
+        row = ["x" * 1000]
+        first = store.create({})
+        store.write_rows(first, [row])
+        second = store.create({})
+        store.write_rows(second, [row])
+        _age(store, second, 30)
+        store.load(first)  # Touch: the older session is now the LRU one
+
+        third = store.create({})
+        store.write_rows(third, [row])
+
+        assert store.load(second) is None
+        assert store.load(first) is not None
+        assert store.load(third) is not None
+
+    def test_session_larger_than_budget(self, store):
+        store.max_bytes = 500
+        kept = store.create({})
+        session_id = store.create({})
+        with pytest.raises(StagingBudgetExceeded):
+            store.write_rows(session_id, [["x" * 1000]])
+        assert store.load(session_id) is None
+        assert store.load(kept) is not None
+
+    def test_budget_checked_per_chunk(self, store, monkeypatch):
+        monkeypatch.setattr(staging_module, "ROW_CHUNK_SIZE", 1)
+        store.max_bytes = 1_000
+        session_id = store.create({})
+        consumed = []
+
+        def rows():
+            for i in range(100):
+                consumed.append(i)
+                yield ["x" * 400]
+
+        with pytest.raises(StagingBudgetExceeded):
+            store.write_rows(session_id, rows())
+        # Stopped at the chunk that crossed the budget
+        assert len(consumed) == 3
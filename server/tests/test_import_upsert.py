@@ -0,0 +1,46 @@
+"""Tests for import row fingerprints."""
+
+from src.services.import_upsert import RowFingerprinter
+
+
+class TestRowFingerprinter:
+    def test_same_rows_same_fingerprints_across_imports(self):
+        row = {"event_date": "2025-01-15", "file_name": "a.txt", "file_count": 3}
+        assert RowFingerprinter()(row) == RowFingerprinter()(dict(row))
+
+    def test_changed_row_keeps_key(self):
+        row = {"event_date": "2025-01-15", "file_name": "a.txt", "file_count": 3}
+        key, row_hash = RowFingerprinter()(row)
+        changed_key, changed_hash = RowFingerprinter()({**row, "file_count": 4})
+        assert changed_key == key
+        assert changed_hash != row_hash
+
+    def test_default_event_type(self):
+        row = {"event_date": "2025-01-15"}
+        assert RowFingerprinter()(row) == RowFingerprinter()(
+            {**row, "event_type": "note"}
+        )
+
+    def test_repeated_rows_numbered(self):
+        row = {"event_date": "2025-01-15", "file_name": "a.txt"}
+        fingerprint = RowFingerprinter()
+        first_key, first_hash = fingerprint(row)
+        second_key, second_hash = fingerprint(row)
+        assert first_key != second_key
+        assert first_hash == second_hash
+        # A later import numbers its repeats the same way
+        assert [key for key, _ in map(RowFingerprinter(), [row, row])] == [
+            first_key,
+            second_key,
+        ]
+
+    def test_key_fields_distinguish_rows(self):
+        fingerprint = RowFingerprinter()
+        keys = {
+            fingerprint({"event_date": "2025-01-15", "file_name": "a.txt"})[0],
+            fingerprint({"event_date": "2025-01-16", "file_name": "a.txt"})[0],
+            fingerprint(
+                {"event_date": "2025-01-15", "event_time": "09:30:00", "file_name": "a.txt"}
+            )[0],
+        }
+        assert len(keys) == 3
@@ -0,0 +1,135 @@
+"""Tests for column-compiled import validation."""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from src.services.import_parser import validate_and_transform_row
+from src.services.import_validation import (
+    DATE_FORMATS,
+    TIME_FORMATS,
+    _date_parser,
+    _time_parser,
+    compile_validator,
+    infer_date_format,
+    infer_time_format,
+)
+
+HEADERS = ["Date", "Time", "Type", "Name", "Count", "Notes"]
+MAPPINGS = {
+    "Date": "event_date",
+    "Time": "event_time",
+    "Type": "event_type",
+    "Name": "file_name",
+    "Count": "file_count",
+    "Notes": "file_description",
+}
+
+
+def _validate(headers, mappings, rows):
+    return compile_validator(headers, mappings, rows).validate_rows(rows)
+
+
+class TestFastParsers:
+    @pytest.mark.parametrize("fmt", DATE_FORMATS)
+    def test_date_parser_matches_strptime(self, fmt):
+        rng = random.Random(fmt)
+        parse = _date_parser(fmt)
+        for _ in range(2000):
+            parts = [str(rng.randint(0, 40)) for _ in range(2)]
+            year = str(rng.choice([2025, 1999, 25, 20250]))
+            sep = "-" if "-" in fmt else "/"
+            s = sep.join([year, *parts] if fmt.startswith("%Y") else [*parts, year])
+            try:
+                expected = datetime.strptime(s, fmt).date()
+            except ValueError:
+                expected = None
+            assert parse(s) == expected, s
+
+    @pytest.mark.parametrize("fmt", TIME_FORMATS[:2])
+    def test_time_parser_matches_strptime(self, fmt):
+        rng = random.Random(fmt)
+        parse = _time_parser(fmt)
+        for _ in range(2000):
+            count = fmt.count(":") + 1
+            s = ":".join(str(rng.choice([rng.randint(0, 70), "07"])) for _ in range(count))
+            try:
+                expected = datetime.strptime(s, fmt).time()
+            except ValueError:
+                expected = None
+            assert parse(s) == expected, s
+
+
+class TestFormatInference:
+    def test_iso_dates(self):
+        assert infer_date_format(["2025-01-15", "2025-02-01", None, ""]) == (
+            "%Y-%m-%d",
+            False,
+        )
+
+    def test_day_first_dates(self):
+        assert infer_date_format(["03/04/2025", "25/04/2025"]) == ("%d/%m/%Y", False)
+
+    def test_month_first_dates(self):
+        assert infer_date_format(["03/04/2025", "04/25/2025"]) == ("%m/%d/%Y", False)
+
+    def test_ambiguous_dates(self):
+        assert infer_date_format(["03/04/2025", "05/06/2025"]) == ("%m/%d/%Y", True)
+
+    def test_no_match(self):
+        assert infer_date_format(["yesterday", 42]) == (None, False)
+
+    def test_times(self):
+        assert infer_time_format(["09:30", "17:05"]) == "%H:%M"
+        assert infer_time_format(["9:30 AM", "5:05 PM"]) == "%I:%M %p"
+        assert infer_time_format(["soon"]) is None
+
+
+class TestCompiledValidator:
+    def test_matches_row_validator(self):
+        rng = random.Random(43)
+        rows = []
+        for i in range(500):
+            rows.append([
+                rng.choice(["2025-01-15", "2025-1-5", "2025-01-15T09:30:00", "2025-13-01", "", None, "bad"]),
+                rng.choice(["09:30", "9:30:15", "5:05 PM", "", None, "25:00"]),
+                rng.choice(["finding", " Action ", "NOTE", "", None, "other"]),
+                rng.choice(["a.txt", "  ", None, 7]),
+                rng.choice([3, "4", "4.0", "", None, "many"]),
+                rng.choice(["desc", None]),
+            ][: rng.randint(1, 6)])
+
+        compiled = _validate(HEADERS, MAPPINGS, rows)
+        expected = [validate_and_transform_row(row, HEADERS, MAPPINGS) for row in rows]
+        assert compiled == expected
+
+    def test_missing_column(self):
+        mappings = {"Date": "event_date", "Nope": "file_name"}
+        rows = [["2025-01-15"]]
+        assert _validate(["Date"], mappings, rows) == [
+            validate_and_transform_row(rows[0], ["Date"], mappings)
+        ]
+
+    def test_day_first_column_read_consistently(self):
+        rows = [["03/04/2025"], ["25/04/2025"], ["26/04/2025"]]
+        validator = compile_validator(["Date"], {"Date": "event_date"}, rows)
+        results = validator.validate_rows(rows)
+
+        assert validator.date_formats == {"Date": "%d/%m/%Y"}
+        assert validator.ambiguous_date_columns == []
+        assert [data["event_date"] for _, data, _ in results] == [
+            "2025-04-03",
+            "2025-04-25",
+            "2025-04-26",
+        ]
+
+    def test_outliers_fall_back(self):
+        rows = [["2025-01-15"], ["2025-01-16"], ["01/17/2025"]]
+        results = _validate(["Date"], {"Date": "event_date"}, rows)
+        assert results[2] == (True, {"event_date": "2025-01-17"}, [])
+
+    def test_ambiguous_column_reported(self):
+        rows = [["03/04/2025"], ["05/06/2025"]]
+        validator = compile_validator(["Date"], {"Date": "event_date"}, rows)
+        assert validator.ambiguous_date_columns == ["Date"]
@@ -0,0 +1,86 @@
+"""Tests for the import worker pool and per-user admission."""
+
+import uuid
+from functools import partial
+
+import pytest
+
+from src.config import settings
+from src.services import import_staging as staging_module
+from src.services import import_workers
+from src.services.import_validation import compile_validator, validate_chunk_file
+from src.services.import_workers import (
+    ImportBusy,
+    import_slot,
+    map_chunks,
+    shutdown_pool,
+)
+
+
+class TestMapChunks:
+    async def test_results_in_job_order(self):
+        assert await map_chunks(divmod, [(7, 2), (9, 4), (1, 1)]) == [
+            (3, 1),
+            (2, 1),
+            (1, 0),
+        ]
+
+    async def test_validates_chunks_in_worker_processes(
+        self, import_staging, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "IMPORT_WORKERS", 2)
+        monkeypatch.setattr(staging_module, "ROW_CHUNK_SIZE", 2)
+        session_id = import_staging.create({})
+        import_staging.write_rows(
+            session_id, [["2025-01-15"], ["bad"], ["2025-01-17"]]
+        )
+        validator = compile_validator(["Date"], {"Date": "event_date"})
+        jobs = [
+            (source, import_staging.chunk_path(session_id, i, "validated"))
+            for i, source in enumerate(import_staging.chunk_paths(session_id))
+        ]
+
+        try:
+            results = await map_chunks(
+                partial(validate_chunk_file, validator, max_errors=10), jobs
+            )
+        finally:
+            shutdown_pool()
+
+        missing = "Event date is required but missing or invalid"
+        invalid = "Invalid date in column 'Date': 'bad'"
+        assert results == [(2, 1, [(1, [invalid, missing], {})]), (1, 1, [])]
+        assert list(import_staging.iter_rows(session_id, "validated")) == [
+            [True, {"event_date": "2025-01-15"}, []],
+            [False, {}, [invalid, missing]],
+            [True, {"event_date": "2025-01-17"}, []],
+        ]
+        assert import_workers._pool is None
+
+
+class TestImportSlot:
+    async def test_limit_per_user(self, monkeypatch):
+        monkeypatch.setattr(settings, "IMPORT_MAX_CONCURRENT_PER_USER", 1)
+        user, other = uuid.uuid4(), uuid.uuid4()
+
+        async with import_slot(user):
+            with pytest.raises(ImportBusy):
+                async with import_slot(user):
+                    pass
+            # Other users are unaffected
+            async with import_slot(other):
+                pass
+
+        # Released on exit
+        async with import_slot(user):
+            pass
+        assert user not in import_workers._active_imports
+
+    async def test_released_on_error(self, monkeypatch):
+        monkeypatch.setattr(settings, "IMPORT_MAX_CONCURRENT_PER_USER", 1)
+        user = uuid.uuid4()
+        with pytest.raises(RuntimeError):
+            async with import_slot(user):
+                raise RuntimeError
+        async with import_slot(user):
+            pass
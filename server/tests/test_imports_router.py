@@ -1,11 +1,19 @@
 """Integration tests for imports router."""
 
+import asyncio
+import gc
+import hashlib
 import io
+import threading
 import uuid
 
 import openpyxl
 import pytest
 
+from src.routers import imports as imports_router
+from src.services import import_staging as staging_module
+from src.services.import_staging import ImportStagingStore
+from src.services.import_workers import import_slot
 from tests.factories import make_audit_type, make_case
 
 
@@ -62,6 +70,42 @@ class TestUploadFile:
         assert response.status_code == 200
         data = response.json()
         assert data["row_count"] == 1
+        assert data["sheet_names"] == ["Sheet"]
+
+    async def test_upload_xlsx_sheet(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        wb = openpyxl.Workbook()
+        wb.active.append(["summary"])
+        events = wb.create_sheet("Events")
+        events.append(["event_date", "event_type"])
+        events.append(["2025-01-15", "finding"])
+        events.append(["2025-01-16", "note"])
+        buf = io.BytesIO()
+        wb.save(buf)
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            params={"sheet": "Events"},
+            files={"file": ("test.xlsx", buf.getvalue(), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["headers"] == ["event_date", "event_type"]
+        assert data["row_count"] == 2
+        assert data["sheet_names"] == ["Sheet", "Events"]
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            params={"sheet": "Missing"},
+            files={"file": ("test.xlsx", buf.getvalue(), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+        )
+        assert response.status_code == 400
 
     async def test_upload_invalid_type(self, authenticated_client, db_session, test_user):
         at = make_audit_type()
@@ -108,6 +152,36 @@ class TestValidateMapping:
         data = response.json()
         assert data["valid_count"] == 2
         assert data["error_count"] == 0
+        assert data["date_formats"] == {"Date": "%Y-%m-%d"}
+        assert data["ambiguous_date_columns"] == []
+
+    async def test_validate_reports_ambiguous_dates(
+        self, authenticated_client, db_session, test_user
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        csv_data = _make_csv_bytes("Date\n03/04/2025\n05/06/2025")
+        resp = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", csv_data, "text/csv")},
+        )
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/validate",
+            json={
+                "session_id": resp.json()["session_id"],
+                "mappings": {"Date": "event_date"},
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["valid_count"] == 2
+        assert data["date_formats"] == {"Date": "%m/%d/%Y"}
+        assert data["ambiguous_date_columns"] == ["Date"]
 
     async def test_validate_missing_event_date(self, authenticated_client, db_session, test_user):
         at = make_audit_type()
@@ -202,3 +276,939 @@ class TestConfirmImport:
             json={"session_id": "nonexistent"},
         )
         assert response.status_code == 404
+
+    async def test_confirm_deletes_staged_session(
+        self, authenticated_client, db_session, test_user, import_staging
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        csv_data = _make_csv_bytes("Date\n2025-01-15")
+        upload_resp = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", csv_data, "text/csv")},
+        )
+        session_id = upload_resp.json()["session_id"]
+        await authenticated_client.post(
+            f"/cases/{case.id}/imports/validate",
+            json={"session_id": session_id, "mappings": {"Date": "event_date"}},
+        )
+        assert import_staging.load(session_id) is not None
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/confirm",
+            json={"session_id": session_id},
+        )
+        assert response.status_code == 200
+        assert import_staging.load(session_id) is None
+
+    async def test_confirm_case_deleted_meanwhile(
+        self, authenticated_client, db_session, test_user, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        csv_data = _make_csv_bytes("Date\n2025-01-15")
+        upload_resp = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", csv_data, "text/csv")},
+        )
+        session_id = upload_resp.json()["session_id"]
+        await authenticated_client.post(
+            f"/cases/{case.id}/imports/validate",
+            json={"session_id": session_id, "mappings": {"Date": "event_date"}},
+        )
+
+        # The case goes while confirm waits for the parsed session
+        load_parsed_session = imports_router._load_parsed_session
+
+        async def load_then_delete_case(*args):
+            session = await load_parsed_session(*args)
+            await db_session.delete(case)
+            await db_session.commit()
+            return session
+
+        monkeypatch.setattr(
+            imports_router, "_load_parsed_session", load_then_delete_case
+        )
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/confirm",
+            json={"session_id": session_id},
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Case not found"
+
+
+class TestImportStaging:
+    async def test_session_visible_to_another_worker(
+        self, authenticated_client, db_session, test_user, import_staging
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        csv_data = _make_csv_bytes("Date,Type\n2025-01-15,finding")
+        upload_resp = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", csv_data, "text/csv")},
+        )
+        session_id = upload_resp.json()["session_id"]
+
+        # A separate store over the same directory, as in another process
+        other = ImportStagingStore(
+            import_staging.root, import_staging.max_bytes, import_staging.ttl_seconds
+        )
+        meta = other.load(session_id)
+        assert meta["headers"] == ["Date", "Type"]
+        assert meta["row_count"] == 1
+        assert list(other.iter_rows(session_id)) == [["2025-01-15", "finding"]]
+
+    async def test_session_for_other_case(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        other_case = make_case(at.id, test_user.id)
+        db_session.add_all([case, other_case])
+        await db_session.commit()
+
+        csv_data = _make_csv_bytes("Date\n2025-01-15")
+        upload_resp = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", csv_data, "text/csv")},
+        )
+        response = await authenticated_client.post(
+            f"/cases/{other_case.id}/imports/validate",
+            json={
+                "session_id": upload_resp.json()["session_id"],
+                "mappings": {"Date": "event_date"},
+            },
+        )
+        assert response.status_code == 400
+
+    async def test_upload_over_staging_budget(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(import_staging, "max_bytes", 100)
+        csv_data = _make_csv_bytes("Date\n" + "2025-01-15\n" * 8)
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", csv_data, "text/csv")},
+        )
+        assert response.status_code == 413
+        assert list(import_staging.root.iterdir()) == []
+
+    # The parser must not raise as it is finalized after the upload closes
+    @pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+    async def test_background_parse_over_staging_budget(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(import_staging, "max_bytes", 100)
+        csv_data = _make_csv_bytes("Date\n" + "2025-01-15\n" * 50)
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", csv_data, "text/csv")},
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == "parsing"
+        gc.collect()
+        # The over-budget session is evicted once the background parse ends
+        assert list(import_staging.root.iterdir()) == []
+
+
+class TestStreamingUpload:
+    async def test_large_upload_staged_in_chunks(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(staging_module, "ROW_CHUNK_SIZE", 100)
+        lines = [f"2025-01-{i % 28 + 1:02d},file{i}.txt" for i in range(1000)]
+        csv_data = _make_csv_bytes("Date,File\n" + "\n".join(lines))
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("big.csv", csv_data, "text/csv")},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "parsing"
+        assert data["row_count"] is None
+        assert data["preview_rows"] == [line.split(",") for line in lines[:10]]
+
+        # The test transport returns once background tasks have run
+        session_id = data["session_id"]
+        assert len(import_staging.chunk_paths(session_id)) == 10
+        response = await authenticated_client.get(
+            f"/cases/{case.id}/imports/{session_id}"
+        )
+        assert response.json()["status"] == "uploaded"
+        assert response.json()["row_count"] == 1000
+
+    async def test_upload_over_size_limit(
+        self, authenticated_client, db_session, test_user, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(imports_router, "MAX_UPLOAD_SIZE", 10)
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", b"Date\n2025-01-15\n", "text/csv")},
+        )
+        assert response.status_code == 413
+
+    async def test_upload_over_row_limit(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(imports_router.settings, "IMPORT_MAX_ROWS", 2)
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", b"Date\n2025-01-15\n2025-01-16\n2025-01-17\n", "text/csv")},
+        )
+        assert response.status_code == 413
+        assert response.json()["detail"] == "Too many rows (max 2)"
+        assert not any(import_staging.root.glob("*"))
+
+    # The parser must not raise as it is finalized after the upload closes
+    @pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+    async def test_background_parse_over_row_limit(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(imports_router.settings, "IMPORT_MAX_ROWS", 15)
+        csv_data = _make_csv_bytes("Date\n" + "2025-01-15\n" * 20)
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", csv_data, "text/csv")},
+        )
+        assert response.status_code == 200
+        session_id = response.json()["session_id"]
+        # Finalize the abandoned parser now that the upload is closed
+        gc.collect()
+
+        response = await authenticated_client.get(
+            f"/cases/{case.id}/imports/{session_id}"
+        )
+        assert response.json()["status"] == "failed"
+        assert response.json()["error"] == "Too many rows (max 15)"
+        assert import_staging.chunk_paths(session_id) == []
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/validate",
+            json={"session_id": session_id, "mappings": {"Date": "event_date"}},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Too many rows (max 15)"
+
+    async def test_validate_waits_for_parse(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        resp = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", b"Date,Type\n2025-01-15,note\n", "text/csv")},
+        )
+        session_id = resp.json()["session_id"]
+        meta = import_staging.load(session_id)
+        import_staging.save(session_id, {**meta, "status": "parsing"})
+
+        in_transaction = []
+
+        async def finish_parse():
+            await asyncio.sleep(0.3)
+            # The waiting request must not hold its connection meanwhile
+            in_transaction.append(db_session.in_transaction())
+            import_staging.save(session_id, meta)
+
+        monkeypatch.setattr(imports_router, "PARSE_POLL_SECONDS", 0.05)
+        finishing = asyncio.create_task(finish_parse())
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/validate",
+            json={"session_id": session_id, "mappings": {"Date": "event_date"}},
+        )
+        await finishing
+        assert response.status_code == 200
+        assert response.json()["valid_count"] == 1
+        assert in_transaction == [False]
+
+    async def test_confirm_waits_without_a_transaction(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        resp = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", b"Date,Type\n2025-01-15,note\n", "text/csv")},
+        )
+        session_id = resp.json()["session_id"]
+        await authenticated_client.post(
+            f"/cases/{case.id}/imports/validate",
+            json={"session_id": session_id, "mappings": {"Date": "event_date"}},
+        )
+        meta = import_staging.load(session_id)
+        import_staging.save(session_id, {**meta, "status": "parsing"})
+        in_transaction = []
+
+        async def finish_parse():
+            await asyncio.sleep(0.3)
+            in_transaction.append(db_session.in_transaction())
+            import_staging.save(session_id, meta)
+
+        monkeypatch.setattr(imports_router, "PARSE_POLL_SECONDS", 0.05)
+        finishing = asyncio.create_task(finish_parse())
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/confirm", json={"session_id": session_id}
+        )
+        await finishing
+        assert response.status_code == 200
+        assert response.json()["created_count"] == 1
+        assert in_transaction == [False]
+
+    async def test_validate_gives_up_on_slow_parse(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        resp = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", b"Date,Type\n2025-01-15,note\n", "text/csv")},
+        )
+        session_id = resp.json()["session_id"]
+        import_staging.save(
+            session_id, {**import_staging.load(session_id), "status": "parsing"}
+        )
+
+        monkeypatch.setattr(imports_router.settings, "IMPORT_PARSE_WAIT_SECONDS", 0)
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/confirm",
+            json={"session_id": session_id},
+        )
+        assert response.status_code == 409
+
+    async def test_upload_while_at_import_limit(
+        self, authenticated_client, db_session, test_user, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(imports_router.settings, "IMPORT_MAX_CONCURRENT_PER_USER", 1)
+        async with import_slot(test_user.id):
+            response = await authenticated_client.post(
+                f"/cases/{case.id}/imports/upload",
+                files={"file": ("test.csv", b"Date\n2025-01-15\n", "text/csv")},
+            )
+        assert response.status_code == 429
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", b"Date\n2025-01-15\n", "text/csv")},
+        )
+        assert response.status_code == 200
+
+
+class TestBulkConfirm:
+    async def _validated_session(self, client, case_id, lines: list[str]) -> str:
+        csv_data = _make_csv_bytes("Date,Time,Type\n" + "\n".join(lines))
+        resp = await client.post(
+            f"/cases/{case_id}/imports/upload",
+            files={"file": ("test.csv", csv_data, "text/csv")},
+        )
+        session_id = resp.json()["session_id"]
+        resp = await client.post(
+            f"/cases/{case_id}/imports/validate",
+            json={
+                "session_id": session_id,
+                "mappings": {"Date": "event_date", "Time": "event_time", "Type": "event_type"},
+            },
+        )
+        assert resp.status_code == 200
+        return session_id
+
+    async def test_chunks_inserted_in_row_order(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(staging_module, "ROW_CHUNK_SIZE", 2)
+        lines = [
+            "2025-01-15,09:30,finding",
+            "2025-01-15,09:30,note",
+            "not a date,,note",
+            "2025-01-15,09:30,action",
+            "2025-01-16,,note",
+        ]
+        session_id = await self._validated_session(authenticated_client, case.id, lines)
+
+        progress = []
+        save = import_staging.save
+
+        def record_save(sid, meta):
+            if meta.get("status") == "confirming":
+                progress.append(meta["inserted_count"])
+            save(sid, meta)
+
+        monkeypatch.setattr(import_staging, "save", record_save)
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/confirm",
+            json={"session_id": session_id},
+        )
+        assert response.status_code == 200
+        assert response.json()["created_count"] == 4
+        assert progress == [2, 3, 4]
+
+        events = (await authenticated_client.get(f"/cases/{case.id}/events/")).json()["items"]
+        assert [(e["event_date"], e["event_time"], e["event_type"]) for e in events] == [
+            ("2025-01-15", "09:30:00", "finding"),
+            ("2025-01-15", "09:30:00", "note"),
+            ("2025-01-15", "09:30:00", "action"),
+            ("2025-01-16", None, "note"),
+        ]
+
+    async def test_status_reports_phases(
+        self, authenticated_client, db_session, test_user
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        csv_data = _make_csv_bytes("Date\n2025-01-15\nbad")
+        resp = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("log.csv", csv_data, "text/csv")},
+        )
+        session_id = resp.json()["session_id"]
+        status_url = f"/cases/{case.id}/imports/{session_id}"
+
+        response = await authenticated_client.get(status_url)
+        assert response.status_code == 200
+        assert response.json() == {
+            "session_id": session_id,
+            "filename": "log.csv",
+            "status": "uploaded",
+            "row_count": 2,
+            "error": None,
+            "valid_count": None,
+            "inserted_count": 0,
+        }
+
+        await authenticated_client.post(
+            f"/cases/{case.id}/imports/validate",
+            json={"session_id": session_id, "mappings": {"Date": "event_date"}},
+        )
+        data = (await authenticated_client.get(status_url)).json()
+        assert data["status"] == "validated"
+        assert data["valid_count"] == 1
+
+        await authenticated_client.post(
+            f"/cases/{case.id}/imports/confirm", json={"session_id": session_id}
+        )
+        response = await authenticated_client.get(status_url)
+        assert response.status_code == 404
+
+
+class TestValidationRows:
+    async def _validate(self, client, case_id, lines: list[str]) -> dict:
+        csv_data = _make_csv_bytes("Date,Type\n" + "\n".join(lines))
+        resp = await client.post(
+            f"/cases/{case_id}/imports/upload",
+            files={"file": ("test.csv", csv_data, "text/csv")},
+        )
+        resp = await client.post(
+            f"/cases/{case_id}/imports/validate",
+            json={
+                "session_id": resp.json()["session_id"],
+                "mappings": {"Date": "event_date", "Type": "event_type"},
+            },
+        )
+        assert resp.status_code == 200
+        return resp.json()
+
+    async def test_validate_returns_first_errors(
+        self, authenticated_client, db_session, test_user, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(staging_module, "ROW_CHUNK_SIZE", 2)
+        monkeypatch.setattr(imports_router, "ERROR_PREVIEW_ROWS", 2)
+        lines = ["2025-01-15,note", "bad,note", "2025-01-16,nope", "bad,note"]
+        data = await self._validate(authenticated_client, case.id, lines)
+
+        assert data["total_rows"] == 4
+        assert data["valid_count"] == 1
+        assert data["error_count"] == 3
+        assert [row["row_number"] for row in data["errors"]] == [2, 3]
+        assert data["errors"][1]["data"] == {"event_date": "2025-01-16"}
+        assert "rows" not in data
+
+    async def test_page_through_rows(
+        self, authenticated_client, db_session, test_user, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(staging_module, "ROW_CHUNK_SIZE", 2)
+        lines = [
+            "2025-01-15,note",
+            "2025-01-16,note",
+            "bad,note",
+            "2025-01-17,note",
+            "bad,note",
+        ]
+        data = await self._validate(authenticated_client, case.id, lines)
+        rows_url = f"/cases/{case.id}/imports/{data['session_id']}/rows"
+
+        response = await authenticated_client.get(rows_url, params={"offset": 1, "limit": 3})
+        assert response.status_code == 200
+        page = response.json()
+        assert page["total"] == 5
+        assert [(row["row_number"], row["valid"]) for row in page["items"]] == [
+            (2, True),
+            (3, False),
+            (4, True),
+        ]
+
+        page = (
+            await authenticated_client.get(
+                rows_url, params={"errors_only": True, "offset": 1}
+            )
+        ).json()
+        assert page["total"] == 2
+        assert [row["row_number"] for row in page["items"]] == [5]
+        assert page["items"][0]["errors"] == [
+            "Invalid date in column 'Date': 'bad'",
+            "Event date is required but missing or invalid",
+        ]
+
+    async def test_rows_before_validate(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        resp = await authenticated_client.post(
+            f"/cases/{case.id}/imports/upload",
+            files={"file": ("test.csv", b"Date,Type\n2025-01-15,note\n", "text/csv")},
+        )
+        response = await authenticated_client.get(
+            f"/cases/{case.id}/imports/{resp.json()['session_id']}/rows"
+        )
+        assert response.status_code == 400
+
+
+class TestReimport:
+    async def _import(
+        self, client, case_id, lines: list[str], filename="usb.csv"
+    ) -> dict:
+        csv_data = _make_csv_bytes("Date,File,Count\n" + "\n".join(lines))
+        resp = await client.post(
+            f"/cases/{case_id}/imports/upload",
+            files={"file": (filename, csv_data, "text/csv")},
+        )
+        session_id = resp.json()["session_id"]
+        await client.post(
+            f"/cases/{case_id}/imports/validate",
+            json={
+                "session_id": session_id,
+                "mappings": {"Date": "event_date", "File": "file_name", "Count": "file_count"},
+            },
+        )
+        resp = await client.post(
+            f"/cases/{case_id}/imports/confirm", json={"session_id": session_id}
+        )
+        assert resp.status_code == 200
+        return resp.json()
+
+    async def test_reimport_writes_only_the_delta(
+        self, authenticated_client, db_session, test_user, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(staging_module, "ROW_CHUNK_SIZE", 2)
+        first = [
+            "2025-01-15,a.txt,1",
+            "2025-01-15,a.txt,1",
+            "2025-01-16,b.txt,2",
+        ]
+        data = await self._import(authenticated_client, case.id, first)
+        assert (data["created_count"], data["updated_count"], data["unchanged_count"]) == (3, 0, 0)
+
+        events_url = f"/cases/{case.id}/events/"
+        before = (await authenticated_client.get(events_url)).json()["items"]
+
+        # The grown export: one row changed, one repeat and one new row
+        second = [
+            "2025-01-15,a.txt,1",
+            "2025-01-15,a.txt,1",
+            "2025-01-16,b.txt,5",
+            "2025-01-15,a.txt,1",
+            "2025-01-17,c.txt,3",
+        ]
+        data = await self._import(authenticated_client, case.id, second)
+        assert (data["created_count"], data["updated_count"], data["unchanged_count"]) == (2, 1, 2)
+
+        events = (await authenticated_client.get(events_url)).json()["items"]
+        assert [(e["event_date"], e["file_name"], e["file_count"]) for e in events] == [
+            ("2025-01-15", "a.txt", 1),
+            ("2025-01-15", "a.txt", 1),
+            ("2025-01-15", "a.txt", 1),
+            ("2025-01-16", "b.txt", 5),
+            ("2025-01-17", "c.txt", 3),
+        ]
+        updated = next(e for e in events if e["file_name"] == "b.txt")
+        original = next(e for e in before if e["file_name"] == "b.txt")
+        assert updated["id"] == original["id"]
+        assert updated["sort_order"] == original["sort_order"]
+
+        # Importing the same file again changes nothing
+        data = await self._import(authenticated_client, case.id, second)
+        assert (data["created_count"], data["updated_count"], data["unchanged_count"]) == (0, 0, 5)
+        assert len((await authenticated_client.get(events_url)).json()["items"]) == 5
+
+    async def test_other_log_keeps_its_rows(
+        self, authenticated_client, db_session, test_user
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        data = await self._import(
+            authenticated_client, case.id, ["2025-01-15,a.txt,1"], "usb.csv"
+        )
+        assert data["created_count"] == 1
+        # A different log with a row at the same date and file name
+        data = await self._import(
+            authenticated_client, case.id, ["2025-01-15,a.txt,7"], "share.csv"
+        )
+        assert (data["created_count"], data["updated_count"]) == (1, 0)
+
+        events = (
+            await authenticated_client.get(f"/cases/{case.id}/events/")
+        ).json()["items"]
+        assert sorted(e["file_count"] for e in events) == [1, 7]
+
+        # Re-importing either log still matches its own rows
+        data = await self._import(
+            authenticated_client, case.id, ["2025-01-15,a.txt,1"], "usb.csv"
+        )
+        assert (data["created_count"], data["unchanged_count"]) == (0, 1)
+
+
+class TestChunkedUpload:
+    async def _create(self, client, case_id, data: bytes, filename="log.csv") -> dict:
+        response = await client.post(
+            f"/cases/{case_id}/imports/uploads",
+            json={"filename": filename, "size": len(data)},
+        )
+        assert response.status_code == 201
+        return response.json()
+
+    async def _put(self, client, case_id, upload: dict, index: int, data: bytes, checksum=None):
+        size = upload["chunk_size"]
+        chunk = data[index * size : (index + 1) * size]
+        return await client.put(
+            f"/cases/{case_id}/imports/uploads/{upload['upload_id']}/chunks/{index}",
+            content=chunk,
+            headers={"X-Chunk-SHA256": checksum or hashlib.sha256(chunk).hexdigest()},
+        )
+
+    async def test_upload_swept_between_chunks(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(imports_router.settings, "IMPORT_UPLOAD_CHUNK_BYTES", 16)
+        data = _make_csv_bytes("Date\n2025-01-15\n2025-01-16\n")
+        upload = await self._create(authenticated_client, case.id, data)
+        upload_id = upload["upload_id"]
+
+        # The session passes its load, then its directory goes
+        meta = import_staging.load(upload_id)
+        import_staging.delete(upload_id)
+        monkeypatch.setattr(import_staging, "load", lambda session_id: meta)
+
+        response = await self._put(authenticated_client, case.id, upload, 0, data)
+        assert response.status_code == 404
+        assert response.json()["detail"].startswith("Upload session not found")
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/uploads/{upload_id}/complete"
+        )
+        assert response.status_code == 404
+
+    async def test_complete_while_assembling(
+        self, authenticated_client, db_session, test_user, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(imports_router.settings, "IMPORT_UPLOAD_CHUNK_BYTES", 16)
+        monkeypatch.setattr(imports_router.settings, "IMPORT_MAX_CONCURRENT_PER_USER", 2)
+        data = _make_csv_bytes("Date\n2025-01-15\n2025-01-16\n")
+        upload = await self._create(authenticated_client, case.id, data)
+        for index in range(upload["chunk_count"]):
+            await self._put(authenticated_client, case.id, upload, index, data)
+
+        # Hold the first complete inside the assembly
+        assembling, release = threading.Event(), threading.Event()
+        assemble_upload = imports_router._assemble_upload
+
+        def slow_assemble(*args):
+            assembling.set()
+            release.wait(5)
+            return assemble_upload(*args)
+
+        monkeypatch.setattr(imports_router, "_assemble_upload", slow_assemble)
+        complete_url = (
+            f"/cases/{case.id}/imports/uploads/{upload['upload_id']}/complete"
+        )
+        first = asyncio.create_task(authenticated_client.post(complete_url))
+        loop = asyncio.get_running_loop()
+        assert await loop.run_in_executor(None, assembling.wait, 5)
+        try:
+            second = await authenticated_client.post(complete_url)
+            assert second.status_code == 409
+            put = await self._put(authenticated_client, case.id, upload, 0, data)
+            assert put.status_code == 409
+        finally:
+            release.set()
+        response = await first
+        assert response.status_code == 200
+        assert response.json()["row_count"] == 2
+
+    async def test_chunks_in_any_order(
+        self, authenticated_client, db_session, test_user, import_staging, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(imports_router.settings, "IMPORT_UPLOAD_CHUNK_BYTES", 16)
+        lines = [f"2025-01-{i + 1:02d},file{i}.txt" for i in range(20)]
+        data = _make_csv_bytes("Date,File\n" + "\n".join(lines))
+        upload = await self._create(authenticated_client, case.id, data)
+        assert upload["chunk_size"] == 16
+        assert upload["chunk_count"] == -(-len(data) // 16)
+        assert upload["received_chunks"] == []
+
+        indices = list(range(upload["chunk_count"]))
+        for index in reversed(indices[1:]):
+            response = await self._put(authenticated_client, case.id, upload, index, data)
+            assert response.status_code == 200
+
+        # Resume: the server reports what it already has
+        upload_url = f"/cases/{case.id}/imports/uploads/{upload['upload_id']}"
+        response = await authenticated_client.get(upload_url)
+        assert response.json()["received_chunks"] == indices[1:]
+        await self._put(authenticated_client, case.id, upload, 0, data)
+
+        response = await authenticated_client.post(f"{upload_url}/complete")
+        assert response.status_code == 200
+        result = response.json()
+        assert result["session_id"] == upload["upload_id"]
+        assert result["headers"] == ["Date", "File"]
+        assert result["preview_rows"] == [line.split(",") for line in lines[:10]]
+
+        session_id = result["session_id"]
+        assert import_staging.load(session_id)["row_count"] == 20
+        # The parts and the assembled file are gone
+        assert sorted(p.name for p in (import_staging.root / session_id).iterdir()) == [
+            ".lock",
+            "meta.json",
+            "rows-00000.jsonl",
+        ]
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/validate",
+            json={"session_id": session_id, "mappings": {"Date": "event_date"}},
+        )
+        assert response.json()["valid_count"] == 20
+
+    async def test_bad_chunks_rejected(
+        self, authenticated_client, db_session, test_user, monkeypatch
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        monkeypatch.setattr(imports_router.settings, "IMPORT_UPLOAD_CHUNK_BYTES", 16)
+        data = _make_csv_bytes("Date,Type\n2025-01-15,note\n2025-01-16,note\n")
+        upload = await self._create(authenticated_client, case.id, data)
+
+        response = await self._put(
+            authenticated_client, case.id, upload, 0, data, checksum="0" * 64
+        )
+        assert response.status_code == 400
+        assert "checksum" in response.json()["detail"]
+
+        upload_url = f"/cases/{case.id}/imports/uploads/{upload['upload_id']}"
+        response = await authenticated_client.put(
+            f"{upload_url}/chunks/0",
+            content=data[:10],
+            headers={"X-Chunk-SHA256": hashlib.sha256(data[:10]).hexdigest()},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Chunk 0 must be 16 bytes"
+
+        response = await self._put(
+            authenticated_client, case.id, upload, upload["chunk_count"], data
+        )
+        assert response.status_code == 400
+
+        await self._put(authenticated_client, case.id, upload, 1, data)
+        response = await authenticated_client.post(f"{upload_url}/complete")
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Upload is missing chunks: 0, 2")
+
+        # An incomplete upload can't be validated yet
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/validate",
+            json={"session_id": upload["upload_id"], "mappings": {"Date": "event_date"}},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Upload is not complete."
+
+    async def test_create_checks_file(self, authenticated_client, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/uploads",
+            json={"filename": "evidence.pdf", "size": 100},
+        )
+        assert response.status_code == 400
+
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/uploads",
+            json={"filename": "log.csv", "size": imports_router.MAX_UPLOAD_SIZE + 1},
+        )
+        assert response.status_code == 413
+
+    async def test_unparseable_upload_discarded(
+        self, authenticated_client, db_session, test_user, import_staging
+    ):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.commit()
+
+        data = b"not a workbook"
+        upload = await self._create(authenticated_client, case.id, data, "log.xlsx")
+        await self._put(authenticated_client, case.id, upload, 0, data)
+        response = await authenticated_client.post(
+            f"/cases/{case.id}/imports/uploads/{upload['upload_id']}/complete"
+        )
+        assert response.status_code == 400
+        assert import_staging.load(upload["upload_id"]) is None
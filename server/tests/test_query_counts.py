@@ -0,0 +1,458 @@
+"""Exact SQL statement counts per router endpoint.
+
+Relationships are ``lazy="raise"``, so every query an endpoint issues is
+requested explicitly. These tests pin those counts so a new eager load
+(or an accidental N+1) shows up as a failing assertion.
+"""
+
+import io
+from datetime import date
+from types import SimpleNamespace
+
+import openpyxl
+import pytest_asyncio
+
+from src.services import import_staging as staging_module
+from tests.factories import (
+    make_audit_type,
+    make_case,
+    make_event,
+    make_file_batch,
+    make_user,
+)
+
+
+@pytest_asyncio.fixture
+async def timeline(db_session, test_user):
+    """Seed a case with an assignee, two events and a file batch each."""
+    at = make_audit_type()
+    assignee = make_user()
+    db_session.add_all([at, assignee])
+    await db_session.flush()
+    case = make_case(at.id, test_user.id, assigned_to_id=assignee.id)
+    db_session.add(case)
+    await db_session.flush()
+    events = [
+        make_event(case.id, test_user.id, sort_order=0),
+        make_event(case.id, test_user.id, sort_order=1, event_type="finding"),
+    ]
+    db_session.add_all(events)
+    await db_session.flush()
+    batches = [make_file_batch(e.id) for e in events]
+    db_session.add_all(batches)
+    await db_session.commit()
+
+    # Start each request from an empty identity map, like production
+    db_session.expunge_all()
+    return SimpleNamespace(
+        audit_type=at, case=case, events=events, batches=batches
+    )
+
+
+async def _count(query_counter, request):
+    query_counter.reset()
+    response = await request
+    return response, query_counter.count
+
+
+class TestReferenceDataQueryCounts:
+    async def test_list_audit_types(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter, authenticated_client.get("/audit-types/")
+        )
+        assert response.status_code == 200
+        # fingerprint, audit types
+        assert count == 2
+
+    async def test_get_audit_type(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.get(f"/audit-types/{timeline.audit_type.id}"),
+        )
+        assert response.status_code == 200
+        assert count == 1
+
+    async def test_list_users(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter, authenticated_client.get("/users/")
+        )
+        assert response.status_code == 200
+        # fingerprint, users
+        assert count == 2
+
+    async def test_get_jira_mappings(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.get(f"/jira/mappings/{timeline.audit_type.id}"),
+        )
+        assert response.status_code == 200
+        assert count == 1
+
+
+class TestCaseQueryCounts:
+    async def test_list_cases(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter, authenticated_client.get("/cases/")
+        )
+        assert response.status_code == 200
+        # count, cases, audit types, assignees, creators
+        assert count == 5
+
+    async def test_get_case(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter, authenticated_client.get(f"/cases/{timeline.case.id}")
+        )
+        assert response.status_code == 200
+        # fingerprint, case, audit type, assignee, creator
+        assert count == 5
+
+    async def test_update_case(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.patch(
+                f"/cases/{timeline.case.id}", json={"title": "Renamed"}
+            ),
+        )
+        assert response.status_code == 200
+        # load, update, reload with relationships
+        assert count == 9
+
+    async def test_delete_case(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter, authenticated_client.delete(f"/cases/{timeline.case.id}")
+        )
+        assert response.status_code == 204
+        assert count == 2
+
+
+class TestNotModifiedQueryCounts:
+    """A matching If-None-Match is answered from the fingerprint alone."""
+
+    async def _revalidate(self, client, query_counter, url):
+        etag = (await client.get(url)).headers["ETag"]
+        response, count = await _count(
+            query_counter, client.get(url, headers={"If-None-Match": etag})
+        )
+        assert response.status_code == 304
+        return count
+
+    async def test_reference_data(self, authenticated_client, timeline, query_counter):
+        for url in ("/audit-types/", "/users/"):
+            assert await self._revalidate(authenticated_client, query_counter, url) == 1
+
+    async def test_get_case(self, authenticated_client, timeline, query_counter):
+        url = f"/cases/{timeline.case.id}"
+        assert await self._revalidate(authenticated_client, query_counter, url) == 1
+
+    async def test_list_events(self, authenticated_client, timeline, query_counter):
+        url = f"/cases/{timeline.case.id}/events/"
+        assert await self._revalidate(authenticated_client, query_counter, url) == 1
+
+    async def test_list_batches(self, authenticated_client, timeline, query_counter):
+        event = timeline.events[0]
+        url = f"/cases/{timeline.case.id}/events/{event.id}/batches/"
+        assert await self._revalidate(authenticated_client, query_counter, url) == 1
+
+
+class TestEventQueryCounts:
+    async def test_list_events(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.get(f"/cases/{timeline.case.id}/events/"),
+        )
+        assert response.status_code == 200
+        # case check, type counts, events with batch totals, creators
+        assert count == 4
+
+    async def test_list_events_with_batches(
+        self, authenticated_client, timeline, query_counter
+    ):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.get(
+                f"/cases/{timeline.case.id}/events/", params={"include": "batches"}
+            ),
+        )
+        assert response.status_code == 200
+        # The expansion adds exactly one batch query
+        assert count == 5
+
+    async def test_get_event(self, authenticated_client, timeline, query_counter):
+        event = timeline.events[0]
+        response, count = await _count(
+            query_counter,
+            authenticated_client.get(f"/cases/{timeline.case.id}/events/{event.id}"),
+        )
+        assert response.status_code == 200
+        assert count == 3
+
+    async def test_create_event(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.post(
+                f"/cases/{timeline.case.id}/events/",
+                json={"event_type": "note", "event_date": "2025-02-01"},
+            ),
+        )
+        assert response.status_code == 201
+        # version bump (also the case check), sort_order reservation,
+        # insert, case rollups, reload with relationships
+        assert count == 6
+
+    async def test_update_event(self, authenticated_client, timeline, query_counter):
+        event = timeline.events[0]
+        response, count = await _count(
+            query_counter,
+            authenticated_client.patch(
+                f"/cases/{timeline.case.id}/events/{event.id}",
+                json={"file_name": "renamed.pdf"},
+            ),
+        )
+        assert response.status_code == 200
+        # case check, load, update, reload with relationships
+        assert count == 5
+
+    async def test_batch_events(self, authenticated_client, timeline, query_counter):
+        first, second = timeline.events
+        creates = [
+            {"op": "create", "data": {"event_date": f"2025-03-{day:02d}"}}
+            for day in range(1, 21)
+        ]
+        response, count = await _count(
+            query_counter,
+            authenticated_client.post(
+                f"/cases/{timeline.case.id}/events:batch",
+                json={
+                    "operations": creates + [
+                        {"op": "update", "id": str(first.id), "data": {"file_name": "x.pdf"}},
+                        {"op": "delete", "id": str(second.id)},
+                    ]
+                },
+            ),
+        )
+        assert response.status_code == 200
+        assert len(response.json()["created"]) == 20
+        # version bump, id check, sort_order reservation, insert, update,
+        # delete, tombstones, case rollups, reload with relationships --
+        # independent of the batch size
+        assert count == 10
+
+    async def test_delete_event(self, authenticated_client, timeline, query_counter):
+        event = timeline.events[0]
+        response, count = await _count(
+            query_counter,
+            authenticated_client.delete(f"/cases/{timeline.case.id}/events/{event.id}"),
+        )
+        assert response.status_code == 204
+        # version bump, load, tombstone, delete (batches go via ON DELETE
+        # CASCADE), case rollups
+        assert count == 5
+
+
+class TestFileBatchQueryCounts:
+    def _url(self, timeline, suffix=""):
+        event = timeline.events[0]
+        return f"/cases/{timeline.case.id}/events/{event.id}/batches/{suffix}"
+
+    async def test_list_batches(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter, authenticated_client.get(self._url(timeline))
+        )
+        assert response.status_code == 200
+        assert count == 2
+
+    async def test_create_batch(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.post(
+                self._url(timeline), json={"label": "New", "file_count": 2}
+            ),
+        )
+        assert response.status_code == 201
+        # event check, version bump, event stamp, insert, event and case
+        # rollups, refresh
+        assert count == 7
+
+    async def test_update_batch(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.patch(
+                self._url(timeline, timeline.batches[0].id), json={"file_count": 9}
+            ),
+        )
+        assert response.status_code == 200
+        # event check, load, version bump, event stamp, update, event and
+        # case rollups, refresh
+        assert count == 8
+
+    async def test_delete_batch(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.delete(self._url(timeline, timeline.batches[0].id)),
+        )
+        assert response.status_code == 204
+        assert count == 7
+
+    async def test_replace_batches(self, authenticated_client, timeline, query_counter):
+        kept = timeline.batches[0]
+        batches = [
+            {"id": str(kept.id), "label": "Renamed", "file_count": kept.file_count},
+            *({"label": f"New {i}", "file_count": i} for i in range(20)),
+        ]
+        response, count = await _count(
+            query_counter,
+            authenticated_client.put(self._url(timeline), json={"batches": batches}),
+        )
+        assert response.status_code == 200
+        assert len(response.json()) == 21
+        # event check, current rows, update, insert, version bump, event
+        # stamp, event and case rollups, reload -- independent of the
+        # number of batches
+        assert count == 9
+
+
+class TestReportQueryCounts:
+    async def test_generate_docx(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.get(
+                f"/cases/{timeline.case.id}/reports/generate",
+                params={"format": "docx"},
+            ),
+        )
+        assert response.status_code == 200
+        # case, audit type, assignee, creator, events, event creators, batches
+        assert count == 7
+
+    async def test_html_report(self, authenticated_client, timeline, query_counter):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.get(f"/cases/{timeline.case.id}/reports/html"),
+        )
+        assert response.status_code == 200
+        # As the PDF report, plus the activity histogram
+        assert count == 8
+
+
+class TestImportQueryCounts:
+    async def test_import_flow(self, authenticated_client, timeline, query_counter):
+        base = f"/cases/{timeline.case.id}/imports"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        for row in [["Date", "Type"], ["2025-01-15", "finding"], ["2025-01-16", "note"]]:
+            ws.append(row)
+        buf = io.BytesIO()
+        wb.save(buf)
+
+        response, count = await _count(
+            query_counter,
+            authenticated_client.post(
+                f"{base}/upload",
+                files={"file": ("log.xlsx", buf.getvalue(), "application/octet-stream")},
+            ),
+        )
+        assert response.status_code == 200
+        assert count == 1
+        session_id = response.json()["session_id"]
+
+        response, count = await _count(
+            query_counter,
+            authenticated_client.post(
+                f"{base}/validate",
+                json={"session_id": session_id, "mappings": {"Date": "event_date", "Type": "event_type"}},
+            ),
+        )
+        assert response.status_code == 200
+        assert count == 1
+
+        response, count = await _count(
+            query_counter,
+            authenticated_client.post(f"{base}/confirm", json={"session_id": session_id}),
+        )
+        assert response.status_code == 200
+        # case check, version bump, sort_order reservation, a fingerprint
+        # lookup and one multi-row upsert, case rollups
+        assert count == 6
+
+    async def test_confirm_inserts_one_statement_per_chunk(
+        self, authenticated_client, timeline, query_counter, monkeypatch
+    ):
+        monkeypatch.setattr(staging_module, "ROW_CHUNK_SIZE", 50)
+        base = f"/cases/{timeline.case.id}/imports"
+        csv_data = "Date,Type\n" + "2025-02-01,note\n" * 120
+        response = await authenticated_client.post(
+            f"{base}/upload", files={"file": ("log.csv", csv_data.encode(), "text/csv")}
+        )
+        session_id = response.json()["session_id"]
+        await authenticated_client.post(
+            f"{base}/validate",
+            json={"session_id": session_id, "mappings": {"Date": "event_date"}},
+        )
+
+        response, count = await _count(
+            query_counter,
+            authenticated_client.post(f"{base}/confirm", json={"session_id": session_id}),
+        )
+        assert response.status_code == 200
+        assert response.json()["created_count"] == 120
+        # As above, with a lookup and an executemany per staged chunk of 50 rows
+        assert count == 4 + 3 * 2
+
+
+class TestMoveQueryCounts:
+    async def _seed_slot(self, db_session, case, user_id, day, keys):
+        events = [
+            make_event(case.id, user_id, event_date=date(2025, 6, day), sort_order=key)
+            for key in keys
+        ]
+        db_session.add_all(events)
+        await db_session.commit()
+        db_session.expunge_all()
+        return events
+
+    async def _move(self, authenticated_client, query_counter, case, event, anchor):
+        response, count = await _count(
+            query_counter,
+            authenticated_client.post(
+                f"/cases/{case.id}/events/{event.id}/move",
+                json={"after_id": str(anchor.id)},
+            ),
+        )
+        assert response.status_code == 200
+        return count
+
+    async def test_move_is_independent_of_timeline_size(
+        self, authenticated_client, db_session, test_user, timeline, query_counter
+    ):
+        small = await self._seed_slot(
+            db_session, timeline.case, test_user.id, 1, [i * 1024 for i in range(3)]
+        )
+        small_count = await self._move(
+            authenticated_client, query_counter, timeline.case, small[-1], small[0]
+        )
+
+        large = await self._seed_slot(
+            db_session, timeline.case, test_user.id, 2,
+            [i * 1024 for i in range(500)],
+        )
+        large_count = await self._move(
+            authenticated_client, query_counter, timeline.case, large[-1], large[0]
+        )
+
+        # version bump, load both events, neighbour key, update one row,
+        # reload with relationships
+        assert small_count == large_count == 6
+
+    async def test_exhausted_gap_respreads_in_constant_statements(
+        self, authenticated_client, db_session, test_user, timeline, query_counter
+    ):
+        events = await self._seed_slot(
+            db_session, timeline.case, test_user.id, 3, list(range(500)),
+        )
+        count = await self._move(
+            authenticated_client, query_counter, timeline.case, events[-1], events[0]
+        )
+
+        # Respreading adds a slot read, one executemany, the anchor refresh
+        # and a second neighbour lookup -- still independent of slot size
+        assert count == 10
@@ -137,7 +137,8 @@ class TestEventRead:
             "updated_at": now,
         }
         event = EventRead.model_validate(data)
-        assert event.file_batches == []
+        assert event.file_batches is None
+        assert event.batch_count == 0
         assert event.metadata == {}
 
 
@@ -0,0 +1,61 @@
+"""Checks that timeline reads and searches are served by the events indexes."""
+
+import uuid
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from src.models.event import Event, TimelineSearch, timeline_order
+
+
+async def _query_plan(db_session, query) -> str:
+    """Return SQLite's EXPLAIN QUERY PLAN output for a select."""
+    conn = await db_session.connection()
+    compiled = query.compile(conn.sync_connection)
+    # The plan doesn't depend on parameter values, only on their presence
+    params = tuple(None for _ in compiled.positiontup)
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+    return " | ".join(row[-1] for row in result.all())
+
+
+class TestTimelineIndex:
+    async def test_case_timeline_uses_index(self, db_session):
+        plan = await _query_plan(
+            db_session,
+            select(Event)
+            .where(Event.case_id == uuid.uuid4())
+            .order_by(*timeline_order()),
+        )
+        assert "USING INDEX ix_events_case_timeline (case_id=?)" in plan
+
+    async def test_date_window_uses_index_range(self, db_session):
+        plan = await _query_plan(
+            db_session,
+            select(Event)
+            .where(
+                Event.case_id == uuid.uuid4(),
+                Event.event_date >= date(2025, 1, 1),
+                Event.event_date <= date(2025, 1, 31),
+            )
+            .order_by(*timeline_order()),
+        )
+        assert "ix_events_case_timeline (case_id=? AND event_date>? AND event_date<?)" in plan
+
+
+class TestSearchIndex:
+    def test_search_matches_index_expression(self):
+        """The planner only uses ix_events_search for the same expression."""
+        index = next(i for i in Event.__table__.indexes if i.name == "ix_events_search")
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        assert ddl.endswith(" gin_trgm_ops)")
+        indexed = ddl[ddl.index("(lower") + 1 : -len(" gin_trgm_ops)")]
+
+        query = str(
+            select(Event.id)
+            .where(TimelineSearch("invoice 2025"))
+            .compile(dialect=postgresql.dialect())
+        )
+        document = indexed.replace("(file_", "(events.file_")
+        assert query.count(f"{document} LIKE lower(") == 2
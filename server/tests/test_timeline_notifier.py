@@ -0,0 +1,102 @@
+"""Tests for timeline change fan-out and the SSE stream."""
+
+import json
+import uuid
+
+import pytest
+
+from src.routers import events as events_router
+from src.services.timeline_notifier import TimelineBroadcaster, _asyncpg_dsn
+
+
+@pytest.fixture
+def broadcaster(monkeypatch):
+    """A broadcaster that never opens a LISTEN connection."""
+    instance = TimelineBroadcaster("postgresql+asyncpg://u:p@db:5432/app", queue_size=2)
+
+    async def listening() -> None:
+        return None
+
+    monkeypatch.setattr(instance, "_ensure_listening", listening)
+    monkeypatch.setattr(events_router, "broadcaster", instance)
+    return instance
+
+
+def _notify(broadcaster, payload) -> None:
+    broadcaster._on_notify(None, 0, "timeline_changes", json.dumps(payload))
+
+
+class TestTimelineBroadcaster:
+    def test_asyncpg_dsn(self):
+        assert _asyncpg_dsn("postgresql+asyncpg://u:p@db:5432/app") == (
+            "postgresql://u:p@db:5432/app"
+        )
+
+    async def test_fans_out_to_case_subscribers_only(self, broadcaster):
+        case_a, case_b = uuid.uuid4(), uuid.uuid4()
+        async with broadcaster.subscribe(case_a) as q1, \
+                broadcaster.subscribe(case_a) as q2, \
+                broadcaster.subscribe(case_b) as q3:
+            _notify(broadcaster, {"case_id": str(case_a), "version": 4})
+
+            assert q1.get_nowait() == {"case_id": str(case_a), "version": 4}
+            assert q2.get_nowait() == {"case_id": str(case_a), "version": 4}
+            assert q3.empty()
+
+    async def test_slow_subscriber_keeps_newest(self, broadcaster):
+        case_id = uuid.uuid4()
+        async with broadcaster.subscribe(case_id) as queue:
+            for version in range(1, 6):
+                _notify(broadcaster, {"case_id": str(case_id), "version": version})
+
+            assert queue.qsize() == 2
+            assert [queue.get_nowait()["version"] for _ in range(2)] == [4, 5]
+
+    async def test_unsubscribe_cleans_up(self, broadcaster):
+        case_id = uuid.uuid4()
+        async with broadcaster.subscribe(case_id):
+            assert broadcaster.subscriber_count == 1
+        assert broadcaster.subscriber_count == 0
+        assert case_id not in broadcaster._subscribers
+
+    async def test_malformed_payload_is_ignored(self, broadcaster):
+        case_id = uuid.uuid4()
+        async with broadcaster.subscribe(case_id) as queue:
+            broadcaster._on_notify(None, 0, "timeline_changes", "not json")
+            _notify(broadcaster, {"version": 1})
+            assert queue.empty()
+
+
+class TestTimelineStream:
+    async def test_stream_messages(self, broadcaster, monkeypatch):
+        monkeypatch.setattr(events_router, "STREAM_KEEPALIVE_SECONDS", 0.01)
+        case_id = uuid.uuid4()
+        stream = events_router._timeline_stream(case_id, 3)
+
+        assert await anext(stream) == 'event: version\ndata: {"version": 3}\n\n'
+        assert await anext(stream) == ": keepalive\n\n"
+
+        _notify(broadcaster, {"case_id": str(case_id), "version": 4})
+        message = await anext(stream)
+        assert message.startswith("event: change\n")
+        assert '"version": 4' in message
+
+        await stream.aclose()
+        assert broadcaster.subscriber_count == 0
+
+    async def test_stream_ends_when_case_deleted(self, broadcaster):
+        case_id = uuid.uuid4()
+        stream = events_router._timeline_stream(case_id, 1)
+        await anext(stream)
+
+        _notify(broadcaster, {"case_id": str(case_id), "deleted": True})
+        assert (await anext(stream)).startswith("event: deleted\n")
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+        assert broadcaster.subscriber_count == 0
+
+    async def test_stream_unknown_case(self, authenticated_client):
+        response = await authenticated_client.get(
+            f"/cases/{uuid.uuid4()}/events/stream"
+        )
+        assert response.status_code == 404
@@ -0,0 +1,263 @@
+"""Tests for event and case timeline rollups."""
+
+from datetime import date
+
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.deps import get_db
+from src.main import app
+from src.models.case import Case
+from src.services.timeline_rollups import repair_rollups
+from tests.conftest import engine
+from tests.factories import make_audit_type, make_case, make_event, make_file_batch
+
+
+async def _seed_case(db_session, test_user):
+    at = make_audit_type()
+    db_session.add(at)
+    await db_session.flush()
+    case = make_case(at.id, test_user.id)
+    db_session.add(case)
+    await db_session.commit()
+    return case
+
+
+async def _case(client, case_id) -> dict:
+    response = await client.get(f"/cases/{case_id}")
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestWritePathRollups:
+    async def test_event_writes(self, authenticated_client, db_session, test_user):
+        case = await _seed_case(db_session, test_user)
+        base = f"/cases/{case.id}/events"
+
+        first = (await authenticated_client.post(f"{base}/", json={
+            "event_type": "finding", "event_date": "2025-03-10", "file_count": 4,
+        })).json()
+        await authenticated_client.post(f"{base}:batch", json={"operations": [
+            {"op": "create", "data": {"event_date": "2025-01-02"}},
+            {"op": "create", "data": {"event_type": "action", "event_date": "2025-05-20"}},
+        ]})
+
+        data = await _case(authenticated_client, case.id)
+        assert (data["event_count"], data["finding_count"], data["action_count"],
+                data["note_count"]) == (3, 1, 1, 1)
+        assert data["file_total"] == 4
+        assert (data["first_event_date"], data["last_event_date"]) == (
+            "2025-01-02", "2025-05-20"
+        )
+
+        await authenticated_client.patch(
+            f"{base}/{first['id']}", json={"event_type": "note", "file_count": 6}
+        )
+        data = await _case(authenticated_client, case.id)
+        assert (data["finding_count"], data["note_count"], data["file_total"]) == (0, 2, 6)
+
+        await authenticated_client.delete(f"{base}/{first['id']}")
+        data = await _case(authenticated_client, case.id)
+        assert (data["event_count"], data["file_total"]) == (2, 0)
+
+    async def test_batch_writes(self, authenticated_client, db_session, test_user):
+        case = await _seed_case(db_session, test_user)
+        event = (await authenticated_client.post(
+            f"/cases/{case.id}/events/", json={"event_date": "2025-03-10", "file_count": 1}
+        )).json()
+        url = f"/cases/{case.id}/events/{event['id']}"
+
+        batch = (await authenticated_client.post(
+            f"{url}/batches/", json={"label": "Scans", "file_count": 10}
+        )).json()
+        await authenticated_client.post(
+            f"{url}/batches/", json={"label": "Mail", "file_count": 5}
+        )
+        await authenticated_client.patch(
+            f"{url}/batches/{batch['id']}", json={"file_count": 20}
+        )
+
+        data = (await authenticated_client.get(url)).json()
+        assert (data["batch_count"], data["batch_file_total"]) == (2, 25)
+        data = await _case(authenticated_client, case.id)
+        assert (data["batch_count"], data["file_total"]) == (2, 26)
+
+        await authenticated_client.delete(f"{url}/batches/{batch['id']}")
+        data = await _case(authenticated_client, case.id)
+        assert (data["batch_count"], data["file_total"]) == (1, 6)
+
+    async def test_date_bounds(self, authenticated_client, db_session, test_user):
+        case = await _seed_case(db_session, test_user)
+        base = f"/cases/{case.id}/events"
+
+        async def create(event_date):
+            response = await authenticated_client.post(
+                f"{base}/", json={"event_date": event_date}
+            )
+            return response.json()["id"]
+
+        first = await create("2025-03-10")
+        middle = await create("2025-04-01")
+        last = await create("2025-05-20")
+        # A second event on the first date keeps it when the first goes
+        await create("2025-03-10")
+
+        async def bounds():
+            data = await _case(authenticated_client, case.id)
+            return data["first_event_date"], data["last_event_date"]
+
+        assert await bounds() == ("2025-03-10", "2025-05-20")
+        await authenticated_client.delete(f"{base}/{first}")
+        assert await bounds() == ("2025-03-10", "2025-05-20")
+
+        # Moving the last event inward looks the bound up again
+        await authenticated_client.patch(f"{base}/{last}", json={"event_date": "2025-03-15"})
+        assert await bounds() == ("2025-03-10", "2025-04-01")
+        # Moving one outward extends the range
+        await authenticated_client.patch(f"{base}/{middle}", json={"event_date": "2025-02-01"})
+        assert await bounds() == ("2025-02-01", "2025-03-15")
+
+        response = await authenticated_client.post(f"{base}:batch", json={"operations": [
+            {"op": "delete", "id": middle},
+            {"op": "update", "id": last, "data": {"event_date": "2025-06-30"}},
+            {"op": "create", "data": {"event_date": "2025-01-05"}},
+        ]})
+        assert response.status_code == 200
+        assert await bounds() == ("2025-01-05", "2025-06-30")
+
+        events = (await authenticated_client.get(f"{base}/")).json()["items"]
+        for event in events:
+            await authenticated_client.delete(f"{base}/{event['id']}")
+        data = await _case(authenticated_client, case.id)
+        assert (data["event_count"], data["first_event_date"], data["last_event_date"]) == (
+            0, None, None
+        )
+
+    async def test_writes_apply_deltas(self, authenticated_client, db_session, test_user):
+        case = await _seed_case(db_session, test_user)
+        base = f"/cases/{case.id}/events"
+        event = (await authenticated_client.post(
+            f"{base}/", json={"event_date": "2025-03-10", "file_count": 2}
+        )).json()
+
+        # Writes adjust the stored totals rather than recounting the case,
+        # so drift survives them until a repair
+        await db_session.execute(
+            update(Case).where(Case.id == case.id).values(event_count=10, file_total=20)
+        )
+        await db_session.commit()
+        await authenticated_client.post(f"{base}/", json={"event_date": "2025-03-11"})
+        await authenticated_client.post(
+            f"{base}/{event['id']}/batches/", json={"label": "Scans", "file_count": 5}
+        )
+        data = await _case(authenticated_client, case.id)
+        assert (data["event_count"], data["file_total"]) == (11, 25)
+
+        assert await repair_rollups(db_session, case.id) is True
+        await db_session.commit()
+        data = await _case(authenticated_client, case.id)
+        assert (data["event_count"], data["file_total"]) == (2, 7)
+
+    async def test_case_etag_follows_timeline(self, authenticated_client, db_session, test_user):
+        case = await _seed_case(db_session, test_user)
+        etag = (await authenticated_client.get(f"/cases/{case.id}")).headers["etag"]
+
+        await authenticated_client.post(
+            f"/cases/{case.id}/events/", json={"event_date": "2025-03-10"}
+        )
+
+        response = await authenticated_client.get(
+            f"/cases/{case.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()["event_count"] == 1
+
+
+@pytest_asyncio.fixture
+async def no_autoflush_client(authenticated_client):
+    """The authenticated client on a session configured like production's.
+
+    The test session autoflushes, which hides writes the routers forget
+    to flush before refreshing rollups.
+    """
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+    async with session_factory() as session:
+
+        async def override_get_db():
+            yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        yield authenticated_client
+
+
+class TestWithoutAutoflush:
+    async def test_event_writes(self, no_autoflush_client, db_session, test_user):
+        case = await _seed_case(db_session, test_user)
+        base = f"/cases/{case.id}/events"
+
+        event = (await no_autoflush_client.post(f"{base}/", json={
+            "event_type": "finding", "event_date": "2025-03-10", "file_count": 4,
+        })).json()
+        data = await _case(no_autoflush_client, case.id)
+        assert (data["event_count"], data["finding_count"], data["file_total"]) == (1, 1, 4)
+
+        await no_autoflush_client.patch(
+            f"{base}/{event['id']}", json={"event_type": "note", "file_count": 6}
+        )
+        data = await _case(no_autoflush_client, case.id)
+        assert (data["finding_count"], data["note_count"], data["file_total"]) == (0, 1, 6)
+
+        await no_autoflush_client.delete(f"{base}/{event['id']}")
+        data = await _case(no_autoflush_client, case.id)
+        assert (data["event_count"], data["file_total"]) == (0, 0)
+
+    async def test_batch_writes(self, no_autoflush_client, db_session, test_user):
+        case = await _seed_case(db_session, test_user)
+        event = (await no_autoflush_client.post(
+            f"/cases/{case.id}/events/", json={"event_date": "2025-03-10"}
+        )).json()
+        url = f"/cases/{case.id}/events/{event['id']}"
+
+        batch = (await no_autoflush_client.post(
+            f"{url}/batches/", json={"label": "Scans", "file_count": 10}
+        )).json()
+        data = (await no_autoflush_client.get(url)).json()
+        assert (data["batch_count"], data["batch_file_total"]) == (1, 10)
+
+        await no_autoflush_client.patch(
+            f"{url}/batches/{batch['id']}", json={"file_count": 20}
+        )
+        data = await _case(no_autoflush_client, case.id)
+        assert (data["batch_count"], data["file_total"]) == (1, 20)
+
+        await no_autoflush_client.delete(f"{url}/batches/{batch['id']}")
+        data = await _case(no_autoflush_client, case.id)
+        assert (data["batch_count"], data["file_total"]) == (0, 0)
+
+
+class TestRepairRollups:
+    async def test_repairs_drifted_totals(self, db_session, test_user):
+        case = await _seed_case(db_session, test_user)
+        events = [
+            make_event(case.id, test_user.id, event_type="finding", file_count=2),
+            make_event(case.id, test_user.id, event_date=date(2025, 2, 1), sort_order=1),
+        ]
+        db_session.add_all(events)
+        await db_session.flush()
+        db_session.add(make_file_batch(events[1].id, file_count=7))
+        await db_session.commit()
+
+        assert await repair_rollups(db_session, case.id) is True
+        await db_session.commit()
+
+        result = await db_session.execute(
+            select(Case.event_count, Case.finding_count, Case.batch_count,
+                   Case.file_total, Case.last_event_date)
+            .where(Case.id == case.id)
+        )
+        assert result.one() == (2, 1, 1, 9, date(2025, 2, 1))
+        # A second pass finds nothing to fix
+        assert await repair_rollups(db_session, case.id) is False
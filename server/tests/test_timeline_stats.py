@@ -0,0 +1,45 @@
+"""Tests for SQL-side timeline aggregation."""
+
+from datetime import date
+
+from src.services.html_report import HtmlReportService
+from src.services.timeline_rollups import refresh_case_rollups
+from src.services.timeline_stats import choose_bucket
+from tests.factories import make_audit_type, make_case, make_event
+
+
+class TestChooseBucket:
+    def test_short_span_uses_days(self):
+        assert choose_bucket(date(2025, 1, 1), date(2025, 3, 1)) == "day"
+
+    def test_medium_span_uses_weeks(self):
+        assert choose_bucket(date(2025, 1, 1), date(2026, 1, 1)) == "week"
+
+    def test_long_span_uses_months(self):
+        assert choose_bucket(date(2020, 1, 1), date(2025, 1, 1)) == "month"
+
+    def test_no_events(self):
+        assert choose_bucket(None, None) == "day"
+
+
+class TestReportActivity:
+    async def test_long_case_charts_months(self, db_session, test_user):
+        at = make_audit_type()
+        db_session.add(at)
+        await db_session.flush()
+        case = make_case(at.id, test_user.id)
+        db_session.add(case)
+        await db_session.flush()
+        db_session.add_all([
+            make_event(case.id, test_user.id, event_date=date(2022, 5, 10)),
+            make_event(case.id, test_user.id, event_date=date(2022, 5, 20), sort_order=1),
+            make_event(case.id, test_user.id, event_date=date(2025, 1, 15), sort_order=2),
+        ])
+        await refresh_case_rollups(db_session, case.id)
+        await db_session.commit()
+
+        data = await HtmlReportService().collect_report_data(case.id, db_session)
+
+        stats = data["stats"]
+        assert stats.activity_bucket == "month"
+        assert stats.events_by_date == {"2022-05-01": 2, "2025-01-01": 1}